@@ -0,0 +1,350 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Benchmark suite for Turtle Graphics Implementation in Python
+
+This module measures the performance of the project: the time to import its core in a new interpreter, the Turtle's
+forward, circle and goto methods on their own, the recursive fractals of examples 4 and 5 at increasing depths, and
+rendering with draw_all_turtles and render_to_file on the non-interactive Agg backend, against the NumPy rasterizer.
+Every benchmark reports its median time, operations per second, line segments per second and peak memory, and the
+results can be saved as JSON and compared with an earlier run, e.g. the same suite run on the previous commit.
+
+Functions:
+    benchmark(name, params, quick_params=None): Registers a benchmark.
+    run_benchmark(name, param, repeats=5): Runs one benchmark with one parameter.
+    run_suite(pattern='', quick=False, repeats=5): Runs every registered benchmark whose name contains pattern.
+    compare(results, baseline): Gets the speed-up of every benchmark over a baseline run.
+    main(argv=None): The command-line entry point.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --quick --filter koch --compare results.json
+
+Note:
+    Times are the median of the repeats, and only the drawing or rendering is timed, not setting it up.
+    Peak memory is measured with tracemalloc in a separate, untimed run before the timed runs, so it covers the memory
+    allocated through Python (NumPy arrays included) but not matplotlib's own image buffers.
+    Everything runs offline and headless.
+
+Dependencies:
+    - argparse: Parses the command line.
+    - io: Collects the rendered images in memory.
+    - json: Writes and reads the results.
+    - platform: Describes the machine in the results.
+    - statistics: Computes the median times.
+    - os: Finds the root of the project to import it from.
+    - subprocess: Starts the interpreters whose imports are timed, and reads the current commit from git, if available.
+    - time: Measures the durations.
+    - tracemalloc: Measures the peak memory.
+    - matplotlib: Renders on the Agg backend.
+    - turtle_graphics: The code being measured.
+    - examples: The fractal workloads.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS = {}     #Name: (setup function, parameters, quick parameters)
+
+def benchmark(name: str, params: list, quick_params: list = None):
+    """Register a benchmark.
+    The decorated function takes one parameter, e.g. a depth, sets the workload up and returns a function that runs
+    it and returns (operations, segments): the number of operations done, and of line segments drawn.
+    Args:
+        name (str): The name of the benchmark.
+        params (list): The parameters it is run with.
+        quick_params (list): The parameters it is run with in quick mode. Defaults to the first parameter.
+    Returns:
+        The decorator.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, params, quick_params if quick_params is not None else params[:1])
+        return setup
+    return register
+
+
+@benchmark('import.core', [1, 5], [1])
+def import_core(count: int):
+    """Start count new interpreters that import the turtle, config and drawing modules, interpreter start-up included."""
+    command = [sys.executable, '-c', 'import turtle_graphics.config, turtle_graphics.turtle, turtle_graphics.drawing']
+
+    def run():
+        for _ in range(count):
+            subprocess.run(command, cwd=ROOT, check=True)
+        return count, 0
+    return run
+
+
+@benchmark('turtle.forward', [10_000, 100_000], [10_000])
+def forward(count: int):
+    """Move forward and turn left count times, in a small circle."""
+    from turtle_graphics.turtle import Turtle
+    turtle = Turtle()
+
+    def run():
+        for _ in range(count):
+            turtle.forward(0.01)
+            turtle.left(1)
+        return count, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('turtle.circle', [1_000, 10_000], [1_000])
+def circle(count: int):
+    """Draw count full circles with the default number of steps."""
+    from turtle_graphics.turtle import Turtle
+    turtle = Turtle()
+
+    def run():
+        for _ in range(count):
+            turtle.circle(50)
+        return count, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('turtle.goto', [10_000, 100_000], [10_000])
+def goto(count: int):
+    """Jump between the corners of a square count times, drawing every side."""
+    from turtle_graphics.turtle import Turtle
+    turtle = Turtle()
+    corners = [(50, 50), (-50, 50), (-50, -50), (50, -50)]
+
+    def run():
+        for i in range(count):
+            turtle.goto(*corners[i % 4])
+        return count, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('fractal.koch', [3, 4, 5, 6, 7], [3, 5])
+def koch(depth: int):
+    """Draw the Koch snowflake of example 4."""
+    from turtle_graphics.turtle import Turtle
+    from examples.example_4 import draw_koch_snowflake
+    turtle = Turtle()
+
+    def run():
+        draw_koch_snowflake(turtle, 100, depth)
+        segments = len(turtle.get_drawing_data())
+        return segments, segments
+    return run
+
+
+@benchmark('fractal.sierpinski', [3, 4, 5, 6, 7], [3, 5])
+def sierpinski(order: int):
+    """Draw the Sierpinski triangle of example 5."""
+    from turtle_graphics.turtle import Turtle
+    from examples.example_5 import draw_sierpinski
+    turtle = Turtle()
+
+    def run():
+        draw_sierpinski(turtle, order, 150)
+        segments = len(turtle.get_drawing_data())
+        return segments, segments
+    return run
+
+
+def _koch_turtle(depth: int):
+    """Get a turtle that has drawn the Koch snowflake of example 4, to render."""
+    from turtle_graphics.turtle import Turtle
+    from examples.example_4 import draw_koch_snowflake
+    turtle = Turtle()
+    draw_koch_snowflake(turtle, 100, depth)
+    return turtle
+
+
+@benchmark('render.draw_all_turtles', [3, 5, 7], [3])
+def render_pyplot(depth: int):
+    """Draw the Koch snowflake with draw_all_turtles on the Agg backend, where showing the figure does nothing."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from turtle_graphics.drawing import draw_all_turtles
+    turtle = _koch_turtle(depth)
+
+    def run():
+        draw_all_turtles("Benchmark", turtle)
+        plt.gcf().canvas.draw()     #Agg draws lazily, so the figure is drawn explicitly
+        plt.close('all')
+        return 1, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('render.png', [3, 5, 7], [3])
+def render_png(depth: int):
+    """Write the Koch snowflake to a PNG image in memory with render_to_file."""
+    from turtle_graphics.drawing import render_to_file
+    turtle = _koch_turtle(depth)
+
+    def run():
+        render_to_file(io.BytesIO(), "Benchmark", turtle, format='png')
+        return 1, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('render.raster', [3, 5, 7], [3])
+def render_raster(depth: int):
+    """Write the Koch snowflake to a PNG image in memory with the NumPy rasterizer, at the size of render.png."""
+    from turtle_graphics.raster import render_png as rasterize_png
+    turtle = _koch_turtle(depth)
+
+    def run():
+        rasterize_png(io.BytesIO(), turtle, width=640, height=480)
+        return 1, len(turtle.get_drawing_data())
+    return run
+
+
+@benchmark('render.svg', [3, 5, 7], [3])
+def render_svg(depth: int):
+    """Write the Koch snowflake to an SVG image in memory with render_to_file."""
+    from turtle_graphics.drawing import render_to_file
+    turtle = _koch_turtle(depth)
+
+    def run():
+        render_to_file(io.BytesIO(), "Benchmark", turtle, format='svg')
+        return 1, len(turtle.get_drawing_data())
+    return run
+
+
+def run_benchmark(name: str, param, repeats: int = 5) -> dict:
+    """Run one benchmark with one parameter.
+    Args:
+        name (str): The name of the benchmark.
+        param: The parameter to run it with.
+        repeats (int): The number of timed runs, each with a new setup.
+    Returns:
+        dict: The name, parameter and repeats, the 'median' and 'min' time in seconds, the 'operations' and
+            'segments' of a run, the 'ops_per_sec' and 'segments_per_sec' at the median time, and the
+            'peak_memory' in bytes.
+    Raises:
+        KeyError: If there is no benchmark with that name.
+    """
+    setup = BENCHMARKS[name][0]
+    # The memory run comes first, so it also warms up the imports and caches before the timed runs
+    tracemalloc.start()
+    try:
+        run = setup(param)
+        tracemalloc.reset_peak()
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    for _ in range(repeats):
+        run = setup(param)
+        start = time.perf_counter()
+        operations, segments = run()
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {'name': name, 'param': param, 'repeats': repeats, 'median': median, 'min': min(times),
+            'operations': operations, 'segments': segments,
+            'ops_per_sec': operations / median if median else None,
+            'segments_per_sec': segments / median if median else None,
+            'peak_memory': peak_memory}
+
+
+def _environment() -> dict:
+    """Describe the machine, the libraries and the commit the benchmarks ran on."""
+    environment = {'python': platform.python_version(), 'platform': platform.platform(),
+                   'time': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+    for module in ('numpy', 'matplotlib'):
+        try:
+            environment[module] = __import__(module).__version__
+        except ImportError:
+            environment[module] = None
+    try:
+        environment['commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                               text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        environment['commit'] = None
+    return environment
+
+
+def run_suite(pattern: str = '', quick: bool = False, repeats: int = 5, progress=None) -> dict:
+    """Run every registered benchmark whose name contains pattern, with all its parameters.
+    Args:
+        pattern (str): Only run the benchmarks whose name contains it.
+        quick (bool): Whether to use the quick parameters, for a fast check.
+        repeats (int): The number of timed runs of every benchmark.
+        progress: A function called with the result of every benchmark as soon as it is done, e.g. to print it.
+    Returns:
+        dict: The 'environment' the suite ran in and the 'results' of every benchmark.
+    """
+    results = []
+    for name, (_, params, quick_params) in BENCHMARKS.items():
+        if pattern not in name:
+            continue
+        for param in quick_params if quick else params:
+            result = run_benchmark(name, param, repeats)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {'environment': _environment(), 'results': results}
+
+
+def compare(results: dict, baseline: dict) -> dict:
+    """Get the speed-up of every benchmark over a baseline run.
+    Args:
+        results (dict): The results of a run, as returned by run_suite.
+        baseline (dict): The results of an earlier run.
+    Returns:
+        dict: (name, param): the baseline median time divided by the new one, for the benchmarks run in both.
+    """
+    before = {(result['name'], result['param']): result['median'] for result in baseline['results']}
+    return {(result['name'], result['param']): before[result['name'], result['param']] / result['median']
+            for result in results['results'] if (result['name'], result['param']) in before and result['median']}
+
+
+def _format(result: dict) -> str:
+    """Format the result of a benchmark as one line of the report."""
+    return (f"{result['name']:<26} {str(result['param']):>8} {result['median'] * 1000:10.2f} ms "
+            f"{result['ops_per_sec']:>14,.0f} ops/s {result['segments_per_sec']:>14,.0f} seg/s "
+            f"{result['peak_memory'] / 1024:>10,.0f} KiB")
+
+
+def main(argv: list[str] = None) -> int:
+    """Run the benchmark suite from the command line, printing one line per benchmark.
+    Args:
+        argv (list[str]): The command-line arguments. Defaults to sys.argv[1:].
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description="Benchmark the turtle graphics project.")
+    parser.add_argument('-f', '--filter', default='', help="only run the benchmarks whose name contains this text")
+    parser.add_argument('-q', '--quick', action='store_true', help="run fewer and smaller workloads")
+    parser.add_argument('-n', '--repeats', type=int, default=5, help="number of timed runs of every benchmark (default: 5)")
+    parser.add_argument('-o', '--output', help="write the results to this JSON file")
+    parser.add_argument('-c', '--compare', help="print the speed-up over the results in this JSON file")
+    options = parser.parse_args(argv)
+
+    print(f"{'benchmark':<26} {'param':>8} {'median':>13} {'throughput':>20} {'segments':>20} {'peak memory':>14}")
+    results = run_suite(options.filter, options.quick, options.repeats, lambda result: print(_format(result), flush=True))
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    if options.compare:
+        with open(options.compare, encoding='utf-8') as file:
+            speedups = compare(results, json.load(file))
+        for (name, param), speedup in speedups.items():
+            print(f"{name:<26} {str(param):>8} {speedup:8.2f}x {'faster' if speedup >= 1 else 'slower'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,24 @@
+# Import the Turtle class, the L-systems and the draw_all_turtles function
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.lsystem import KOCH_SNOWFLAKE, SIERPINSKI_TRIANGLE
+from turtle_graphics.drawing import draw_all_turtles
+
+def main():
+    # Create two new Turtle instances, one for each fractal
+    snowflake_turtle = Turtle(x=-185, y=40, init_angle=0)
+    sierpinski_turtle = Turtle(x=30, y=60, init_angle=0)
+
+    # Set up turtle properties (optional)
+    snowflake_turtle.set_pen_color('blue')
+    sierpinski_turtle.set_pen_color('purple')
+
+    # The L-systems expand their rules without recursion, so much deeper fractals than in examples 4 and 5 can be drawn
+    depth = 8
+    KOCH_SNOWFLAKE.draw(snowflake_turtle, depth, 130)
+    SIERPINSKI_TRIANGLE.draw(sierpinski_turtle, depth, 150)
+
+    # Display the paths of the turtles
+    draw_all_turtles("Koch Snowflake and Sierpinski Triangle L-systems", snowflake_turtle, sierpinski_turtle)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import io
+import unittest
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.animation import LiveScene
+from turtle_graphics.drawing import symbol_vertices
+
+def agg_figure():
+    """Create a figure with a non-interactive canvas that supports blitting."""
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure
+
+def drawn_segments(scene):
+    """Count the line segments in the line collections of a scene."""
+    return sum(len(line) - 1 for collection in scene.ax.collections if isinstance(collection, LineCollection)
+               for line in collection.get_segments())
+
+class TestLiveScene(unittest.TestCase):
+    """Tests for the incremental renderer."""
+
+    def setUp(self):
+        """Create a turtle with a square already drawn, and a scene showing it."""
+        self.turtle = Turtle()
+        for _ in range(4):
+            self.turtle.forward(50)
+            self.turtle.right(90)
+        self.scene = LiveScene("Live", self.turtle, figure=agg_figure())
+
+    def test_only_new_lines_are_drawn(self):
+        """Test that a frame creates artists for the new lines only, continuing the last polyline."""
+        self.assertTrue(self.scene.blit)
+        self.assertEqual(drawn_segments(self.scene), 4)
+        before = list(self.scene.ax.collections)
+        self.turtle.forward(20)
+        self.assertTrue(self.scene.update())
+        new_collections = [c for c in self.scene.ax.collections if c not in before]
+        self.assertEqual([len(line) for c in new_collections for line in c.get_segments()], [2])
+        np.testing.assert_allclose(new_collections[0].get_segments()[0], [[0, 0], [0, 20]], atol=1e-9)
+        self.assertEqual(drawn_segments(self.scene), 5)
+
+    def test_symbol_is_moved_in_place(self):
+        """Test that the turtle's symbol is updated rather than recreated."""
+        symbol = self.scene.ax.patches[0]
+        self.turtle.left(45)
+        self.turtle.forward(30)
+        self.scene.update()
+        self.assertEqual(list(self.scene.ax.patches), [symbol])
+        np.testing.assert_allclose(symbol.get_xy().mean(axis=0)[:2], (self.turtle.x, self.turtle.y), atol=2)
+
+    def test_layers_are_merged(self):
+        """Test that many frames keep few artists, with every line drawn once."""
+        for i in range(200):
+            self.turtle.set_pen_color('red' if i % 2 else 'blue')
+            self.turtle.left(7)
+            self.turtle.forward(1)
+            self.scene.update()
+        self.assertEqual(drawn_segments(self.scene), len(self.turtle.get_drawing_data()))
+        self.assertLessEqual(len(self.scene.ax.collections), 2 * 10)
+
+    def test_matches_drawing_at_once(self):
+        """Test that a scene drawn frame by frame looks like a scene drawn at once."""
+        for _ in range(30):
+            self.turtle.circle(10, 40)
+            self.turtle.forward(3)
+            self.scene.update()
+        animated = io.BytesIO()
+        self.scene.save(animated, format='rgba')
+        at_once = io.BytesIO()
+        LiveScene("Live", self.turtle, figure=agg_figure()).save(at_once, format='rgba')
+        difference = np.abs(np.frombuffer(animated.getvalue(), np.uint8).astype(int)
+                            - np.frombuffer(at_once.getvalue(), np.uint8))
+        self.assertLess(difference.mean(), 1)
+
+    def test_reset_redraws(self):
+        """Test that removing lines from the store removes them from the scene."""
+        self.turtle.reset()
+        self.turtle.forward(10)
+        self.scene.update()
+        self.assertEqual(drawn_segments(self.scene), 1)
+
+    def test_undo_then_redraw(self):
+        """Test that lines drawn after an undo replace the undone ones, even when the store is back to the same size."""
+        self.turtle.checkpoint()
+        self.turtle.forward(20)
+        self.scene.update()
+        self.turtle.undo()
+        self.turtle.left(90)
+        self.turtle.forward(20)
+        self.scene.update()
+        self.assertEqual(drawn_segments(self.scene), 5)
+        ends = [line[-1] for collection in self.scene.ax.collections if isinstance(collection, LineCollection)
+                for line in collection.get_segments()]
+        np.testing.assert_allclose(ends[-1], (self.turtle.x, self.turtle.y), atol=1e-9)
+
+    def test_spilled_lines_are_drawn(self):
+        """Test that lines spilled to disk between frames are still drawn, once each."""
+        turtle = Turtle(memory_budget=4096)
+        scene = LiveScene(turtle, figure=agg_figure())
+        for i in range(300):
+            turtle.left(7)
+            turtle.forward(1)
+            if i % 50 == 0:
+                scene.update()
+        scene.update()
+        self.assertGreater(turtle.get_drawing_data().spilled_bytes, 0)
+        self.assertEqual(drawn_segments(scene), 300)
+
+    def test_frame_rate_cap(self):
+        """Test that updates coming too soon are skipped, and drawn by the next frame."""
+        scene = LiveScene(self.turtle, figure=agg_figure(), max_fps=1e-6)
+        self.turtle.forward(10)
+        self.assertFalse(scene.update())
+        self.assertEqual(drawn_segments(scene), 4)
+        self.assertTrue(scene.update(force=True))
+        self.assertEqual(drawn_segments(scene), 5)
+        with self.assertRaises(ValueError):
+            LiveScene(self.turtle, figure=agg_figure(), max_fps=0)
+
+    def test_sink(self):
+        """Test that a scene attached as a sink draws every line as it is drawn."""
+        self.turtle.attach_sink(self.scene)
+        self.turtle.forward(10)
+        self.turtle.left(90)
+        self.turtle.forward(10)
+        self.assertEqual(drawn_segments(self.scene), 6)
+
+    def test_sink_symbol_follows_the_turtle(self):
+        """Test that a scene attached as a sink shows the symbol where the turtle ends each move."""
+        self.turtle.attach_sink(self.scene)
+        symbol = self.scene.ax.patches[0]
+        self.turtle.left(90)
+        for move, args in ((self.turtle.forward, (30,)), (self.turtle.goto, (20, 40)), (self.turtle.circle, (10, 90))):
+            move(*args)
+            np.testing.assert_allclose(symbol.get_xy()[:3], symbol_vertices(self.turtle))
+
+    def test_view_follows_unbounded_turtles(self):
+        """Test that the axes fit the bounds of an unbounded turtle, and grow as it goes further."""
+        turtle = Turtle(boundary='unbounded')
+        turtle.forward(300)
+        scene = LiveScene(turtle, figure=agg_figure())
+        self.assertEqual(scene.ax.get_ylim(), (-200, 300))
+        turtle.right(90)
+        turtle.forward(500)
+        scene.update()
+        self.assertEqual(scene.ax.get_xlim(), (-200, 500))
+        self.assertEqual(drawn_segments(scene), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import matplotlib
+from turtle_graphics import batch
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.batch import load_manifest, main, run_jobs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def draw_square(turtle, size, color='black'):
+    """Draw a square."""
+    turtle.set_pen_color(color)
+    for _ in range(4):
+        turtle.forward(size)
+        turtle.left(90)
+
+def draw_pair(turtle):
+    """Draw with two new turtles and return them."""
+    turtles = [Turtle(x=-50), Turtle(x=50)]
+    for t in turtles:
+        t.forward(20)
+    return turtles
+
+class TestBatch(unittest.TestCase):
+    """Tests for the batch job runner."""
+
+    def setUp(self):
+        """Create a folder for the manifests and images."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+
+    def write_manifest(self, manifest, name='manifest.json'):
+        """Write a manifest to the test folder and return its path."""
+        path = os.path.join(self.folder.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            if name.endswith('.jsonl'):
+                file.write('\n'.join(json.dumps(job) for job in manifest))
+            else:
+                json.dump(manifest, file)
+        return path
+
+    def test_load_manifest(self):
+        """Test that defaults are applied and outputs are relative to the manifest."""
+        path = self.write_manifest({'defaults': {'dpi': 40}, 'jobs': [
+            {'function': 'tests.test_batch:draw_square', 'args': [30], 'output': 'a.png'},
+            {'function': 'tests.test_batch:draw_square', 'args': [30], 'output': 'b.svg', 'dpi': 80, 'name': 'b'}]})
+        jobs = load_manifest(path)
+        self.assertEqual([job['dpi'] for job in jobs], [40, 80])
+        self.assertEqual(jobs[0]['output'], os.path.join(self.folder.name, 'a.png'))
+        self.assertEqual(jobs[1]['name'], 'b')
+        lines = self.write_manifest([{'function': 'tests.test_batch:draw_pair', 'output': 'c.png'}], 'manifest.jsonl')
+        self.assertEqual(len(load_manifest(lines)), 1)
+        with self.assertRaises(ValueError):
+            load_manifest(self.write_manifest([{'output': 'd.png'}]))
+
+    def test_run_jobs(self):
+        """Test that jobs write their images and report their segments, and that failures are reported."""
+        jobs = load_manifest(self.write_manifest([
+            {'function': 'tests.test_batch:draw_square', 'args': [30], 'kwargs': {'color': 'red'}, 'output': 'out/a.png', 'dpi': 30},
+            {'function': 'tests.test_batch:draw_pair', 'output': 'out/b.svg'},
+            {'function': 'tests.test_batch:draw_square', 'args': [500], 'output': 'out/c.png'},
+            {'function': 'tests.test_batch', 'output': 'out/d.png'}]))
+        reports = run_jobs(jobs, processes=2)
+        self.assertEqual([report['status'] for report in reports], ['ok', 'ok', 'failed', 'failed'])
+        self.assertEqual([report['segments'] for report in reports[:2]], [4, 2])
+        self.assertTrue(os.path.exists(jobs[0]['output']))
+        self.assertTrue(os.path.exists(jobs[1]['output']))
+        self.assertTrue(reports[2]['error'].startswith('ValueError'))
+        self.assertGreater(reports[0]['render'], 0)
+
+    def test_run_jobs_in_this_process_keeps_backend(self):
+        """Test that running jobs in the calling process switches its matplotlib backend back afterwards."""
+        backend = matplotlib.get_backend()
+        matplotlib.use('svg')
+        try:
+            jobs = load_manifest(self.write_manifest([{'function': 'tests.test_batch:draw_square', 'args': [10], 'output': 'a.png', 'dpi': 30}]))
+            self.assertEqual([report['status'] for report in run_jobs(jobs, processes=1)], ['ok'])
+            self.assertEqual(matplotlib.get_backend(), 'svg')
+        finally:
+            matplotlib.use(backend)
+
+    def test_documented_manifests(self):
+        """Test that the example manifests of the module docstring and of the README run without errors."""
+        usage = batch.__doc__[batch.__doc__.index('Usage:'):]
+        examples = {'docstring': usage[usage.index('['):usage.index(']\n') + 1]}
+        with open(os.path.join(ROOT, 'README.md'), encoding='utf-8') as file:
+            readme = file.read()
+        start = readme.index('```json') + len('```json')
+        examples['README'] = readme[start:readme.index('```', start)]
+        for source, text in examples.items():
+            jobs = load_manifest(self.write_manifest(json.loads(text)))
+            reports = run_jobs(jobs, processes=1)
+            self.assertEqual([report['status'] for report in reports], ['ok'] * len(jobs), (source, reports))
+
+    def test_main(self):
+        """Test the command line, with its report file and exit status."""
+        path = self.write_manifest([{'function': 'tests.test_batch:draw_square', 'args': [10], 'output': 'a.png', 'dpi': 30}])
+        report = os.path.join(self.folder.name, 'report.json')
+        with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()):
+            status = main([path, '--processes', '1', '--report', report])
+        self.assertEqual(status, 0)
+        self.assertIn('a.png', output.getvalue())
+        with open(report, encoding='utf-8') as file:
+            self.assertEqual(json.load(file)['jobs'][0]['segments'], 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from benchmarks.run import BENCHMARKS, compare, run_benchmark
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests for the benchmark suite, on the smallest workloads."""
+
+    def test_suite_covers_the_workloads(self):
+        """Test that the suite has the import, turtle, fractal and rendering benchmarks."""
+        for name in ('import.core', 'turtle.forward', 'turtle.circle', 'turtle.goto', 'fractal.koch', 'fractal.sierpinski',
+                     'render.draw_all_turtles', 'render.png', 'render.raster'):
+            self.assertIn(name, BENCHMARKS)
+
+    def test_run_benchmark(self):
+        """Test that a benchmark reports its time, throughput and memory."""
+        result = run_benchmark('fractal.koch', 2, repeats=2)
+        self.assertEqual(result['segments'], 48)
+        self.assertGreater(result['median'], 0)
+        self.assertLessEqual(result['min'], result['median'])
+        self.assertAlmostEqual(result['segments_per_sec'], 48 / result['median'])
+        self.assertGreater(result['peak_memory'], 0)
+
+    def test_render_benchmark(self):
+        """Test that rendering runs headless and leaves no figure open."""
+        import matplotlib.pyplot as plt
+        result = run_benchmark('render.draw_all_turtles', 1, repeats=1)
+        self.assertEqual(result['operations'], 1)
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_compare(self):
+        """Test the speed-up over a baseline, for the benchmarks run in both."""
+        baseline = {'results': [{'name': 'a', 'param': 1, 'median': 2.0}, {'name': 'b', 'param': 1, 'median': 1.0}]}
+        results = {'results': [{'name': 'a', 'param': 1, 'median': 1.0}, {'name': 'c', 'param': 1, 'median': 1.0}]}
+        self.assertEqual(compare(results, baseline), {('a', 1): 2.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
+import io
+import os
+import tempfile
 import unittest
 from turtle_graphics.turtle import Turtle
-from turtle_graphics.drawing import draw_all_turtles
+from turtle_graphics.config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from turtle_graphics.drawing import draw_all_turtles, draw_scene, render_to_file
 from unittest.mock import patch
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 class TestDrawing(unittest.TestCase):
@@ -40,5 +46,108 @@ class TestDrawing(unittest.TestCase):
         # Check if the title is set correctly
         self.assertEqual(plt.gca().get_title(), custom_title)
 
+    def test_draw_all_turtles_batches_lines_by_style(self):
+        """Test that lines are drawn as one collection per line style."""
+        turtle = Turtle()
+        for _ in range(4):
+            turtle.forward(50)
+            turtle.right(90)
+        turtle.set_pen_color('red')
+        turtle.forward(20)
+
+        with patch.object(plt, 'show'):
+            draw_all_turtles(turtle)
+
+        collections = [c for c in plt.gca().collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(collections), 2)
+        # The square is a single polyline of 5 vertices, the red line a polyline of 2 vertices
+        self.assertEqual(sorted(len(polyline) for c in collections for polyline in c.get_segments()), [2, 5])
+
+        # The turtle can keep drawing after being rendered
+        turtle.forward(10)
+
+    def test_draw_exact_arcs(self):
+        """Test that exact arcs are turned into lines at the resolution of the figure."""
+        turtle = Turtle(record_arcs=True)
+        turtle.circle(50)
+
+        coarse, fine = Figure(dpi=50).add_subplot(), Figure(dpi=400).add_subplot()
+        draw_scene(coarse, "Coarse", [turtle])
+        draw_scene(fine, "Fine", [turtle])
+        self.assertGreater(len(fine.collections[0].get_segments()[0]), len(coarse.collections[0].get_segments()[0]))
+
+    def test_draw_scene_culls_to_viewport(self):
+        """Test that only the lines crossing the viewport are drawn, with the viewport as plot limits."""
+        turtle = Turtle()
+        for _ in range(4):
+            turtle.forward(50)
+            turtle.right(90)
+        turtle.set_pen_color('red')
+        turtle.circle(20)
+
+        ax = Figure().add_subplot()
+        draw_scene(ax, "Zoomed", [turtle], viewport=(-10, 25, 10, 45))
+        collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(collections), 1)
+        self.assertEqual(len(collections[0].get_segments()), 1)     #Only the left side of the square
+        self.assertEqual(ax.get_xlim(), (-10, 10))
+        self.assertEqual(ax.get_ylim(), (25, 45))
+
+    def test_draw_scene_fits_unbounded_turtles(self):
+        """Test that the plot limits grow to hold the lines of unbounded turtles."""
+        turtle = Turtle(boundary='unbounded')
+        turtle.goto(-500, 300)
+        ax = Figure().add_subplot()
+        draw_scene(ax, "Unbounded", [turtle, Turtle()])
+        self.assertEqual(ax.get_xlim(), (-500, SCREEN_LIMIT_X))
+        self.assertEqual(ax.get_ylim(), (-SCREEN_LIMIT_Y, 300))
+
+    def test_draw_scene_simplifies_lines(self):
+        """Test that simplified lines keep every polyline but fewer vertices."""
+        turtle = Turtle()
+        turtle.circle(50, tolerance=0.001)
+        turtle.set_pen_color('red')
+        turtle.forward(60)
+
+        full, simplified = Figure().add_subplot(), Figure().add_subplot()
+        draw_scene(full, "Full", [turtle])
+        draw_scene(simplified, "Simplified", [turtle], simplify=True)
+        full_lines = [c.get_segments() for c in full.collections if isinstance(c, LineCollection)]
+        simplified_lines = [c.get_segments() for c in simplified.collections if isinstance(c, LineCollection)]
+        self.assertEqual([len(lines) for lines in simplified_lines], [len(lines) for lines in full_lines])
+        self.assertLess(len(simplified_lines[0][0]), len(full_lines[0][0]))
+        self.assertEqual(len(simplified_lines[1][0]), 2)
+
+    def test_render_to_file_object(self):
+        """Test rendering PNG and SVG images to file-like objects without pyplot."""
+        turtle = Turtle()
+        turtle.forward(100)
+        open_figures = plt.get_fignums()
+
+        png = io.BytesIO()
+        timings = render_to_file(png, "Headless", turtle, dpi=50, size=(4, 4))
+        self.assertTrue(png.getvalue().startswith(b'\x89PNG'))
+        self.assertEqual(set(timings), {'prepare', 'draw', 'write', 'total'})
+        self.assertGreaterEqual(timings['total'], timings['write'])
+
+        svg = io.BytesIO()
+        render_to_file(svg, turtle, format='svg')
+        self.assertIn(b'<svg', svg.getvalue())
+
+        self.assertEqual(plt.get_fignums(), open_figures)
+
+    def test_render_to_file_path(self):
+        """Test that the image format is taken from the file extension."""
+        turtle = Turtle()
+        turtle.forward(100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "drawing.pdf")
+            render_to_file(path, turtle)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(4), b'%PDF')
+
+            with self.assertRaises(ValueError):
+                render_to_file(os.path.join(directory, "drawing.bmp"), turtle)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+from turtle_graphics import geometry
+from turtle_graphics.geometry import circle_steps, polygon_walk, clip_polyline, wrap_point, wrap_polyline
+
+class TestGeometry(unittest.TestCase):
+    """Tests for the batched geometry helpers."""
+
+    def test_circle_steps(self):
+        """Test the default and tolerance based number of circle steps."""
+        self.assertEqual(circle_steps(50, 360), 31)
+        self.assertEqual(circle_steps(1, 360), 1)
+        self.assertGreater(circle_steps(50, 360, tolerance=0.1), circle_steps(50, 360, tolerance=1))
+        self.assertEqual(circle_steps(50, 360, tolerance=100), 1)
+
+    def test_polygon_walk_square(self):
+        """Test walking a square starting towards the north."""
+        coords = [round(value, 9) for value in polygon_walk(0, 0, 90, 10, 90, 4)]
+        self.assertEqual(coords, [0, 0, 0, 10, 10, 10, 10, 0, 0, 0])
+
+    def test_polygon_walk_without_numpy(self):
+        """Test that the pure Python path gives the same vertices as the NumPy path."""
+        expected = list(polygon_walk(5, -3, 30, 7, 12.5, 20))
+        with patch.object(geometry, '_numpy', None):
+            actual = polygon_walk(5, -3, 30, 7, 12.5, 20)
+        self.assertIsInstance(actual, list)
+        for a, b in zip(actual, expected):
+            self.assertAlmostEqual(a, b)
+
+    def test_clip_polyline(self):
+        """Test that a polyline is split where it leaves the rectangle, with and without NumPy."""
+        coords = [0, 0, 20, 0, 20, 5, 0, 5] * 5
+        with patch.object(geometry, '_numpy', None):
+            expected = clip_polyline(coords, -1, -1, 10, 10)
+        self.assertEqual(expected[:2], [[0, 0, 10, 0], [10, 5, 0, 5, 0, 0, 10, 0]])
+        self.assertEqual((len(expected), expected[-1]), (6, [10, 5, 0, 5]))
+        actual = clip_polyline(coords, -1, -1, 10, 10)      #Long enough for the NumPy path
+        self.assertEqual([list(part) for part in actual], expected)
+        self.assertEqual(clip_polyline([20, 20, 30, 30], -1, -1, 10, 10), [])
+
+    def test_wrap_polyline(self):
+        """Test that a polyline leaving the rectangle enters it again on the opposite side."""
+        self.assertEqual(wrap_point(12, -13, -10, -10, 10, 10), (-8, 7))
+        self.assertEqual(wrap_polyline([0, 0, 15, 0, 15, 15], -10, -10, 10, 10),
+                         [[0, 0, 10, 0], [-10, 0, -5, 0, -5, 10], [-5, -10, -5, -5]])
+        self.assertEqual(wrap_polyline([0, 0, 45, 0], -10, -10, 10, 10),
+                         [[0, 0, 10, 0], [-10, 0, 10, 0], [-10, 0, 5, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a new interpreter, where matplotlib and NumPy cannot be imported, and prints the modules loaded
+IMPORT_SCRIPT = """
+import importlib.abc, json, sys
+
+class Blocker(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name.split('.')[0] in ('matplotlib', 'numpy'):
+            raise ImportError(f"{name} is blocked")
+        return None
+
+sys.meta_path.insert(0, Blocker())
+import turtle_graphics.config, turtle_graphics.turtle, turtle_graphics.drawing
+t = turtle_graphics.turtle.Turtle()
+t.forward(50)
+t.circle(20)
+print(json.dumps({'segments': len(t.get_drawing_data()), 'modules': sorted(sys.modules)}))
+"""
+
+class TestImports(unittest.TestCase):
+    """Tests that the core of the package starts fast, with the standard library only."""
+
+    def test_core_imports_without_rendering_dependencies(self):
+        """Test that the turtle, config and drawing modules import and draw without matplotlib or NumPy."""
+        result = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True)
+        report = json.loads(result.stdout)
+        self.assertFalse([name for name in report['modules'] if name.split('.')[0] in ('matplotlib', 'numpy')])
+        self.assertGreater(report['segments'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
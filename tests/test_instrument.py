@@ -0,0 +1,64 @@
+import io
+import unittest
+from turtle_graphics import drawing, instrument
+from turtle_graphics.segments import SegmentStore
+from turtle_graphics.turtle import Turtle
+
+class TestInstrument(unittest.TestCase):
+    """Tests for the opt-in instrumentation of turtles and renderers."""
+
+    def tearDown(self):
+        """Make sure instrumentation is off after every test."""
+        instrument.disable()
+
+    def test_counts_calls_and_segments(self):
+        """Test that calls, times, segments and drawing bytes are collected."""
+        with instrument.instrumented(renderers=False) as stats:
+            turtle = Turtle()
+            for _ in range(10):
+                turtle.forward(5)
+                turtle.left(36)
+            turtle.circle(20)
+        self.assertEqual(stats.calls['Turtle.forward'], 10)
+        self.assertEqual(stats.calls['Turtle.left'], 10)
+        self.assertEqual(stats.calls['SegmentStore.add_segment'], 10)
+        self.assertEqual(stats.segments, len(turtle.get_drawing_data()))
+        self.assertEqual(stats.drawing_bytes, turtle.get_drawing_data().nbytes)
+        self.assertGreater(stats.times['Turtle.circle'], 0)
+        self.assertGreaterEqual(stats.times['Turtle.circle'], stats.times['SegmentStore.add_polyline'])
+        self.assertEqual(stats.snapshot()['segments'], stats.segments)
+
+    def test_render_phases(self):
+        """Test that every render phase of render_to_file is timed."""
+        turtle = Turtle()
+        turtle.circle(50)
+        with instrument.instrumented() as stats:
+            drawing.render_to_file(io.BytesIO(), turtle, dpi=30)
+        self.assertEqual(stats.renders, 1)
+        for phase in ('data', 'artists', 'layout', 'write'):
+            self.assertGreater(stats.phases[phase], 0, phase)
+
+    def test_disabled_leaves_original_functions(self):
+        """Test that disabling puts back the very same functions, so there is no overhead left."""
+        originals = (Turtle.__dict__['forward'], SegmentStore.__dict__['add_segment'], drawing.draw_lines,
+                     drawing.render_to_file)
+        instrument.enable()
+        self.assertIsNot(Turtle.__dict__['forward'], originals[0])
+        with self.assertRaises(RuntimeError):
+            instrument.enable()
+        instrument.disable()
+        self.assertEqual((Turtle.__dict__['forward'], SegmentStore.__dict__['add_segment'], drawing.draw_lines,
+                          drawing.render_to_file), originals)
+        self.assertIsNone(instrument.get_stats())
+
+    def test_callback_and_counting_only(self):
+        """Test the periodic callback, and that counting only collects no times."""
+        reports = []
+        with instrument.instrumented(timing=False, renderers=False, callback=reports.append, interval=0) as stats:
+            Turtle().forward(10)
+        self.assertEqual(stats.times, {})
+        self.assertEqual(stats.calls['Turtle.forward'], 1)
+        self.assertIs(reports[-1], stats)
+
+if __name__ == '__main__':
+    unittest.main()
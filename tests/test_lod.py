@@ -0,0 +1,127 @@
+import unittest
+import numpy as np
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.lod import LevelOfDetail, douglas_peucker_importance, get_lod
+
+def reference_importance(points):
+    """Compute the Douglas-Peucker importance of the vertices of one polyline, recursively."""
+    importance = np.zeros(len(points))
+    importance[0] = importance[-1] = np.inf
+
+    def split(first, last, parent):
+        if last - first < 2:
+            return
+        x0, y0 = points[first]
+        dx, dy = points[last] - points[first]
+        length = dx * dx + dy * dy
+        distances = []
+        for x, y in points[first + 1:last]:
+            t = min(max(((x - x0) * dx + (y - y0) * dy) / length, 0), 1) if length else 0
+            distances.append(np.hypot(x - x0 - t * dx, y - y0 - t * dy))
+        furthest = first + 1 + int(np.argmax(distances))
+        importance[furthest] = min(max(distances), parent)
+        split(first, furthest, importance[furthest])
+        split(furthest, last, importance[furthest])
+
+    split(0, len(points) - 1, np.inf)
+    return importance
+
+class TestLevelOfDetail(unittest.TestCase):
+    """Tests for the Douglas-Peucker level of detail of a turtle's lines."""
+
+    def setUp(self):
+        """Draw a random walk in two colours."""
+        rng = np.random.default_rng(1)
+        self.turtle = Turtle()
+        self.turtle.walk(rng.uniform(-40, 40, 300), rng.uniform(0, 2, 300))
+        self.turtle.set_pen_color('red')
+        self.turtle.walk(rng.uniform(-40, 40, 300), rng.uniform(0, 2, 300))
+
+    def test_importance_matches_recursive_douglas_peucker(self):
+        """Test that the importances of several polylines at once match a recursive Douglas-Peucker."""
+        vertices, bounds, _ = self.turtle.get_drawing_data().to_numpy_polylines()
+        importance = douglas_peucker_importance(vertices, bounds)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            np.testing.assert_allclose(importance[start:end], reference_importance(vertices[start:end]))
+
+    def test_level_keeps_polyline_ends_and_styles(self):
+        """Test that a level simplifies every polyline on its own, keeping its ends and style."""
+        lod = get_lod(self.turtle.get_drawing_data())
+        vertices, bounds, run_styles = lod.level(1.0)
+        self.assertLess(len(vertices), len(lod.vertices))
+        np.testing.assert_array_equal(run_styles, lod.run_styles)
+        np.testing.assert_array_equal(vertices[bounds[:-1]], lod.vertices[lod.bounds[:-1]])
+        np.testing.assert_array_equal(vertices[bounds[1:] - 1], lod.vertices[lod.bounds[1:] - 1])
+
+    def test_level_is_within_tolerance(self):
+        """Test that every vertex dropped is within the tolerance of the simplified polyline."""
+        lod = LevelOfDetail(self.turtle.get_drawing_data())
+        vertices, bounds, _ = lod.level(0.5, drop_subpixel=False)
+        simplified = vertices[bounds[0]:bounds[1]]
+        for x, y in lod.vertices[lod.bounds[0]:lod.bounds[1]]:
+            starts, ends = simplified[:-1], simplified[1:]
+            direction = ends - starts
+            t = np.clip(np.einsum('ij,ij->i', (x, y) - starts, direction) / np.einsum('ij,ij->i', direction, direction), 0, 1)
+            closest = starts + t[:, None] * direction
+            self.assertLessEqual(np.hypot(*(closest - (x, y)).T).min(), 0.5 + 1e-9)
+
+    def test_dropping_subpixel_vertices_stays_within_the_tolerance(self):
+        """Test that a vertex kept by Douglas-Peucker is only dropped as subpixel when it is within the tolerance."""
+        turtle = Turtle()
+        turtle.pen_up()
+        turtle.goto(0.01, 0.01)
+        turtle.pen_down()
+        turtle.goto(0.99, 0.99)
+        turtle.goto(-20, 20)
+        vertices, _, _ = get_lod(turtle.get_drawing_data()).level(1.0)
+        np.testing.assert_allclose(vertices, [(0.01, 0.01), (0.99, 0.99), (-20, 20)])
+
+    def test_subpixel_level_is_within_twice_the_tolerance(self):
+        """Test that every vertex is within twice the tolerance of its polyline once subpixel vertices are dropped."""
+        lod = LevelOfDetail(self.turtle.get_drawing_data())
+        vertices, bounds, _ = lod.level(2.0)
+        simplified = vertices[bounds[0]:bounds[1]]
+        starts, ends = simplified[:-1], simplified[1:]
+        direction = ends - starts
+        for x, y in lod.vertices[lod.bounds[0]:lod.bounds[1]]:
+            t = np.clip(np.einsum('ij,ij->i', (x, y) - starts, direction) / np.einsum('ij,ij->i', direction, direction), 0, 1)
+            closest = starts + t[:, None] * direction
+            self.assertLessEqual(np.hypot(*(closest - (x, y)).T).min(), 4.0 + 1e-9)
+
+    def test_subpixel_polylines_are_dropped(self):
+        """Test that a polyline fitting within the tolerance is not drawn at all."""
+        turtle = Turtle()
+        turtle.forward(0.1)
+        turtle.set_pen_color('red')
+        turtle.forward(50)
+        vertices, bounds, run_styles = get_lod(turtle.get_drawing_data()).level(0.5)
+        self.assertEqual(len(run_styles), 1)
+        self.assertEqual(turtle.get_drawing_data().styles[run_styles[0]][0], 'red')
+        self.assertEqual(len(vertices), 2)
+
+    def test_levels_are_cached_until_the_drawing_changes(self):
+        """Test that close tolerances share a level, and that the level of detail is rebuilt after new lines."""
+        store = self.turtle.get_drawing_data()
+        lod = get_lod(store)
+        self.assertIs(lod.level(0.3), lod.level(0.4))
+        self.assertIs(get_lod(store), lod)
+        self.turtle.forward(5)
+        self.assertIsNot(get_lod(store), lod)
+        with self.assertRaises(ValueError):
+            lod.level(0)
+
+    def test_arc_levels_of_detail_are_cached_per_tolerance_level(self):
+        """Test that close tolerances share the level of detail of a store with arcs, and that each level is kept."""
+        turtle = Turtle(record_arcs=True)
+        turtle.circle(50)
+        store = turtle.get_drawing_data()
+        lod = get_lod(store, 0.3)
+        self.assertIs(get_lod(store, 0.4), lod)
+        coarse = get_lod(store, 2.0)
+        self.assertIsNot(coarse, lod)
+        self.assertLess(len(coarse.vertices), len(lod.vertices))
+        self.assertIs(get_lod(store, 0.3), lod)
+        self.assertIs(get_lod(store, 3.0), coarse)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import unittest
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.lsystem import LSystem, interpret, KOCH_SNOWFLAKE, SIERPINSKI_TRIANGLE
+from examples.example_4 import draw_koch_snowflake
+
+class TestLSystem(unittest.TestCase):
+    """Tests for the L-system expansion and interpreter."""
+
+    def test_expand(self):
+        """Test that the expansion rewrites every symbol at every level."""
+        self.assertEqual(''.join(SIERPINSKI_TRIANGLE.expand(0)), 'F-G-G')
+        self.assertEqual(''.join(SIERPINSKI_TRIANGLE.expand(1)), 'F-G+F+G-F-GG-GG')
+        self.assertEqual(''.join(KOCH_SNOWFLAKE.expand(2)),
+                         '--'.join(['F+F--F+F+F+F--F+F--F+F--F+F+F+F--F+F'] * 3))
+
+    def test_chunks_are_bounded(self):
+        """Test that the expansion is produced in bounded chunks that add up to the whole expansion."""
+        lsystem = LSystem('F--F--F', {'F': 'F+F--F+F'}, angle=60, max_chunk=50)
+        expected = ''.join(KOCH_SNOWFLAKE.expand(5))
+        chunks = list(lsystem.chunks(5))
+        self.assertEqual(''.join(chunks), expected)
+        self.assertLess(max(len(chunk) for chunk in chunks), 100)
+        self.assertEqual(lsystem.length(5), len(expected))
+
+    def test_deep_expansion_does_not_recurse(self):
+        """Test that the depth of the expansion is not limited by the recursion limit."""
+        lsystem = LSystem('AX', {'X': 'X'}, angle=90, max_chunk=1)
+        limit = sys.getrecursionlimit()
+        self.assertEqual(''.join(lsystem.expand(limit + 100)), 'AX')
+
+    def test_koch_matches_recursive_example(self):
+        """Test that the Koch snowflake L-system draws the same lines as the recursive example."""
+        lsystem_turtle, recursive_turtle = Turtle(), Turtle()
+        KOCH_SNOWFLAKE.draw(lsystem_turtle, 4, 100)
+        draw_koch_snowflake(recursive_turtle, 100, 4)
+        lines, expected_lines = lsystem_turtle.get_drawing_data(), recursive_turtle.get_drawing_data()
+        self.assertEqual(len(lines), len(expected_lines))
+        for line, expected_line in zip(lines, expected_lines):
+            for value, expected_value in zip(line[0] + line[1], expected_line[0] + expected_line[1]):
+                self.assertAlmostEqual(value, expected_value)
+
+    def test_deep_koch(self):
+        """Test that a depth 8 Koch snowflake can be drawn."""
+        turtle = Turtle()
+        KOCH_SNOWFLAKE.draw(turtle, 8, 100)
+        self.assertEqual(len(turtle.get_drawing_data()), 3 * 4 ** 8)
+        self.assertAlmostEqual(turtle.x, 0)
+        self.assertAlmostEqual(turtle.y, 0)
+
+    def test_interpret_branches(self):
+        """Test that [ and ] save and restore the turtle's position and direction without drawing."""
+        turtle = Turtle()
+        interpret(turtle, 'F[+F]F[-F]f', angle=90, step=10)
+        self.assertEqual(len(turtle.get_drawing_data()), 4)
+        self.assertAlmostEqual(turtle.x, 0)
+        self.assertAlmostEqual(turtle.y, 30)
+        self.assertAlmostEqual(turtle.angle, 90)
+        with self.assertRaises(ValueError):
+            interpret(turtle, 'F]', angle=90, step=10)
+
+    def test_interpret_outside_screen_limits(self):
+        """Test that leaving the screen raises a ValueError."""
+        with self.assertRaises(ValueError):
+            interpret(Turtle(), 'F' * 30, angle=90, step=10)
+
+    def test_invalid_grammar(self):
+        """Test that invalid grammars are rejected."""
+        with self.assertRaises(TypeError):
+            LSystem('F', {'F': 3}, angle=90)
+        with self.assertRaises(ValueError):
+            LSystem('F', {'FF': 'F'}, angle=90)
+        with self.assertRaises(ValueError):
+            list(KOCH_SNOWFLAKE.chunks(-1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.motif import Motif, MotifCache
+from examples.example_4 import draw_koch_snowflake
+
+def draw_corner(turtle, size):
+    """Draw two sides of a square, then turn and lift the pen."""
+    turtle.forward(size)
+    turtle.left(90)
+    turtle.forward(size)
+    turtle.pen_up()
+    turtle.right(45)
+
+class TestMotif(unittest.TestCase):
+    """Tests for recording, stamping and caching motifs."""
+
+    def setUp(self):
+        """Create a cache and a memoized Koch curve using it."""
+        self.cache = MotifCache()
+
+        @self.cache.memoize
+        def koch(turtle, length, depth):
+            if depth == 0:
+                turtle.forward(length)
+                return
+            for turn in (0, 60, -120, 60):
+                turtle.left(turn)
+                koch(turtle, length / 3, depth - 1)
+        self.koch = koch
+
+    def assert_same_lines(self, lines, expected_lines):
+        """Check that two sequences of lines are equal within floating point error."""
+        self.assertEqual(len(lines), len(expected_lines))
+        for line, expected_line in zip(lines, expected_lines):
+            for value, expected_value in zip(line[0] + line[1], expected_line[0] + expected_line[1]):
+                self.assertAlmostEqual(value, expected_value)
+            self.assertEqual(line[2:], expected_line[2:])
+
+    def test_stamp_matches_direct_calls(self):
+        """Test that stamping a motif draws what calling its procedure draws, at any position and direction."""
+        for angle in (0, 90, 200):
+            expected, turtle = Turtle(x=10, y=-20, init_angle=angle), Turtle(x=10, y=-20, init_angle=angle)
+            expected.set_pen_color('red')
+            turtle.set_pen_color('red')
+            draw_corner(expected, 30)
+            Motif.record(draw_corner, turtle, 30).stamp(turtle)
+            self.assert_same_lines(turtle.get_drawing_data(), expected.get_drawing_data())
+            self.assertAlmostEqual(turtle.x, expected.x)
+            self.assertAlmostEqual(turtle.y, expected.y)
+            self.assertAlmostEqual(turtle.angle, expected.angle)
+            self.assertFalse(turtle.is_pen_down)
+
+    def test_memoized_koch_matches_example(self):
+        """Test that the memoized Koch curve draws the lines of the recursive example, recording each level once."""
+        turtle, expected = Turtle(), Turtle()
+        for _ in range(3):
+            self.koch(turtle, 100, 5)
+            turtle.right(120)
+        draw_koch_snowflake(expected, 100, 5)
+        self.assert_same_lines(turtle.get_drawing_data(), expected.get_drawing_data())
+        self.assertEqual(self.cache.misses, 6)
+        self.assertEqual(len(self.cache), 6)
+
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts the least recently used motifs to stay within its segment budget."""
+        cache = MotifCache(max_segments=5)
+        turtle = Turtle()
+        for size in (10, 20, 10, 5):     #The second stamp of size 10 makes it the most recently used motif
+            turtle.pen_down()
+            cache.stamp(turtle, draw_corner, size)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((draw_corner, (20,), (), 'black', 1, True)))
+        self.assertLessEqual(cache.segment_count, 5)
+
+    def test_stamp_outside_screen_limits(self):
+        """Test that a motif leaving the screen raises before anything is drawn."""
+        motif = Motif.record(draw_corner, Turtle(), 100)
+        turtle = Turtle(x=150, y=0, init_angle=0)
+        with self.assertRaises(ValueError):
+            motif.stamp(turtle)
+        self.assertEqual(len(turtle.get_drawing_data()), 0)
+        self.assertEqual(turtle.get_position(), (150, 0))
+
+    def test_stamp_checks_pen_up_moves(self):
+        """Test that a motif whose pen-up moves leave the screen raises like calling its procedure, also when nested."""
+        def jump(turtle):
+            turtle.pen_up()
+            turtle.forward(300)
+            turtle.backward(300)
+            turtle.pen_down()
+            turtle.forward(10)
+        with self.assertRaises(ValueError):
+            jump(Turtle())
+        motif = Motif.record(jump, Turtle())
+        turtle = Turtle()
+        with self.assertRaises(ValueError):
+            motif.stamp(turtle)
+        self.assertEqual(len(turtle.get_drawing_data()), 0)
+        jumps = self.cache.memoize(jump)
+        with self.assertRaises(ValueError):
+            self.cache.stamp(Turtle(), lambda turtle: (jumps(turtle), turtle.left(90), turtle.forward(10)))
+        unbounded = Turtle(boundary='unbounded')
+        motif.stamp(unbounded)
+        self.assertEqual(unbounded.bounds, (-200, -200, 200, 300))
+
+    def test_stamp_with_boundary_policies(self):
+        """Test that motifs larger than the screen around the origin are recorded, and clipped or wrapped when stamped."""
+        motif = Motif.record(draw_corner, Turtle(), 400)
+        self.assertEqual([round(value, 9) for value in motif.end[:2]], [400, 400])
+        clipped = Turtle(x=-150, y=-150, init_angle=0, boundary='clip')
+        motif.stamp(clipped)
+        self.assertEqual([round(value, 9) for value in clipped.get_position()], [250, 250])
+        self.assertEqual([line[:2] for line in clipped.get_drawing_data()], [((-150, -150), (200, -150))])
+        wrapped = Turtle(x=-150, y=-150, init_angle=0, boundary='wrap')
+        motif.stamp(wrapped)
+        self.assertEqual([round(value, 9) for value in wrapped.get_position()], [-150, -150])
+        self.assertEqual(len(wrapped.get_drawing_data()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
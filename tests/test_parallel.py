@@ -0,0 +1,80 @@
+import unittest
+from functools import partial
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.lsystem import KOCH_SNOWFLAKE
+from turtle_graphics.parallel import generate_scene
+
+def snowflake(turtle, depth=3):
+    """Draw a small Koch snowflake in red."""
+    turtle.set_pen_color('red')
+    KOCH_SNOWFLAKE.draw(turtle, depth, 60)
+
+def rings(turtle):
+    """Draw circles and leave the pen up."""
+    for radius in (5, 10, 15):
+        turtle.circle(radius)
+    turtle.pen_up()
+    turtle.forward(10)
+
+def escape(turtle):
+    """Move outside the screen limits."""
+    turtle.forward(1000)
+
+class TestParallel(unittest.TestCase):
+    """Tests for running turtle programs in a process pool."""
+
+    def expected(self, program, **options):
+        """Run a program on a turtle in this process."""
+        turtle = Turtle(**options)
+        program(turtle)
+        return turtle
+
+    def assertSameTurtle(self, turtle, expected):
+        """Assert that two turtles drew the same lines and ended in the same state."""
+        self.assertEqual(list(turtle.get_drawing_data()), list(expected.get_drawing_data()))
+        for name in ('x', 'y', 'angle', 'is_pen_down', 'line_color', 'line_thickness', 'boundary', 'bounds'):
+            self.assertEqual(getattr(turtle, name), getattr(expected, name))
+
+    def test_matches_sequential_drawing(self):
+        """Test that programs run in worker processes draw what they draw in this process, in order."""
+        programs = [partial(snowflake, depth=4), (rings, {'x': 50, 'record_arcs': True}), (snowflake, {'x': -100})]
+        turtles = generate_scene(programs, processes=2, init_angle=0)
+        self.assertEqual(len(turtles), 3)
+        self.assertSameTurtle(turtles[0], self.expected(partial(snowflake, depth=4), init_angle=0))
+        self.assertSameTurtle(turtles[1], self.expected(rings, x=50, init_angle=0, record_arcs=True))
+        self.assertSameTurtle(turtles[2], self.expected(snowflake, x=-100, init_angle=0))
+        self.assertEqual(len(turtles[1].get_drawing_data().arcs), 18)
+
+    def test_turtles_keep_drawing(self):
+        """Test that the rebuilt turtles can draw more lines."""
+        turtle, = generate_scene([snowflake], processes=1)
+        count = len(turtle.get_drawing_data())
+        turtle.forward(10)
+        self.assertEqual(len(turtle.get_drawing_data()), count + 1)
+
+    def test_unbounded_round_trip(self):
+        """Test that a turtle drawing off the screen comes back with its boundary policy and bounds."""
+        turtle, = generate_scene([escape], processes=1, boundary='unbounded')
+        self.assertSameTurtle(turtle, self.expected(escape, boundary='unbounded'))
+        self.assertEqual(turtle.bounds, (-200, -200, 200, 1000))
+
+    def test_memory_budget_round_trip(self):
+        """Test that a turtle with a memory budget comes back with a store spilling under the same budget."""
+        programs = [partial(snowflake, depth=5), (rings, {'record_arcs': True})]
+        turtles = generate_scene(programs, processes=2, memory_budget=4096)
+        for turtle, (program, options) in zip(turtles, [(programs[0], {}), programs[1]]):
+            store = turtle.get_drawing_data()
+            self.assertEqual(store.memory_budget, 4096)
+            self.assertSameTurtle(turtle, self.expected(program, memory_budget=4096, **options))
+        self.assertGreater(turtles[0].get_drawing_data().spilled_bytes, 0)
+        self.assertEqual(len(turtles[1].get_drawing_data().arcs), 18)
+
+    def test_errors(self):
+        """Test that errors raised by a program reach the caller."""
+        with self.assertRaises(ValueError):
+            generate_scene([rings, escape], processes=2)
+        with self.assertRaises(TypeError):
+            generate_scene([42])
+
+if __name__ == '__main__':
+    unittest.main()
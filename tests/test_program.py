@@ -0,0 +1,99 @@
+import unittest
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.program import Program, ProgramRecorder, record
+
+def draw_pattern(turtle, size):
+    """Draw a small pattern using most turtle commands."""
+    turtle.set_pen_color('red')
+    for _ in range(3):
+        turtle.forward(size)
+        turtle.left(120)
+    turtle.pen_up()
+    turtle.right(45)
+    turtle.backward(size / 2)
+    turtle.pen_down()
+    turtle.set_line_thickness(2)
+    turtle.circle(size / 4, 180)
+    turtle.goto(10, 10)
+    turtle.forward(size / 3)
+    turtle.right(30)
+
+class TestProgram(unittest.TestCase):
+    """Tests for recording and replaying turtle programs."""
+
+    def assert_same_drawing(self, actual, expected, exact=True):
+        """Check that two turtles have drawn the same lines and ended in the same state."""
+        actual_lines, expected_lines = list(actual.get_drawing_data()), list(expected.get_drawing_data())
+        self.assertEqual(len(actual_lines), len(expected_lines))
+        if exact:
+            self.assertEqual(actual_lines, expected_lines)
+            self.assertEqual((actual.x, actual.y, actual.angle), (expected.x, expected.y, expected.angle))
+            return
+        for (start, end, color, thickness), expected_line in zip(actual_lines, expected_lines):
+            for value, expected_value in zip(start + end, expected_line[0] + expected_line[1]):
+                self.assertAlmostEqual(value, expected_value)
+            self.assertEqual((color, thickness), expected_line[2:])
+        for value, expected_value in zip((actual.x, actual.y, actual.angle), (expected.x, expected.y, expected.angle)):
+            self.assertAlmostEqual(value, expected_value)
+
+    def test_record(self):
+        """Test that calls are recorded as commands."""
+        program = record(draw_pattern, 60)
+        self.assertEqual(len(program), 16)
+        commands = list(program.commands())
+        self.assertEqual(commands[0], ('set_pen_color', ('red',)))
+        self.assertEqual(commands[9], ('forward', (-30.0,)))
+        self.assertEqual(commands[12], ('circle', (15.0, 180.0, None)))
+
+    def test_recorder_checks_arguments(self):
+        """Test that invalid arguments are rejected when recording."""
+        recorder = ProgramRecorder()
+        with self.assertRaises(TypeError):
+            recorder.forward("not_a_number")
+        with self.assertRaises(TypeError):
+            recorder.set_pen_color(3)
+        self.assertEqual(len(recorder.program), 0)
+
+    def test_run_matches_direct_calls(self):
+        """Test that running a program draws exactly what calling the methods draws."""
+        program = record(draw_pattern, 60)
+        for start_angle in (0, 90, 200):
+            expected, actual = Turtle(init_angle=start_angle), Turtle(init_angle=start_angle)
+            draw_pattern(expected, 60)
+            program.run(actual)
+            self.assert_same_drawing(actual, expected)
+
+    def test_run_vectorized_matches_direct_calls(self):
+        """Test that the vectorized replay matches calling the methods."""
+        program = record(draw_pattern, 60)
+        for start_angle in (0, 90, 200):
+            expected, actual = Turtle(x=-20, init_angle=start_angle), Turtle(x=-20, init_angle=start_angle)
+            draw_pattern(expected, 60)
+            program.run_vectorized(actual)
+            self.assert_same_drawing(actual, expected, exact=False)
+            self.assertEqual(actual.is_pen_down, expected.is_pen_down)
+
+    def test_run_vectorized_checks_limits_first(self):
+        """Test that a run of moves leaving the screen is rejected before it is drawn."""
+        program = Program()
+        recorder = ProgramRecorder(program)
+        for _ in range(10):
+            recorder.forward(50)
+        turtle = Turtle()
+        with self.assertRaises(ValueError):
+            program.run_vectorized(turtle)
+        self.assertEqual(len(turtle.get_drawing_data()), 0)
+
+    def test_run_applies_boundary_policy(self):
+        """Test that moves leaving the screen follow the boundary policy of the turtle, as direct calls do."""
+        program = record(draw_pattern, 300)
+        for policy in ('clip', 'wrap', 'unbounded'):
+            expected, actual = Turtle(boundary=policy), Turtle(boundary=policy)
+            draw_pattern(expected, 300)
+            program.run(actual)
+            self.assert_same_drawing(actual, expected)
+            self.assertEqual(actual.bounds, expected.bounds)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import io
+import struct
+import unittest
+import zlib
+import numpy as np
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.raster import parse_color, rasterize, encode_png, render_png
+
+class TestRaster(unittest.TestCase):
+    """Tests for the NumPy rasterizer backend."""
+
+    def test_parse_color(self):
+        """Test parsing colour names and hex strings."""
+        self.assertEqual(parse_color('red'), (255, 0, 0, 255))
+        self.assertEqual(parse_color('#00f'), (0, 0, 255, 255))
+        self.assertEqual(parse_color('#10203040'), (16, 32, 48, 64))
+        with self.assertRaises(ValueError):
+            parse_color('not_a_colour')
+
+    def test_rasterize_line(self):
+        """Test that a line is drawn in its colour and the background is left untouched."""
+        turtle = Turtle()
+        turtle.set_pen_color('red')
+        turtle.set_line_thickness(3)
+        turtle.forward(100)     # From the centre of the canvas straight up
+
+        image = rasterize(turtle, width=200, height=200, draw_symbols=False)
+        self.assertEqual(image.shape, (200, 200, 4))
+        self.assertEqual(image.dtype, np.uint8)
+        self.assertEqual(tuple(image[75, 100]), (255, 0, 0, 255))
+        self.assertEqual(tuple(image[75, 150]), (255, 255, 255, 255))
+        self.assertEqual(tuple(image[150, 100]), (255, 255, 255, 255))
+
+    def test_transparent_background_keeps_colour(self):
+        """Test that antialiased edges over a transparent background keep the line colour and only lose alpha."""
+        turtle = Turtle()
+        turtle.set_pen_color('red')
+        turtle.left(30)
+        turtle.forward(100)
+        image = rasterize(turtle, width=200, height=200, background=None, draw_symbols=False)
+        alpha = image[..., 3]
+        edges = (alpha > 0) & (alpha < 255)
+        self.assertTrue(edges.any())
+        self.assertTrue((image[edges][:, :3] == (255, 0, 0)).all())
+        self.assertEqual(tuple(image[150, 150]), (0, 0, 0, 0))
+
+    def test_rasterize_symbol(self):
+        """Test that the turtle symbol is drawn at the turtle's position."""
+        turtle = Turtle()
+        turtle.set_turtle_color('blue')
+        image = rasterize(turtle, width=400, height=400, antialias=False)
+        self.assertEqual(tuple(image[200, 200]), (0, 0, 255, 255))
+
+    def test_non_square_image_keeps_aspect(self):
+        """Test that the canvas is fitted in a non-square image with an equal aspect, and centred."""
+        turtle = Turtle()
+        for _ in range(4):
+            turtle.forward(100)     # A square from (-100, 0) to (0, 100)
+            turtle.left(90)
+        image = rasterize(turtle, width=400, height=200, background=None, antialias=False, draw_symbols=False)
+        rows, columns = np.nonzero(image[..., 3])
+        self.assertAlmostEqual(columns.max() - columns.min(), rows.max() - rows.min(), delta=1)
+        self.assertAlmostEqual((columns.min() + columns.max()) / 2, 175, delta=1)
+        self.assertAlmostEqual((rows.min() + rows.max()) / 2, 75, delta=1)
+
+    def test_spilled_polyline_is_blended_once(self):
+        """Test that a translucent polyline crossing the chunks of a spilled store has the same alpha at the joints."""
+        turtle = Turtle(memory_budget=2048)
+        turtle.set_pen_color('#ff000080')
+        turtle.set_line_thickness(3)
+        for _ in range(400):
+            turtle.forward(0.5)
+        self.assertGreater(len(list(turtle.get_drawing_data().chunks())), 1)
+        image = rasterize(turtle, width=200, height=200, background=None, draw_symbols=False)
+        alpha = image[5:95, 100, 3]     # Along the line, away from its ends
+        self.assertTrue((alpha == 128).all())
+
+    def test_encode_png(self):
+        """Test that the PNG encoder stores the image data losslessly."""
+        image = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+        data = encode_png(image)
+        self.assertTrue(data.startswith(b'\x89PNG\r\n\x1a\n'))
+        self.assertEqual(struct.unpack('>II', data[16:24]), (3, 2))
+
+        idat_length = struct.unpack('>I', data[33:37])[0]
+        rows = zlib.decompress(data[41:41 + idat_length])
+        self.assertEqual(rows, b'\x00' + image[0].tobytes() + b'\x00' + image[1].tobytes())
+
+        with self.assertRaises(ValueError):
+            encode_png(np.zeros((2, 2, 3), dtype=np.uint8))
+
+    def test_render_png(self):
+        """Test writing a PNG file to a file-like object."""
+        turtle = Turtle()
+        turtle.forward(50)
+        output = io.BytesIO()
+        timings = render_png(output, "Title", turtle, width=64, height=64)
+        self.assertTrue(output.getvalue().startswith(b'\x89PNG'))
+        self.assertIn('total', timings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from turtle_graphics.segments import SegmentStore
+
+class TestSegmentStore(unittest.TestCase):
+    """Tests for the SegmentStore class."""
+
+    def setUp(self):
+        """Create a new SegmentStore object for each test."""
+        self.store = SegmentStore()
+
+    def test_add_segment_and_index(self):
+        """Test that segments are returned as the legacy line tuples."""
+        self.store.add_segment(0, 0, 10, 5, 'red', 2)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store[0], ((0.0, 0.0), (10.0, 5.0), 'red', 2))
+        self.assertEqual(self.store[-1], self.store[0])
+        with self.assertRaises(IndexError):
+            self.store[1]
+
+    def test_iteration_and_slicing(self):
+        """Test iterating and slicing the store."""
+        self.store.add_segment(0, 0, 1, 1, 'red', 1)
+        self.store.add_segment(1, 1, 2, 2, 'blue', 1)
+        self.assertEqual(list(self.store), self.store[:])
+        self.assertEqual([line[2] for line in self.store], ['red', 'blue'])
+
+    def test_styles_are_interned(self):
+        """Test that repeated styles share a single entry in the style table."""
+        self.store.add_segment(0, 0, 1, 1, 'red', 1)
+        self.store.add_segment(1, 1, 2, 2, 'blue', 1)
+        self.store.add_segment(2, 2, 3, 3, 'red', 1)
+        vertices, run_starts, run_styles, styles, run_arcs, arcs = self.store.arrays()
+        self.assertEqual(styles, [('red', 1), ('blue', 1)])
+        self.assertEqual(list(run_styles), [0, 1, 0])
+
+    def test_connected_segments_are_coalesced(self):
+        """Test that connected segments of the same style share one run."""
+        self.store.add_segment(0, 0, 1, 0, 'red', 1)
+        self.store.add_segment(1, 0, 1, 1, 'red', 1)
+        self.store.add_segment(1, 1, 0, 1, 'red', 2)     # Style change
+        self.store.add_segment(5, 5, 6, 6, 'red', 2)     # Not connected
+        vertices, run_starts, run_styles, styles, run_arcs, arcs = self.store.arrays()
+        self.assertEqual(list(run_starts), [0, 3, 5])
+        self.assertEqual(len(vertices), 14)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.store[1], ((1.0, 0.0), (1.0, 1.0), 'red', 1))
+        self.assertEqual(self.store[2], ((1.0, 1.0), (0.0, 1.0), 'red', 2))
+        self.assertEqual(self.store[3], ((5.0, 5.0), (6.0, 6.0), 'red', 2))
+        self.assertEqual(list(self.store), self.store[:])
+
+    def test_add_polyline(self):
+        """Test appending polylines, continuing the last run when they are connected."""
+        self.store.add_segment(0, 0, 1, 0, 'red', 1)
+        self.store.add_polyline([1, 0, 2, 0, 3, 0], 'red', 1)
+        self.store.add_polyline([0, 0, 0, 1], 'red', 1)
+        self.assertEqual(list(self.store.run_starts), [0, 4])
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.store[2], ((2.0, 0.0), (3.0, 0.0), 'red', 1))
+
+    def test_to_numpy_segments(self):
+        """Test converting the runs back into individual segments."""
+        self.store.add_polyline([0, 0, 1, 0, 1, 1], 'red', 1)
+        self.store.add_segment(5, 5, 6, 6, 'blue', 1)
+        segments, style_ids = self.store.to_numpy_segments()
+        self.assertEqual(segments.shape, (3, 2, 2))
+        self.assertEqual(segments[2].tolist(), [[5, 5], [6, 6]])
+        self.assertEqual(style_ids.tolist(), [0, 0, 1])
+
+    def test_polylines_since(self):
+        """Test getting only the lines added after a given point, continuing the last old run first."""
+        self.store.add_polyline([0, 0, 1, 0, 1, 1], 'red', 1)
+        vertex_count, run_count = len(self.store.vertices) // 2, len(self.store.run_starts)
+        self.assertEqual(self.store.polylines_since(vertex_count, run_count), [])
+        self.store.add_segment(1, 1, 2, 2, 'red', 1)
+        self.store.add_segment(5, 5, 6, 6, 'blue', 1)
+        polylines = [(list(coords), style) for coords, style in self.store.polylines_since(vertex_count, run_count)]
+        self.assertEqual(polylines, [([1, 1, 2, 2], 0), ([5, 5, 6, 6], 1)])
+        self.assertEqual(len(self.store.polylines_since(0, 0)), 2)
+
+    def test_from_arrays(self):
+        """Test rebuilding a store from its arrays, which new lines can continue."""
+        self.store.add_polyline([0, 0, 1, 0, 1, 1], 'red', 1)
+        self.store.add_arc(0, 0, 10, 0, 90, 6, 'blue', 2)
+        self.store.add_segment(5, 5, 6, 6, 'red', 1)
+        copy = SegmentStore.from_arrays(self.store.arrays())
+        self.assertEqual(list(copy), list(self.store))
+        self.assertEqual(len(copy), 9)
+        copy.add_segment(6, 6, 7, 7, 'red', 1)
+        self.assertEqual(len(copy.run_starts), 3)
+        self.assertEqual(copy[-1], ((6.0, 6.0), (7.0, 7.0), 'red', 1))
+
+    def test_add_arc(self):
+        """Test that an arc reads as its recorded number of segments but is stored exactly."""
+        self.store.add_segment(-20, 0, -10, 0, 'red', 1)
+        self.store.add_arc(0, 0, 10, 180, -180, 4, 'red', 1)
+        self.store.add_segment(10, 0, 20, 0, 'red', 1)
+        self.assertEqual(len(self.store), 6)
+        self.assertEqual(len(self.store.run_starts), 3)
+        self.assertEqual(len(self.store.vertices), 12)
+
+        start, end, color, thickness = self.store[2]
+        self.assertAlmostEqual(start[0], -10 / 2 ** 0.5)
+        self.assertAlmostEqual(end[1], 10)
+        self.assertEqual(list(self.store)[2], self.store[2])
+        self.assertEqual(self.store[5], ((10.0, 0.0), (20.0, 0.0), 'red', 1))
+
+    def test_arc_tolerance(self):
+        """Test that arcs are turned into as many lines as the tolerance requires."""
+        self.store.add_arc(0, 0, 100, 0, 360, 8, 'red', 1)
+        coarse, _ = self.store.to_numpy_segments()
+        fine, _ = self.store.to_numpy_segments(tolerance=0.01)
+        self.assertEqual(len(coarse), 8)
+        self.assertGreater(len(fine), 100)
+        self.assertAlmostEqual(max(abs((fine ** 2).sum(axis=2) ** 0.5 - 100).ravel()), 0)
+
+    def test_arrays_support_buffer_protocol(self):
+        """Test that the vertex array can be viewed without copying."""
+        self.store.add_segment(0, 0, 1, 2, 'red', 1)
+        view = memoryview(self.store.arrays().vertices)
+        self.assertEqual(view.tolist(), [0.0, 0.0, 1.0, 2.0])
+        view.release()
+
+    def test_clear(self):
+        """Test clearing the store."""
+        self.store.add_segment(0, 0, 1, 1, 'red', 1)
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.styles, [])
+
+    def test_truncate(self):
+        """Test that truncating to a marker removes the lines, arcs and styles added since, and nothing else."""
+        self.store.add_segment(0, 0, 1, 0, 'black', 1)
+        mark = self.store.mark()
+        expected = list(self.store)
+        generation = self.store.generation
+        self.store.truncate(mark)
+        self.assertEqual(self.store.generation, generation)     #Nothing was removed
+        self.store.add_segment(1, 0, 1, 1, 'black', 1)
+        self.store.add_arc(0, 0, 5, 0, 90, 4, 'red', 2)
+        self.store.add_polyline([9, 9, 8, 8, 7, 7], 'black', 1)
+        self.store.truncate(mark)
+        self.assertEqual(list(self.store), expected)
+        self.assertEqual((len(self.store.vertices), len(self.store.arcs), self.store.styles), (4, 0, [('black', 1)]))
+        self.assertEqual(self.store.generation, generation + 1)
+        self.store.add_segment(1, 0, 2, 0, 'blue', 1)
+        self.assertEqual(self.store.style_id('blue', 1), 1)
+        self.store.clear()
+        with self.assertRaises(ValueError):
+            self.store.truncate(mark)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import math
+import unittest
+import numpy as np
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.spatial import SegmentGrid, get_index
+
+class TestSpatial(unittest.TestCase):
+    """Tests for the spatial index over the segments of a turtle."""
+
+    def setUp(self):
+        """Draw a random walk and a long diagonal line, and index them."""
+        rng = np.random.default_rng(0)
+        self.turtle = Turtle()
+        for _ in range(10):
+            self.turtle.pen_up()
+            self.turtle.goto(*rng.uniform(-150, 150, 2).tolist())
+            self.turtle.pen_down()
+            self.turtle.walk(rng.uniform(-60, 60, 500), rng.uniform(0, 1, 500))
+        self.turtle.goto(190, 190)
+        self.grid = get_index(self.turtle.get_drawing_data())
+
+    def brute_force_distances(self, x, y):
+        """Get the distance from a point to every segment, one segment at a time."""
+        distances = []
+        for (x0, y0), (x1, y1), _, _ in self.turtle.get_drawing_data():
+            dx, dy = x1 - x0, y1 - y0
+            length = dx * dx + dy * dy
+            t = min(max(((x - x0) * dx + (y - y0) * dy) / length, 0), 1) if length else 0
+            distances.append(math.hypot(x0 + t * dx - x, y0 + t * dy - y))
+        return distances
+
+    def test_query_rect(self):
+        """Test that a rectangle query finds exactly the segments crossing the rectangle."""
+        xmin, ymin, xmax, ymax = -20, 10, 35, 40
+        found = self.grid.query_rect(xmin, ymin, xmax, ymax)
+        self.assertGreater(len(found), 0)
+        for index, ((x0, y0), (x1, y1), _, _) in enumerate(self.turtle.get_drawing_data()):
+            # Sample the segment finely: any sample inside the rectangle means it crosses it
+            crossing = any(xmin <= x0 + (x1 - x0) * k / 200 <= xmax and ymin <= y0 + (y1 - y0) * k / 200 <= ymax
+                           for k in range(201))
+            if crossing:
+                self.assertIn(index, found)
+        self.assertEqual(len(self.grid.query_rect(300, 300, 400, 400)), 0)
+
+    def test_long_segment_is_found(self):
+        """Test that a segment crossing many cells is found in any of them."""
+        last = len(self.turtle.get_drawing_data()) - 1
+        self.assertIn(last, self.grid.query_rect(170, 170, 175, 175))
+
+    def test_nearest(self):
+        """Test that the nearest segment query matches a brute-force search."""
+        for x, y in ((0, 0), (120, -80), (-300, 250), (190, 190)):
+            distances = self.brute_force_distances(x, y)
+            index, distance = self.grid.nearest(x, y)
+            self.assertAlmostEqual(distance, min(distances))
+            self.assertAlmostEqual(distances[index], min(distances))
+
+    def test_index_is_cached_until_the_drawing_changes(self):
+        """Test that the index is only built again once lines have been added or removed."""
+        store = self.turtle.get_drawing_data()
+        self.assertIs(get_index(store), self.grid)
+        self.turtle.forward(-5)
+        self.assertIsNot(get_index(store), self.grid)
+        self.turtle.reset()
+        self.assertEqual(len(get_index(store)), 0)
+        self.assertEqual(get_index(store).nearest(0, 0), (-1, math.inf))
+
+    def test_index_is_cached_per_tolerance_level(self):
+        """Test that a store with arcs keeps one grid per power of two of the tolerance, finer than asked."""
+        turtle = Turtle(record_arcs=True)
+        turtle.circle(100)
+        store = turtle.get_drawing_data()
+        fine, coarse = get_index(store, 0.01), get_index(store, 1)
+        for _ in range(3):
+            self.assertIs(get_index(store, 0.01), fine)
+            self.assertIs(get_index(store, 1), coarse)
+        self.assertIs(get_index(store, 1.5), coarse)
+        self.assertGreater(len(fine), len(coarse))
+        self.assertEqual(len(coarse), len(SegmentGrid.from_store(store, 1)))
+
+    def test_explicit_cell_size(self):
+        """Test building a grid from raw segments with a given cell size."""
+        grid = SegmentGrid([[(0, 0), (10, 0)], [(0, 5), (0, 15)]], cell_size=2)
+        self.assertEqual(grid.shape, (6, 8))
+        self.assertEqual(grid.query_rect(-1, 9, 1, 20).tolist(), [1])
+        self.assertEqual(grid.nearest(6, 1), (0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
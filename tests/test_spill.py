@@ -0,0 +1,151 @@
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+import numpy as np
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.segments import SegmentStore
+from turtle_graphics.spill import SpillingSegmentStore
+
+def spiral(turtle, steps=3000):
+    """Draw a spiral of short lines with a few arcs and colour changes."""
+    for i in range(steps):
+        turtle.forward(1)
+        turtle.left(3.01)
+        if i % 500 == 0:
+            turtle.set_pen_color('red' if i % 1000 else 'blue')
+            turtle.circle(10, 200)
+
+class TestSpillingSegmentStore(unittest.TestCase):
+    """Tests for the segment store spilling lines to disk."""
+
+    def setUp(self):
+        """Draw the same spiral with a small memory budget and without one, recording arcs exactly."""
+        self.turtle = Turtle(memory_budget=20_000, record_arcs=True)
+        self.expected = Turtle(record_arcs=True)
+        spiral(self.turtle)
+        spiral(self.expected)
+        self.store = self.turtle.get_drawing_data()
+
+    def test_spills_and_reads_whole_drawing(self):
+        """Test that full chunks are spilled and that every line is still read, in order."""
+        expected = self.expected.get_drawing_data()
+        self.assertIsInstance(self.store, SpillingSegmentStore)
+        self.assertGreater(len(list(self.store.chunks())), 1)
+        self.assertLess(self.store.nbytes, 20_000)
+        self.assertGreater(self.store.spilled_bytes, 0)
+        self.assertEqual(len(self.store), len(expected))
+        self.assertEqual(list(self.store), list(expected))
+        self.assertEqual(self.store[::97], expected[::97])
+        self.assertEqual(self.store[-1], expected[-1])
+        self.assertEqual(sum(len(chunk) for chunk in self.store.chunks()), len(expected))
+
+    def test_bulk_reads(self):
+        """Test that NumPy copies and merged arrays hold the whole drawing."""
+        segments, styles = self.store.to_numpy_segments()
+        expected_segments, expected_styles = self.expected.get_drawing_data().to_numpy_segments()
+        np.testing.assert_allclose(segments, expected_segments)
+        np.testing.assert_array_equal(styles, expected_styles)
+        merged = SegmentStore.from_arrays(self.store.arrays())
+        self.assertEqual(list(merged), list(self.expected.get_drawing_data()))
+
+    def test_renderers_stream_chunks(self):
+        """Test that the renderers and exporters draw every chunk."""
+        from turtle_graphics.drawing import render_to_file
+        from turtle_graphics.raster import rasterize
+        from turtle_graphics.svg import export_svg
+        from turtle_graphics.storage import load_drawing
+
+        image, expected = rasterize(self.turtle), rasterize(self.expected)
+        self.assertLess(np.mean(image != expected), 0.01)     #Only the joins between chunks may differ
+        svg = io.StringIO()
+        export_svg(svg, self.turtle)
+        self.assertGreater(len(svg.getvalue()), 10_000)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'spiral.tgd')
+            self.turtle.save_drawing_data(path)
+            loaded, = load_drawing(path, mmap=False)
+            self.assertEqual(list(loaded.get_drawing_data()), list(self.expected.get_drawing_data()))
+        render_to_file(io.BytesIO(), "Spiral", self.turtle, format='png')
+
+    def test_tiles_follow_spills(self):
+        """Test that tiles rendered before lines are spilled are rendered again with every line drawn since."""
+        from matplotlib import image as mpimg
+        from turtle_graphics.tiles import TileRenderer
+        from turtle_graphics.spatial import get_index
+
+        def draw(turtle, steps):
+            turtle.pen_up()
+            turtle.goto(100, 100)
+            turtle.pen_down()
+            spiral(turtle, steps)
+
+        turtle, expected = Turtle(memory_budget=4096), Turtle()
+        spiral(turtle, 100)
+        spiral(expected, 100)
+        tiles = TileRenderer(turtle, tile_size=64)
+        before = tiles.render_tile(1, 1, 0)
+        store = turtle.get_drawing_data()
+        generation, chunks = store.generation, len(store._chunks)
+        draw(turtle, 300)
+        draw(expected, 300)
+        self.assertGreater(len(store._chunks), chunks)
+        self.assertGreater(store.generation, generation)
+
+        fresh, reference = TileRenderer(turtle, tile_size=64), TileRenderer(expected, tile_size=64)
+        for column in range(2):
+            for row in range(2):
+                image = tiles.render_tile(1, column, row)
+                self.assertEqual(image, fresh.render_tile(1, column, row))
+                pixels = mpimg.imread(io.BytesIO(image))
+                expected_pixels = mpimg.imread(io.BytesIO(reference.render_tile(1, column, row)))
+                self.assertLess(np.mean(np.abs(pixels - expected_pixels)), 0.01)     #Only the joins between chunks may differ
+        self.assertNotEqual(tiles.render_tile(1, 1, 0), before)
+        # The spatial grids of the chunks are kept between renders, the one of the chunk in memory included
+        self.assertIs(list(store.chunks())[-1], list(store.chunks())[-1])
+        self.assertEqual(len(get_index(store)), len(store))
+
+    def test_memory_stays_bounded(self):
+        """Test that recording a long drawing keeps about the memory budget in memory."""
+        tracemalloc.start()
+        try:
+            turtle = Turtle(memory_budget=50_000)
+            spiral(turtle, 40_000)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(len(turtle.get_drawing_data()), 40_000)
+        self.assertGreater(turtle.get_drawing_data().spilled_bytes, 500_000)
+        self.assertLess(peak, 500_000)
+
+    def test_restore_across_spills(self):
+        """Test that restoring a checkpoint taken before spills drops the chunks spilled since."""
+        expected = list(self.store)
+        chunks = len(list(self.store.chunks()))
+        self.turtle.checkpoint()
+        spiral(self.turtle, 2000)
+        self.assertGreater(len(list(self.store.chunks())), chunks)
+        self.turtle.restore()
+        self.assertEqual(list(self.store), expected)
+        self.assertEqual(len(list(self.store.chunks())), chunks)
+        spiral(self.turtle, 10)
+        spiral(self.expected, 10)
+        self.assertEqual(list(self.store), list(self.expected.get_drawing_data()))
+
+    def test_reset_and_invalid_budgets(self):
+        """Test that resetting drops the spilled chunks, and that budgets must be positive integers."""
+        generation = self.store.generation
+        self.turtle.reset()
+        self.assertEqual((len(self.store), self.store.spilled_bytes, list(self.store.chunks())), (0, 0, []))
+        self.assertEqual(self.store.generation, generation + 1)
+        self.turtle.goto(0, 10)
+        self.assertEqual(self.store[0], ((0, 0), (0, 10), 'black', 1))
+        with self.assertRaises(TypeError):
+            Turtle(memory_budget=1e6)
+        with self.assertRaises(ValueError):
+            Turtle(memory_budget=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
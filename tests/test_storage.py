@@ -0,0 +1,143 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.segments import SegmentStore
+from turtle_graphics.storage import save_drawing, load_drawing, load_stores, HEADER, MAGIC
+
+class TestStorage(unittest.TestCase):
+    """Tests for the binary drawing files."""
+
+    def setUp(self):
+        """Create a temporary folder and two turtles with lines, arcs and several styles."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'drawing.tgd')
+        self.first = Turtle("First", x=10, y=-20, record_arcs=True)
+        self.first.forward(50)
+        self.first.set_pen_color('red')
+        self.first.circle(30, 270)
+        self.first.set_line_thickness(3)
+        self.first.goto(-40, 60)
+        self.second = Turtle("Second", line_color='blue')
+        for _ in range(4):
+            self.second.forward(20)
+            self.second.right(90)
+        self.second.pen_up()
+
+    def tearDown(self):
+        """Delete the temporary folder."""
+        self.folder.cleanup()
+
+    def assertSameTurtle(self, turtle, expected):
+        """Assert that two turtles hold the same lines and are in the same state."""
+        self.assertEqual(list(turtle.get_drawing_data()), list(expected.get_drawing_data()))
+        self.assertEqual(turtle.get_drawing_data().to_numpy_polylines()[0].tolist(),
+                         expected.get_drawing_data().to_numpy_polylines()[0].tolist())
+        for name in ('name', 'x', 'y', 'angle', 'is_pen_down', 'line_color', 'line_thickness', 'record_arcs',
+                     'boundary', 'bounds'):
+            self.assertEqual(getattr(turtle, name), getattr(expected, name))
+
+    def test_round_trip(self):
+        """Test that turtles come back with the same lines, arcs, styles and state, mapped or copied."""
+        size = save_drawing(self.path, self.first, self.second)
+        self.assertEqual(size, os.path.getsize(self.path))
+        for mmap in (True, False):
+            first, second = load_drawing(self.path, mmap=mmap)
+            self.assertSameTurtle(first, self.first)
+            self.assertSameTurtle(second, self.second)
+
+    def test_mapped_stores_copy_on_write(self):
+        """Test that mapped stores use the file in place until lines are added or removed, and are then copied."""
+        save_drawing(self.path, self.second)
+        store, = load_stores(self.path)
+        self.assertIsInstance(store.vertices, memoryview)
+        self.assertTrue(store.vertices.readonly)
+        vertices = store.to_numpy_polylines()[0]
+        self.assertFalse(vertices.flags.writeable)
+        self.assertFalse(vertices.flags.owndata)
+        store.add_segment(0, 0, 1, 1, 'black', 1)
+        self.assertNotIsInstance(store.vertices, memoryview)
+        self.assertEqual(list(store), list(self.second.get_drawing_data()) + [((0, 0), (1, 1), 'black', 1)])
+        self.assertEqual(vertices.tolist(), self.second.get_drawing_data().to_numpy_polylines()[0].tolist())
+
+        store, = load_stores(self.path)
+        store.truncate((0, 0, 0, 0, 0, None, None))
+        self.assertEqual(len(store), 0)
+
+        for mmap in (True, False):
+            turtle, = load_drawing(self.path, mmap=mmap)
+            turtle.pen_down()
+            turtle.checkpoint()
+            turtle.forward(5)
+            self.assertEqual(len(turtle.get_drawing_data()), len(self.second.get_drawing_data()) + 1)
+            turtle.undo()
+            self.assertEqual(list(turtle.get_drawing_data()), list(self.second.get_drawing_data()))
+            turtle = Turtle()
+            turtle.load_drawing_data(self.path, mmap=mmap)
+            turtle.forward(5)
+            self.assertEqual(len(turtle.get_drawing_data()), len(self.second.get_drawing_data()) + 1)
+
+    def test_unbounded_round_trip(self):
+        """Test that the boundary policy and the bounds of a turtle drawing off the screen are saved."""
+        turtle = Turtle("Far", boundary='unbounded')
+        turtle.forward(1000)
+        save_drawing(self.path, turtle)
+        loaded, = load_drawing(self.path)
+        self.assertSameTurtle(loaded, turtle)
+        self.assertEqual(loaded.bounds, (-200, -200, 200, 1000))
+
+    def test_stores_and_file_objects(self):
+        """Test that bare segment stores can be saved, to a file object, and come back as default turtles."""
+        store = SegmentStore()
+        store.add_polyline([0, 0, 5, 5, 10, 0], 'green', 2)
+        buffer = io.BytesIO()
+        save_drawing(buffer, store)
+        with open(self.path, 'wb') as file:
+            file.write(buffer.getvalue())
+        turtle, = load_drawing(self.path)
+        self.assertEqual(list(turtle.get_drawing_data()), list(store))
+        self.assertEqual((turtle.name, turtle.x, turtle.y), ("Turtle", 0, 0))
+
+    def test_turtle_methods(self):
+        """Test that a turtle saves its lines and loads the lines of any drawing in a file."""
+        self.first.save_drawing_data(self.path)
+        turtle = Turtle()
+        turtle.load_drawing_data(self.path)
+        self.assertEqual(list(turtle.get_drawing_data()), list(self.first.get_drawing_data()))
+        self.assertEqual((turtle.x, turtle.y), (0, 0))
+        turtle.forward(10)
+        self.assertEqual(len(turtle.get_drawing_data()), len(self.first.get_drawing_data()) + 1)
+
+        save_drawing(self.path, self.first, self.second)
+        turtle.load_drawing_data(self.path, index=1, mmap=True)
+        self.assertEqual(list(turtle.get_drawing_data()), list(self.second.get_drawing_data()))
+
+    def test_invalid_files(self):
+        """Test that files with another magic, a newer version or no header are rejected."""
+        save_drawing(self.path, self.second)
+        with open(self.path, 'rb') as file:
+            data = bytearray(file.read())
+        invalid = [b'PNG' + bytes(40), b'TG', HEADER.pack(b'XXXX', 1, 0, 0, 0, 0)]
+        struct.pack_into('<H', data, len(MAGIC), 99)
+        invalid.append(bytes(data))
+        for content in invalid:
+            with open(self.path, 'wb') as file:
+                file.write(content)
+            for mmap in (True, False):
+                with self.assertRaises(ValueError):
+                    load_drawing(self.path, mmap=mmap)
+
+    def test_render_loaded_drawing(self):
+        """Test that mapped turtles are rendered like the turtles that were saved."""
+        from turtle_graphics.drawing import render_to_file
+        save_drawing(self.path, self.first, self.second)
+        expected, rendered = io.BytesIO(), io.BytesIO()
+        render_to_file(expected, "Drawing", self.first, self.second, format='svg')
+        render_to_file(rendered, "Drawing", *load_drawing(self.path), format='svg')
+        self.assertEqual(len(rendered.getvalue()), len(expected.getvalue()))
+
+
+if __name__ == '__main__':
+    unittest.main()
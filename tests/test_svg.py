@@ -0,0 +1,84 @@
+import io
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.svg import SVGWriter, export_svg
+
+SVG_NAMESPACE = '{http://www.w3.org/2000/svg}'
+
+def paths(document):
+    """Get the path elements of an SVG document."""
+    return ET.fromstring(document).findall(f'.//{SVG_NAMESPACE}path')
+
+class TestSVG(unittest.TestCase):
+    """Tests for the streaming SVG exporter."""
+
+    def test_streaming_sink_coalesces_paths(self):
+        """Test that consecutive lines of the same style are joined into one path."""
+        turtle = Turtle()
+        output = io.StringIO()
+        writer = SVGWriter(output)
+        turtle.attach_sink(writer, record=False)
+        for _ in range(4):
+            turtle.forward(50)
+            turtle.right(90)
+        turtle.set_pen_color('red')
+        turtle.forward(10)
+        turtle.detach_sink(writer)
+        writer.close()
+
+        self.assertEqual(len(turtle.get_drawing_data()), 0)
+        self.assertEqual(writer.segments_written, 5)
+        elements = paths(output.getvalue())
+        self.assertEqual([element.get('stroke') for element in elements], ['black', 'red'])
+        self.assertEqual(elements[0].get('d').count('L'), 4)
+
+    def test_sink_with_recording(self):
+        """Test that lines are still recorded when requested and after detaching the sink."""
+        turtle = Turtle()
+        writer = SVGWriter(io.StringIO())
+        turtle.attach_sink(writer)
+        turtle.forward(10)
+        turtle.detach_sink(writer)
+        turtle.forward(10)
+        self.assertEqual(len(turtle.get_drawing_data()), 2)
+        self.assertEqual(writer.segments_written, 1)
+
+        with self.assertRaises(TypeError):
+            turtle.attach_sink(object())
+
+    def test_exact_arcs(self):
+        """Test that exact arcs are written as SVG arc commands."""
+        turtle = Turtle(record_arcs=True)
+        output = io.StringIO()
+        with SVGWriter(output) as writer:
+            turtle.attach_sink(writer, record=False)
+            turtle.circle(50)
+        self.assertEqual(writer.arcs_written, 1)
+        self.assertEqual(paths(output.getvalue())[0].get('d').count('A'), 2)
+
+    def test_max_path_vertices(self):
+        """Test that long paths are split to bound memory usage."""
+        turtle = Turtle()
+        output = io.StringIO()
+        with SVGWriter(output, max_path_vertices=3) as writer:
+            turtle.attach_sink(writer, record=False)
+            for _ in range(4):
+                turtle.forward(10)
+        self.assertEqual(len(paths(output.getvalue())), 2)
+
+    def test_export_svg_to_path(self):
+        """Test exporting recorded lines to an SVG file."""
+        turtle = Turtle()
+        turtle.forward(50)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "drawing.svg")
+            export_svg(path, "Title", turtle)
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(paths(file.read())[0].get('d'), 'M0 0L0 -50')
+
+
+if __name__ == "__main__":
+    unittest.main()
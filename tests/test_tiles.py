@@ -0,0 +1,90 @@
+import io
+import unittest
+from matplotlib import image as mpimg
+from turtle_graphics.turtle import Turtle
+from turtle_graphics.tiles import TileRenderer
+
+class TestTiles(unittest.TestCase):
+    """Tests for the tiled renderer and its cache."""
+
+    def setUp(self):
+        """Draw a square in the top left quarter of the canvas."""
+        self.turtle = Turtle()
+        self.turtle.pen_up()
+        self.turtle.goto(-150, 50)
+        self.turtle.pen_down()
+        for _ in range(4):
+            self.turtle.forward(100)
+            self.turtle.right(90)
+        self.tiles = TileRenderer(self.turtle, tile_size=64)
+
+    def test_tile_bounds(self):
+        """Test that tiles are numbered from the top left corner of the canvas."""
+        self.assertEqual(self.tiles.tile_bounds(0, 0, 0), (-200, -200, 200, 200))
+        self.assertEqual(self.tiles.tile_bounds(1, 0, 0), (-200, 0, 0, 200))
+        self.assertEqual(self.tiles.tile_bounds(2, 3, 3), (100, -200, 200, -100))
+        with self.assertRaises(ValueError):
+            self.tiles.tile_bounds(1, 2, 0)
+        with self.assertRaises(TypeError):
+            self.tiles.tile_bounds(1, 0.5, 0)
+
+    def test_render_tile_is_cached(self):
+        """Test that a tile is rendered once and then served from the cache."""
+        image = self.tiles.render_tile(1, 0, 0)
+        self.assertTrue(image.startswith(b'\x89PNG'))
+        self.assertIs(self.tiles.render_tile(1, 0, 0), image)
+        self.assertEqual((self.tiles.hits, self.tiles.misses), (1, 1))
+        self.assertEqual(self.tiles.nbytes, len(image))
+
+    def test_appending_only_invalidates_touched_tiles(self):
+        """Test that new lines only cause the tiles they touch to be rendered again."""
+        for column in range(2):
+            for row in range(2):
+                self.tiles.render_tile(1, column, row)
+        old_hash = self.tiles.content_hash
+
+        # A line in the bottom right quarter
+        self.turtle.pen_up()
+        self.turtle.goto(50, -50)
+        self.turtle.pen_down()
+        self.turtle.goto(150, -150)
+
+        self.assertNotEqual(self.tiles.content_hash, old_hash)
+        self.assertEqual(len(self.tiles), 3)
+        for column in range(2):
+            for row in range(2):
+                self.tiles.render_tile(1, column, row)
+        self.assertEqual((self.tiles.hits, self.tiles.misses), (3, 5))
+
+    def test_thick_line_along_tile_edge(self):
+        """Test that a thick line just outside a tile is drawn over its edge, so that no seam shows between tiles."""
+        turtle = Turtle()
+        turtle.set_line_thickness(20)
+        turtle.pen_up()
+        turtle.goto(-150, -2)
+        turtle.pen_down()
+        turtle.goto(-50, -2)
+        pixels = mpimg.imread(io.BytesIO(TileRenderer(turtle, tile_size=64).render_tile(1, 0, 0)))
+        # The bottom rows of the tile above the line are covered, the top rows are not
+        self.assertLess(pixels[-1, 32, 0], 0.5)
+        self.assertGreater(pixels[0, 32, 0], 0.5)
+
+    def test_removing_lines_clears_cache(self):
+        """Test that resetting a turtle invalidates every cached tile."""
+        self.tiles.render_tile(0, 0, 0)
+        self.turtle.reset()
+        self.tiles.render_tile(0, 0, 0)
+        self.assertEqual(self.tiles.misses, 2)
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used tiles are evicted to stay within max_bytes."""
+        image = self.tiles.render_tile(2, 0, 1)
+        tiles = TileRenderer(self.turtle, tile_size=64, max_bytes=2 * len(image) + 10)
+        for column in range(4):
+            tiles.render_tile(2, column, 1)
+        self.assertLessEqual(tiles.nbytes, tiles.max_bytes)
+        self.assertLess(len(tiles), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
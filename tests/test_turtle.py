@@ -1,6 +1,8 @@
+import math
 import unittest
-from turtle_graphics.turtle import Turtle
+from turtle_graphics.turtle import Turtle, BOUNDARY_POLICIES
 from turtle_graphics.config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from turtle_graphics.segments import SegmentStore
 
 class TestTurtle(unittest.TestCase):
     """Tests for the Turtle class."""
@@ -71,6 +73,20 @@ class TestTurtle(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.turtle.goto(SCREEN_LIMIT_X + 1, SCREEN_LIMIT_Y + 1)
 
+    def test_forward_past_the_limits_with_and_without_sinks(self):
+        """Test that forward past the screen limits raises before moving, alone or with a sink attached."""
+        sink = SegmentStore()
+        for attach in (False, True):
+            turtle = Turtle()
+            if attach:
+                turtle.attach_sink(sink)
+            turtle.forward(SCREEN_LIMIT_Y)
+            with self.assertRaises(ValueError):
+                turtle.forward(1)
+            self.assertEqual((round(turtle.x, 9), round(turtle.y, 9)), (0, SCREEN_LIMIT_Y))
+            self.assertEqual(len(turtle.get_drawing_data()), 1)
+        self.assertEqual(len(sink), 1)
+
     def test_goto(self):
         """Test the turtle's ability to go to a specific position."""
         self.turtle.goto(50, 75)
@@ -99,11 +115,251 @@ class TestTurtle(unittest.TestCase):
         self.turtle.set_turtle_color('green')
         self.assertEqual(self.turtle.turtle_color, 'green')
 
+    def test_drawing_data(self):
+        """Test the lines recorded by the turtle."""
+        self.turtle.set_pen_color('red')
+        self.turtle.goto(50, 75)
+        self.turtle.pen_up()
+        self.turtle.goto(0, 0)
+        self.assertEqual(list(self.turtle.get_drawing_data()), [((0, 0), (50, 75), 'red', 1)])
+        vertices, run_starts, run_styles, styles, run_arcs, arcs = self.turtle.get_drawing_arrays()
+        self.assertEqual(list(vertices), [0, 0, 50, 75])
+        self.assertEqual(styles[run_styles[0]], ('red', 1))
+
+    def test_square_is_one_run(self):
+        """Test that connected lines are recorded as a single polyline."""
+        for _ in range(4):
+            self.turtle.forward(50)
+            self.turtle.right(90)
+        self.assertEqual(len(self.turtle.get_drawing_data()), 4)
+        self.assertEqual(len(self.turtle.get_drawing_arrays().run_starts), 1)
+
+    def test_circle_matches_step_by_step_path(self):
+        """Test that the batched circle matches moving forward and turning right step by step."""
+        reference = Turtle()
+        steps = int(2 * math.pi * 30 / 10)
+        for _ in range(steps):
+            reference.forward(2 * math.pi * 30 / steps)
+            reference.right(180 / steps)
+
+        self.turtle.circle(30, 180)
+        self.assertEqual(len(self.turtle.get_drawing_data()), steps)
+        for line, expected in zip(self.turtle.get_drawing_data(), reference.get_drawing_data()):
+            for actual_point, expected_point in zip(line[:2], expected[:2]):
+                self.assertAlmostEqual(actual_point[0], expected_point[0])
+                self.assertAlmostEqual(actual_point[1], expected_point[1])
+        self.assertAlmostEqual(self.turtle.x, reference.x)
+        self.assertAlmostEqual(self.turtle.y, reference.y)
+        self.assertAlmostEqual(self.turtle.angle, reference.angle)
+
+    def test_circle_tolerance(self):
+        """Test that a smaller tolerance draws a circle with more lines."""
+        coarse, fine = Turtle(), Turtle()
+        coarse.circle(50, tolerance=1)
+        fine.circle(50, tolerance=0.01)
+        self.assertGreater(len(fine.get_drawing_data()), len(coarse.get_drawing_data()))
+        with self.assertRaises(ValueError):
+            self.turtle.circle(50, tolerance=0)
+
+    def test_circle_records_exact_arc(self):
+        """Test that circles are recorded as exact arcs when requested."""
+        turtle = Turtle(record_arcs=True)
+        turtle.circle(50)
+        turtle.forward(10)
+        store = turtle.get_drawing_data()
+        self.assertEqual(len(store.arcs), 6)
+        self.assertEqual(len(store), int(2 * math.pi * 50 / 10) + 1)
+        self.assertAlmostEqual(turtle.x, 0)
+        self.assertAlmostEqual(turtle.y, 10)
+        self.assertAlmostEqual(turtle.angle % 360, 90)
+
+        turtle.circle(20, 90)
+        self.assertAlmostEqual(turtle.angle, 0)
+        with self.assertRaises(ValueError):
+            turtle.circle(150)
+
+    def test_exact_arcs_end_where_steps_end(self):
+        """Test that recording exact arcs does not change where the turtle ends, nor the lines read from the store."""
+        for radius, extent in ((40, 90), (40, -90), (25, 360), (30, 200), (20, 45)):
+            exact, steps = Turtle(record_arcs=True), Turtle()
+            for turtle in (exact, steps):
+                turtle.circle(radius, extent)
+                turtle.forward(10)
+            self.assertAlmostEqual(exact.x, steps.x)
+            self.assertAlmostEqual(exact.y, steps.y)
+            self.assertAlmostEqual(exact.angle, steps.angle)
+            for line, expected in zip(exact.get_drawing_data(), steps.get_drawing_data()):
+                for value, expected_value in zip(line[0] + line[1], expected[0] + expected[1]):
+                    self.assertAlmostEqual(value, expected_value)
+
+    def test_circle_outside_screen_limits(self):
+        """Test that a circle leaving the screen raises before anything is drawn."""
+        self.turtle.goto(SCREEN_LIMIT_X - 10, 0)
+        with self.assertRaises(ValueError):
+            self.turtle.circle(50)
+        self.assertEqual(len(self.turtle.get_drawing_data()), 1)
+        self.assertEqual(self.turtle.get_position(), (SCREEN_LIMIT_X - 10, 0))
+
+    def test_walk_matches_separate_calls(self):
+        """Test that a bulk walk draws the same path as turning and moving one command at a time."""
+        turns = [10 * k % 170 - 60 for k in range(50)]
+        distances = [1 + k % 7 for k in range(50)]
+        pens = [k % 5 != 0 for k in range(50)]
+        expected = Turtle(x=-20, y=10)
+        for turn, distance, pen in zip(turns, distances, pens):
+            expected.pen_down() if pen else expected.pen_up()
+            expected.left(turn)
+            expected.forward(distance)
+
+        turtle = Turtle(x=-20, y=10)
+        xs, ys = turtle.walk(turns, distances, pens)
+        self.assertEqual(len(xs), 51)
+        self.assertAlmostEqual(xs[-1], expected.x)
+        self.assertAlmostEqual(ys[-1], expected.y)
+        self.assertAlmostEqual(turtle.angle, expected.angle)
+        self.assertTrue(turtle.is_pen_down)
+        self.assertEqual(len(turtle.get_drawing_data()), len(expected.get_drawing_data()))
+        for line, expected_line in zip(turtle.get_drawing_data(), expected.get_drawing_data()):
+            for value, expected_value in zip(line[0] + line[1], expected_line[0] + expected_line[1]):
+                self.assertAlmostEqual(value, expected_value)
+
+    def test_walk_outside_screen_limits(self):
+        """Test that a bulk walk leaving the screen raises before anything is drawn."""
+        with self.assertRaises(ValueError):
+            self.turtle.walk([0] * 10, [50] * 10)
+        self.assertEqual(len(self.turtle.get_drawing_data()), 0)
+        self.assertEqual(self.turtle.get_position(), (0, 0))
+        with self.assertRaises(ValueError):
+            self.turtle.walk([0, 90], [10])
+        with self.assertRaises(TypeError):
+            self.turtle.walk(["left"], [10])
+
     def test_set_line_thickness(self):
         """Test setting the line thickness."""
         self.turtle.set_line_thickness(5)
         self.assertEqual(self.turtle.line_thickness, 5)
 
+    def test_checkpoint_restore(self):
+        """Test that restoring a checkpoint brings back the state and removes the lines drawn since, without copying."""
+        self.turtle.goto(0, 10)
+        before = list(self.turtle.get_drawing_data())
+        checkpoint = self.turtle.checkpoint()
+        for attempt in range(3):
+            self.turtle.set_pen_color('red')
+            self.turtle.set_line_thickness(attempt + 2)
+            self.turtle.left(45)
+            self.turtle.forward(20)
+            self.turtle.pen_up()
+            self.turtle.restore(checkpoint)
+            self.assertEqual(list(self.turtle.get_drawing_data()), before)
+            self.assertEqual(self.turtle.get_position(), (0, 10))
+            self.assertEqual((self.turtle.angle, self.turtle.is_pen_down, self.turtle.line_color), (90, True, 'black'))
+        self.assertEqual(self.turtle.get_drawing_data().styles, [('black', 1)])
+        # The store is cut back, so the next line continues the old run again
+        self.turtle.forward(10)
+        self.assertEqual(len(self.turtle.get_drawing_data().run_starts), 1)
+
+    def test_nested_checkpoints_and_undo(self):
+        """Test that checkpoints nest like a stack, and that undo pops them."""
+        outer = self.turtle.checkpoint()
+        self.turtle.goto(0, 10)
+        self.turtle.checkpoint()
+        self.turtle.right(90)
+        self.turtle.forward(10)
+        self.assertEqual(len(self.turtle.get_drawing_data()), 2)
+        self.turtle.undo(lines=False)       #Like the ] symbol: back to the saved state, keeping the lines
+        self.assertEqual((self.turtle.get_position(), self.turtle.angle), ((0, 10), 90))
+        self.assertEqual(len(self.turtle.get_drawing_data()), 2)
+        self.assertIs(self.turtle.undo(), outer)
+        self.assertEqual(len(self.turtle.get_drawing_data()), 0)
+        with self.assertRaises(ValueError):
+            self.turtle.undo()
+        with self.assertRaises(ValueError):
+            self.turtle.restore(outer)
+
+    def test_restore_drops_newer_checkpoints(self):
+        """Test that restoring an older checkpoint drops the newer ones, and that reset drops them all."""
+        first = self.turtle.checkpoint()
+        self.turtle.forward(10)
+        second = self.turtle.checkpoint()
+        self.turtle.forward(10)
+        self.turtle.restore(first)
+        with self.assertRaises(ValueError):
+            self.turtle.restore(second)
+        self.turtle.forward(5)
+        self.turtle.reset()
+        with self.assertRaises(ValueError):
+            self.turtle.restore(first)
+
+
+    def test_raise_boundary_moves_and_draws_nothing(self):
+        """Test that a move leaving the screen raises before the turtle draws or moves."""
+        self.turtle.goto(0, SCREEN_LIMIT_Y - 10)
+        with self.assertRaises(ValueError):
+            self.turtle.forward(20)
+        self.assertEqual(self.turtle.get_position(), (0, SCREEN_LIMIT_Y - 10))
+        self.assertEqual(len(self.turtle.get_drawing_data()), 1)
+
+    def test_raise_boundary_from_outside_the_screen(self):
+        """Test that a turtle created outside the screen can move back onto it, as only the destination is checked."""
+        turtle = Turtle(x=SCREEN_LIMIT_X + 100, y=0, init_angle=180)
+        with self.assertRaises(ValueError):
+            turtle.forward(50)
+        turtle.forward(150)
+        self.assertEqual([round(value, 9) for value in turtle.get_position()], [SCREEN_LIMIT_X - 50, 0])
+        self.assertEqual(len(turtle.get_drawing_data()), 1)
+        turtle = Turtle(x=0, y=-SCREEN_LIMIT_Y - 100)
+        turtle.goto(0, 0)
+        self.assertEqual(turtle.get_position(), (0, 0))
+
+    def test_clip_boundary(self):
+        """Test that lines are clipped to the screen while the turtle keeps its position outside it."""
+        turtle = Turtle(boundary='clip')
+        turtle.goto(0, SCREEN_LIMIT_Y + 50)
+        turtle.goto(0, 0)
+        turtle.walk([-90], [SCREEN_LIMIT_X * 2])
+        self.assertEqual(turtle.get_position(), (SCREEN_LIMIT_X * 2, 0))
+        self.assertEqual([line[:2] for line in turtle.get_drawing_data()],
+                         [((0, 0), (0, SCREEN_LIMIT_Y)), ((0, SCREEN_LIMIT_Y), (0, 0)), ((0, 0), (SCREEN_LIMIT_X, 0))])
+
+    def test_wrap_boundary(self):
+        """Test that a turtle leaving the screen comes back on the opposite side."""
+        turtle = Turtle(boundary='wrap')
+        turtle.goto(SCREEN_LIMIT_X + 10, 0)
+        self.assertEqual(turtle.get_position(), (-SCREEN_LIMIT_X + 10, 0))
+        self.assertEqual([line[:2] for line in turtle.get_drawing_data()],
+                         [((0, 0), (SCREEN_LIMIT_X, 0)), ((-SCREEN_LIMIT_X, 0), (-SCREEN_LIMIT_X + 10, 0))])
+        turtle.circle(SCREEN_LIMIT_X)
+        x, y = turtle.get_position()
+        self.assertAlmostEqual(x, -SCREEN_LIMIT_X + 10)
+        self.assertAlmostEqual(y, 0)
+        for start, end, _, _ in turtle.get_drawing_data():
+            for px, py in (start, end):
+                self.assertLessEqual(abs(px), SCREEN_LIMIT_X + 1e-9)
+                self.assertLessEqual(abs(py), SCREEN_LIMIT_Y + 1e-9)
+
+    def test_unbounded_boundary(self):
+        """Test that an unbounded turtle draws everywhere and keeps the bounds of where it went."""
+        turtle = Turtle(boundary='unbounded', record_arcs=True)
+        turtle.goto(0, SCREEN_LIMIT_Y * 3)
+        turtle.circle(10)
+        self.assertGreater(len(turtle.get_drawing_data()), 1)
+        self.assertEqual(turtle.get_drawing_data()[0][:2], ((0, 0), (0, SCREEN_LIMIT_Y * 3)))
+        _, cy, radius, _, _, _ = turtle.get_drawing_data().arc(0)
+        self.assertEqual(turtle.bounds, (-SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, cy + radius))
+        self.assertGreater(cy + radius, SCREEN_LIMIT_Y * 3 + 10)
+        turtle.reset()
+        self.assertEqual(turtle.bounds, (-SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y))
+
+    def test_invalid_boundary(self):
+        """Test that only the known boundary policies are accepted."""
+        self.assertEqual(self.turtle.boundary, 'raise')
+        for policy in BOUNDARY_POLICIES:
+            self.turtle.set_boundary(policy)
+        with self.assertRaises(TypeError):
+            Turtle(boundary=None)
+        with self.assertRaises(ValueError):
+            self.turtle.set_boundary('bounce')
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,231 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Batch rendering for Turtle Graphics Implementation in Python
+
+This module renders many drawings in one run. Running every drawing as its own script pays the start-up cost
+of Python and matplotlib every time, and opens a window. The batch runner reads a manifest of drawing jobs,
+runs them in a pool of worker processes that import matplotlib and the drawing modules once, when they start,
+writes every image without any GUI, and reports the time, number of line segments and error of every job.
+
+Manifest:
+    A JSON file holding a list of jobs, or an object with a "jobs" list and "defaults" shared by every job,
+    or a JSON lines file (.jsonl) with one job per line. A job has:
+        function (str): The drawing procedure as "module:function", e.g. "examples.example_4:draw_koch_snowflake".
+            It is called with a new Turtle followed by args and kwargs. If it returns a Turtle or a list of
+            Turtles, those are rendered instead of the one it was given.
+        output (str): The image file to write, relative to the manifest's folder. The format is taken from
+            the extension (png, svg or pdf).
+        args (list): Positional arguments passed on after the turtle. Optional.
+        kwargs (dict): Keyword arguments passed on. Optional.
+        turtle (dict): Turtle arguments, e.g. {"x": -100, "line_color": "blue"}. Optional.
+        title (str): The title of the image. Defaults to the function's name.
+        dpi (float), size (list[float]), simplify (bool): Passed on to render_to_file. Optional.
+        name (str): The name of the job in the report. Defaults to the output path.
+
+Functions:
+    load_manifest(path): Reads the jobs of a manifest.
+    run_job(job): Runs one job and reports how it went.
+    run_jobs(jobs, processes=None): Runs jobs in a pool of worker processes.
+    main(argv=None): The command-line entry point.
+
+Usage:
+    python -m turtle_graphics.batch manifest.json --processes 4 --report report.json
+
+    [
+        {"function": "examples.example_4:draw_koch_snowflake", "args": [100, 3], "output": "out/koch.png"},
+        {"function": "examples.example_5:draw_sierpinski", "kwargs": {"order": 5, "size": 200}, "output": "out/tri.svg"}
+    ]
+
+Note:
+    Modules are imported by name, so the modules of the jobs must be importable from the current folder,
+    e.g. by running the batch from the root of the project for the examples.
+
+Dependencies:
+    - argparse: Parses the command line.
+    - importlib: Imports the modules of the drawing procedures.
+    - json: Reads manifests and writes reports.
+    - os: Resolves output paths and counts the CPU cores.
+    - sys: Prints the summary.
+    - time: Measures the duration of every job.
+    - concurrent.futures: Provides the process pool.
+    - matplotlib: Switched to the non-interactive Agg backend while the jobs run.
+    - turtle: The turtles the jobs draw with.
+    - drawing: Writes the images.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+def load_manifest(path: str) -> list[dict]:
+    """Read the jobs of a manifest, with the defaults applied and the output paths made relative to the current folder.
+    Args:
+        path (str): The path of a .json or .jsonl manifest.
+    Returns:
+        list[dict]: The jobs.
+    Raises:
+        ValueError: If the manifest is not a list of jobs, or a job has no function or output.
+    """
+    with open(path, encoding='utf-8') as file:
+        if path.endswith('.jsonl'):
+            manifest = [json.loads(line) for line in file if line.strip()]
+        else:
+            manifest = json.load(file)
+    defaults = {}
+    if isinstance(manifest, dict):
+        defaults = manifest.get('defaults', {})
+        manifest = manifest.get('jobs')
+    if not isinstance(manifest, list):
+        raise ValueError(f"Invalid manifest: {path}. Expected a list of jobs or an object with a 'jobs' list.")
+
+    folder = os.path.dirname(path)
+    jobs = []
+    for index, job in enumerate(manifest):
+        job = {**defaults, **job}
+        if 'function' not in job or 'output' not in job:
+            raise ValueError(f"Invalid job {index} in {path}. Expected a 'function' and an 'output'.")
+        job['output'] = os.path.join(folder, job['output'])
+        job.setdefault('name', job['output'])
+        jobs.append(job)
+    return jobs
+
+
+def _resolve(function: str):
+    """Get a function from its "module:function" name.
+    Raises:
+        ValueError: If the name is not of the form "module:function".
+    """
+    module_name, separator, attributes = function.partition(':')
+    if not separator or not module_name or not attributes:
+        raise ValueError(f"Invalid function: {function}. Expected 'module:function'.")
+    target = importlib.import_module(module_name)
+    for attribute in attributes.split('.'):
+        target = getattr(target, attribute)
+    return target
+
+
+def run_job(job: dict) -> dict:
+    """Run one job: draw with a new turtle and write the image.
+    Errors are reported rather than raised, so that one broken job does not stop the others.
+    Args:
+        job (dict): The job, as read by load_manifest.
+    Returns:
+        dict: The job's name, function and output, its 'status' ('ok' or 'failed'), the 'segments' drawn,
+            the seconds spent drawing ('draw') and writing the image ('render'), and the 'error' if it failed.
+    """
+    from .turtle import Turtle
+    from .drawing import render_to_file
+
+    report = {'name': job['name'], 'function': job['function'], 'output': job['output'],
+              'status': 'failed', 'segments': 0, 'draw': 0.0, 'render': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        procedure = _resolve(job['function'])
+        turtle = Turtle(**job.get('turtle', {}))
+        result = procedure(turtle, *job.get('args', []), **job.get('kwargs', {}))
+        if isinstance(result, Turtle):
+            turtles = [result]
+        elif isinstance(result, (list, tuple)) and result and all(isinstance(t, Turtle) for t in result):
+            turtles = list(result)
+        else:
+            turtles = [turtle]
+        report['segments'] = sum(len(t.get_drawing_data()) for t in turtles)
+        drawn = time.perf_counter()
+        report['draw'] = drawn - start
+
+        folder = os.path.dirname(job['output'])
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        size = job.get('size')
+        render_to_file(job['output'], job.get('title', getattr(procedure, '__name__', job['function'])), *turtles,
+                       dpi=job.get('dpi', 100), size=tuple(size) if size is not None else None,
+                       simplify=job.get('simplify', False))
+        report['render'] = time.perf_counter() - drawn
+        report['status'] = 'ok'
+    except Exception as error:
+        report['error'] = f"{type(error).__name__}: {error}"
+        if not report['draw']:
+            report['draw'] = time.perf_counter() - start
+    return report
+
+
+def _warm_up() -> None:
+    """Prepare a worker process: no GUI, and matplotlib and the drawing modules imported before the first job."""
+    import matplotlib
+    matplotlib.use('Agg')       #Jobs calling draw_all_turtles must not open windows
+    from . import drawing, turtle     # noqa: F401
+
+
+def run_jobs(jobs: list[dict], processes: int = None) -> list[dict]:
+    """Run jobs in a pool of worker processes, each of which imports matplotlib once.
+    Args:
+        jobs (list[dict]): The jobs, as read by load_manifest.
+        processes (int): The number of worker processes. Defaults to the number of CPU cores, and never more than
+            the number of jobs. With 1, the jobs run one after the other in this process, whose matplotlib
+            backend is switched back once they are done.
+    Returns:
+        list[dict]: The report of every job, in the order of the jobs.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(min(processes, len(jobs)), 1)
+    if processes == 1:
+        # Switched to Agg for the jobs only, as this process is the caller's, which may be showing figures itself
+        import matplotlib
+        backend = matplotlib.get_backend()
+        _warm_up()
+        try:
+            return [run_job(job) for job in jobs]
+        finally:
+            matplotlib.use(backend)
+    # Jobs are sent in chunks, so that many small jobs do not wait on the pool between each other
+    chunksize = max(len(jobs) // (4 * processes), 1)
+    with ProcessPoolExecutor(max_workers=processes, initializer=_warm_up) as pool:
+        return list(pool.map(run_job, jobs, chunksize=chunksize))
+
+
+def main(argv: list[str] = None) -> int:
+    """Run the jobs of a manifest from the command line, printing one line per job and a summary.
+    Args:
+        argv (list[str]): The command-line arguments. Defaults to sys.argv[1:].
+    Returns:
+        int: The exit status: 0 if every job succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='python -m turtle_graphics.batch',
+                                     description="Render the turtle drawings listed in a manifest.")
+    parser.add_argument('manifest', help="JSON or JSON lines file listing the drawing jobs")
+    parser.add_argument('-j', '--processes', type=int, default=None,
+                        help="number of worker processes (default: number of CPU cores)")
+    parser.add_argument('-r', '--report', help="write the report of every job to this JSON file")
+    parser.add_argument('-q', '--quiet', action='store_true', help="only print the summary and the failed jobs")
+    options = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    reports = run_jobs(load_manifest(options.manifest), options.processes)
+    elapsed = time.perf_counter() - start
+
+    for report in reports:
+        if report['status'] != 'ok' or not options.quiet:
+            print(f"{report['status']:<6} {report['draw'] + report['render']:8.3f}s {report['segments']:>9} segments  "
+                  f"{report['name']}" + (f"  {report['error']}" if report['error'] else ''))
+    failed = sum(report['status'] != 'ok' for report in reports)
+    segments = sum(report['segments'] for report in reports)
+    print(f"{len(reports)} jobs, {len(reports) - failed} ok, {failed} failed, {segments} segments in {elapsed:.2f}s",
+          file=sys.stderr)
+    if options.report:
+        with open(options.report, 'w', encoding='utf-8') as file:
+            json.dump({'elapsed': elapsed, 'jobs': reports}, file, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,11 +5,15 @@ Drawing functionality for Turtle Graphics Implementation in Python
 
 This module provides functions to draw the Turtles' symbrol representation and paths created by their objects. 
 It includes the draw_all_turtles function, which takes multiple Turtle objects and 
-displays their paths on a single matplotlib plot.
+displays their paths on a single matplotlib plot, and the render_to_file function, which
+writes the same plot to an image file without any GUI event loop.
 
 Functions:
-    draw_symbol()
-    draw_all_turtles(*args): Draws the paths of all provided Turtle instances on a matplotlib plot.
+    symbol_vertices(turtle): Gets the vertices of the triangle representing a Turtle instance.
+    draw_symbol(turtle, ax): Draws the triangle representing a Turtle instance.
+    draw_lines(turtle, ax, tolerance=None, viewport=None, simplify=False): Draws the lines of a Turtle instance as one line collection per line style.
+    draw_all_turtles(*args, simplify=False): Draws the paths of all provided Turtle instances on a matplotlib plot.
+    render_to_file(target, *args, format=None, dpi=100, size=None, viewport=None, simplify=False): Writes the plot of all provided Turtle instances to a PNG/SVG/PDF file.
 
 Example:
     from turtle_graphics.turtle import Turtle
@@ -18,40 +22,186 @@ Example:
     t = Turtle()
     t.forward(100)
     draw_all_turtles("Example Drawing", t)
+    render_to_file("example.png", "Example Drawing", t, dpi=150)
 
 Dependencies:
-    - matplotlib: Used for rendering the graphical representation of the Turtle's and its path.
+    - matplotlib: Used for rendering the graphical representation of the Turtle's and its path. Imported on first use.
+    - numpy: Used to group the Turtle's lines by style without copying them one by one. Imported on first use.
     - math: Provides mathematical functions for calculations.
+    - time: Measures the duration of each render phase.
     - config: Provides the canvas size limits.
+    - spatial: Finds the lines visible in a viewport. Imported on first use.
+    - lod: Simplifies the lines to the resolution of the figure. Imported on first use.
 
 Author: Leonardo Alves Dias
 Version: 0.1
 License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
 """
 
-import matplotlib.pyplot as plt
 import math
+import os
+import time
 from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+# matplotlib, NumPy and the modules using them are imported by the functions that need them, so importing this
+# module stays cheap and headless programs never load a GUI backend. Python caches modules, so later calls are cheap.
 
-def draw_symbol(turtle, ax) -> None:
-    """Draw the symbol representing the turtle on the given axes.
+def symbol_vertices(turtle) -> list[tuple[float, float]]:
+    """Get the vertices of the triangle representing the turtle, pointing in its direction.
     Args:
         turtle: the turtle object to be represented via a symbol.
-        ax: The matplotlib axes to draw on.
+    Returns:
+        list[tuple[float, float]]: The three vertices of the triangle.
     """
-    # Draw a simple triangle to represent the turtle
     size = 5  # Size of the symbol
     angle_rad = math.radians(turtle.angle)
     # Calculate the vertices of the triangle
-    vertices = [
+    return [
         (turtle.x + size * math.cos(angle_rad), turtle.y + size * math.sin(angle_rad)),
         (turtle.x + size * math.cos(angle_rad + 2.0 * math.pi / 3), turtle.y + size * math.sin(angle_rad + 2.0 * math.pi / 3)),
         (turtle.x + size * math.cos(angle_rad + 4.0 * math.pi / 3), turtle.y + size * math.sin(angle_rad + 4.0 * math.pi / 3))
     ]
-    triangle = plt.Polygon(vertices, color=turtle.turtle_color)
+
+def draw_symbol(turtle, ax):
+    """Draw the symbol representing the turtle on the given axes.
+    Args:
+        turtle: the turtle object to be represented via a symbol.
+        ax: The matplotlib axes to draw on.
+    Returns:
+        Polygon: The triangle drawn, which can be moved later with set_xy.
+    """
+    from matplotlib.patches import Polygon
+    # Draw a simple triangle to represent the turtle
+    triangle = Polygon(symbol_vertices(turtle), color=turtle.turtle_color)
     ax.add_patch(triangle)
+    return triangle
+
+def draw_lines(turtle, ax, tolerance: float = None, viewport: tuple[float, float, float, float] = None,
+               simplify: bool = False) -> None:
+    """Draw the lines of a turtle on the given axes, batched by line style.
+    One LineCollection artist is created per distinct (color, thickness) style, holding one polyline per run
+    of connected lines, so the rendering cost depends on the number of styles rather than on the number of lines.
+    Args:
+        turtle: the turtle object whose lines are drawn.
+        ax: The matplotlib axes to draw on.
+        tolerance (float): The largest distance allowed between an exact arc and the lines drawn for it.
+            When None, arcs are drawn with the number of lines given when they were recorded.
+        viewport (tuple[float, float, float, float]): The visible region (xmin, ymin, xmax, ymax). When given, only
+            the line segments crossing it are drawn, found with the spatial index of the turtle's lines.
+        simplify (bool): Whether to simplify the polylines to the tolerance before drawing them, using the cached
+            levels of detail of the turtle's lines. Ignored when a viewport is given.
+    Raises:
+        ValueError: If simplify is True but no tolerance is given.
+    """
+    store = turtle.get_drawing_data()
+    if not len(store):
+        return
+    from matplotlib.collections import LineCollection
+    for style_index, polylines in _line_data(store, tolerance, viewport, simplify).items():
+        color, thickness = store.styles[style_index]
+        ax.add_collection(LineCollection(polylines, colors=color, linewidths=thickness))
+
+def _line_data(store, tolerance: float = None, viewport: tuple[float, float, float, float] = None,
+               simplify: bool = False) -> dict:
+    """Prepare the polylines of a segment store for drawing, grouped by line style.
+    Args:
+        store (SegmentStore): The store of a turtle.
+        tolerance, viewport, simplify: As for draw_lines.
+    Returns:
+        dict: style index: list of (n, 2) arrays, one per polyline.
+    Raises:
+        ValueError: If simplify is True but no tolerance is given.
+    """
+    # Stores that spill to disk are read one chunk at a time, so only one chunk is copied into NumPy at once
+    lines = {}
+    for chunk in store.chunks():
+        for style_index, polylines in _chunk_line_data(chunk, tolerance, viewport, simplify).items():
+            lines.setdefault(style_index, []).extend(polylines)
+    return lines
+
+def _chunk_line_data(store, tolerance: float = None, viewport: tuple[float, float, float, float] = None,
+                     simplify: bool = False) -> dict:
+    """Prepare the polylines of one chunk of a segment store for drawing, as for _line_data."""
+    import numpy as np
+    if viewport is not None:
+        from .spatial import get_index
+        grid = get_index(store, tolerance)
+        visible = grid.query_rect(*viewport)
+        if not len(visible):
+            return {}
+        segments, styles = grid.segments[visible], grid.segment_styles[visible]
+        # Visible segments that follow each other in the same run are joined back into polylines
+        joined = ((np.diff(visible) == 1) & (styles[1:] == styles[:-1])
+                  & np.all(segments[1:, 0] == segments[:-1, 1], axis=1))
+        bounds = np.concatenate(([0], np.flatnonzero(~joined) + 1, [len(visible)]))
+        polylines = [np.vstack((segments[start:end, 0], segments[end - 1, 1])) for start, end in zip(bounds[:-1], bounds[1:])]
+        polyline_styles = styles[bounds[:-1]]
+        return {int(style_index): [polylines[i] for i in np.flatnonzero(polyline_styles == style_index)]
+                for style_index in np.unique(polyline_styles)}
+
+    if simplify:
+        if tolerance is None:
+            raise ValueError("A tolerance is needed to simplify the lines.")
+        from .lod import get_lod
+        vertices, bounds, run_styles = get_lod(store, tolerance).level(tolerance)
+    else:
+        # The vertices are copied, so the turtle can keep drawing after rendering
+        vertices, bounds, run_styles = store.to_numpy_polylines(tolerance)
+    return {int(style_index): [vertices[bounds[run]:bounds[run + 1]] for run in np.flatnonzero(run_styles == style_index)]
+            for style_index in np.unique(run_styles)}
+
+def _split_title(args) -> tuple[str, tuple]:
+    """Split the arguments of the drawing functions into a title and the Turtle objects.
+    Args:
+        args: A list that may start with a title (str) followed by Turtle objects.
+    Returns:
+        tuple[str, tuple]: The title ("Turtle Drawing" if none is provided) and the Turtle objects.
+    """
+    if args and isinstance(args[0], str):
+        return args[0], args[1:]
+    return "Turtle Drawing", args
+
+def _scene_bounds(turtles) -> tuple[float, float, float, float]:
+    """Get the region showing the whole canvas, widened to fit the turtles that went beyond it.
+    Args:
+        turtles: The Turtle objects shown.
+    Returns:
+        tuple[float, float, float, float]: The region (xmin, ymin, xmax, ymax).
+    """
+    # Unbounded turtles keep the bounds of where they went
+    bounds = [getattr(turtle, 'bounds', (-SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)) for turtle in turtles]
+    xmin, ymin = min([-SCREEN_LIMIT_X] + [b[0] for b in bounds]), min([-SCREEN_LIMIT_Y] + [b[1] for b in bounds])
+    xmax, ymax = max([SCREEN_LIMIT_X] + [b[2] for b in bounds]), max([SCREEN_LIMIT_Y] + [b[3] for b in bounds])
+    return xmin, ymin, xmax, ymax
+
+def draw_scene(ax, title: str, turtles, viewport: tuple[float, float, float, float] = None,
+               simplify: bool = False) -> None:
+    """Draw the lines and symbols of the given turtles on the given axes.
+    Args:
+        ax: The matplotlib axes to draw on.
+        title (str): The title of the plot.
+        turtles: The Turtle objects to draw.
+        viewport (tuple[float, float, float, float]): The region (xmin, ymin, xmax, ymax) to show.
+            Defaults to the whole canvas, widened to fit the turtles that went beyond it. Only the lines crossing
+            a given viewport are drawn.
+        simplify (bool): Whether to simplify the lines to half a pixel of the figure before drawing them.
+    """
+    ax.set_title(title)
+    if viewport is not None:
+        xmin, ymin, xmax, ymax = viewport
+    else:
+        xmin, ymin, xmax, ymax = _scene_bounds(turtles)
+    # Exact arcs are turned into lines accurate to half a pixel of the figure
+    figure = ax.get_figure()
+    tolerance = (xmax - xmin) / (2 * figure.get_figwidth() * figure.dpi)
+    for turtle in turtles:
+        draw_lines(turtle, ax, tolerance, viewport, simplify)
+        draw_symbol(turtle, ax)
+
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+    ax.set_aspect('equal', adjustable='box')
 
-def draw_all_turtles(*args) -> None:
+def draw_all_turtles(*args, simplify: bool = False) -> None:
     """
     Draw all provided turtles on a matplotlib plot.
     This function takes an optional title followed by multiple Turtle objects,
@@ -59,29 +209,64 @@ def draw_all_turtles(*args) -> None:
     matplotlib plot.
     Args:
         args: A list that may start with a title (str) followed by Turtle objects.
+        simplify (bool): Whether to simplify the lines to half a pixel of the figure before drawing them,
+            which makes drawings with far more lines than pixels much faster to display again.
     Note:
         If no title is provided, "Turtle Drawing" is used as the default title.
         The function sets the plot limits to (-SCREEN_LIMIT, SCREEN_LIMIT) for both x and y axes,
-        assuming these as screen limits for the Turtle graphics.
+        assuming these as screen limits for the Turtle graphics, widened to the bounds of unbounded turtles.
     """
-    title = "Turtle Drawing"
-    turtles_start_index = 0
-
-    if args and isinstance(args[0], str):
-        title = args[0]
-        turtles_start_index = 1
+    import matplotlib.pyplot as plt
+    title, turtles = _split_title(args)
 
     plt.figure()
-    plt.title(title)
-    ax = plt.gca()
-    for turtle in args[turtles_start_index:]:
-        set_of_lines = turtle.get_drawing_data()
-        for line in set_of_lines:
-            start, end, color, thickness = line
-            plt.plot([start[0], end[0]], [start[1], end[1]], color=color, linewidth=thickness)
-        draw_symbol(turtle, ax)
+    draw_scene(plt.gca(), title, turtles, simplify=simplify)
+    plt.show()
+
+def render_to_file(target, *args, format: str = None, dpi: float = 100,
+                   size: tuple[float, float] = None, viewport: tuple[float, float, float, float] = None,
+                   simplify: bool = False) -> dict[str, float]:
+    """
+    Render all provided turtles straight to an image file, without a GUI.
+    The figure is built with the non-interactive Agg canvas and never registered with pyplot,
+    so no window or event loop is created, and it is cleared once written so that many renders
+    can run in one process without accumulating memory.
+    Args:
+        target: A file path or a binary file-like object to write the image to.
+        args: A list that may start with a title (str) followed by Turtle objects.
+        format (str): The image format ('png', 'svg' or 'pdf'). Defaults to the extension of a path target, or 'png'.
+        dpi (float): Resolution of the image in dots per inch.
+        size (tuple[float, float]): Width and height of the figure in inches. Defaults to matplotlib's figure size.
+        viewport (tuple[float, float, float, float]): The region (xmin, ymin, xmax, ymax) to render. Defaults to the
+            whole canvas. Only the lines crossing a given viewport are drawn.
+        simplify (bool): Whether to simplify the lines to half a pixel of the image before drawing them.
+    Returns:
+        dict[str, float]: Duration in seconds of each render phase ('prepare', 'draw', 'write') and the 'total'.
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    start = time.perf_counter()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    title, turtles = _split_title(args)
+    if format is None:
+        extension = os.path.splitext(target)[1] if isinstance(target, (str, os.PathLike)) else ''
+        format = str(extension).lstrip('.').lower() or 'png'
+    if format not in ('png', 'svg', 'pdf'):
+        raise ValueError(f"Unsupported image format: {format}. Expected 'png', 'svg' or 'pdf'.")
+
+    figure = Figure(figsize=size, dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    prepared = time.perf_counter()
+
+    draw_scene(ax, title, turtles, viewport, simplify)
+    drawn = time.perf_counter()
+
+    try:
+        figure.savefig(target, format=format, dpi=dpi)
+    finally:
+        figure.clear()
+    written = time.perf_counter()
 
-    plt.xlim(-SCREEN_LIMIT_X, SCREEN_LIMIT_X)
-    plt.ylim(-SCREEN_LIMIT_Y, SCREEN_LIMIT_Y)
-    plt.gca().set_aspect('equal', adjustable='box')
-    plt.show()
\ No newline at end of file
+    return {'prepare': prepared - start, 'draw': drawn - prepared, 'write': written - drawn, 'total': written - start}
\ No newline at end of file
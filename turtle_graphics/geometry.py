@@ -0,0 +1,343 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Geometry helpers for Turtle Graphics Implementation in Python
+
+This module provides the batched geometry used by the Turtle class to compute many vertices at once,
+instead of moving the turtle one step at a time. It uses NumPy when it is installed and falls back on
+plain Python otherwise, so the Turtle class keeps working with the standard library only.
+
+Functions:
+    get_numpy(): Returns the numpy module, or None if it is not installed.
+    circle_steps(radius, extent, tolerance=None): Number of line segments used to approximate a circle.
+    arc_steps(radius, extent, tolerance): Number of line segments needed to approximate an arc within a tolerance.
+    polygon_walk(x, y, angle, step_length, step_angle, steps): Vertices visited by repeatedly moving forward and turning right.
+    arc_points(cx, cy, radius, start_angle, extent, steps): Evenly spaced points on a circular arc.
+    arc_bounds(cx, cy, radius, start_angle, extent): Bounding box of a circular arc.
+    walk(x, y, angle, turns, distances): Positions visited by a sequence of turn-then-move commands.
+    clip_segments(x0, y0, x1, y1, xmin, ymin, xmax, ymax): Parts of many line segments inside a rectangle.
+    clip_polyline(coords, xmin, ymin, xmax, ymax): Parts of a polyline inside a rectangle.
+    wrap_point(x, y, xmin, ymin, xmax, ymax): Point moved into a rectangle whose opposite sides are joined.
+    wrap_polyline(coords, xmin, ymin, xmax, ymax): Parts of a polyline moved into a rectangle whose opposite sides are joined.
+
+Dependencies:
+    - math: Provides mathematical functions for calculations.
+    - numpy: Optional. Used to compute the vertices with array operations.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+
+_numpy = False      #Not looked up yet; None once it is known not to be installed
+
+def get_numpy():
+    """Import numpy the first time it is needed.
+    Returns:
+        The numpy module, or None if it is not installed.
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def circle_steps(radius: float, extent: float, tolerance: float = None) -> int:
+    """Get the number of line segments used to approximate a circle or an arc.
+    Args:
+        radius (float): The radius of the circle.
+        extent (float): The extent of the arc in degrees.
+        tolerance (float): The largest distance allowed between a line and the arc it approximates.
+            When None, one line is used per 10 units of circumference, as Turtle.circle has always done.
+    Returns:
+        int: The number of line segments, at least 1.
+    """
+    if tolerance is None:
+        return max(int(2 * math.pi * radius / 10), 1)
+
+    # The path of Turtle.circle is always 2 * pi * radius long, so it follows an arc of radius 360 * radius / extent
+    traced_radius = radius * 360 / abs(extent) if extent else radius
+    return arc_steps(traced_radius, extent, tolerance)
+
+
+def arc_steps(radius: float, extent: float, tolerance: float) -> int:
+    """Get the number of line segments needed to approximate a circular arc within a tolerance.
+    Args:
+        radius (float): The radius of the arc.
+        extent (float): The extent of the arc in degrees.
+        tolerance (float): The largest distance allowed between a line and the arc it approximates.
+    Returns:
+        int: The number of line segments, at least 1.
+    """
+    if tolerance >= radius:
+        return 1
+    # A chord spanning an angle a deviates from its arc by radius * (1 - cos(a / 2))
+    max_angle = 2 * math.acos(1 - tolerance / radius)
+    return max(math.ceil(math.radians(abs(extent)) / max_angle), 1)
+
+
+def polygon_walk(x: float, y: float, angle: float, step_length: float, step_angle: float, steps: int):
+    """Get the vertices visited by moving forward step_length and turning right step_angle, steps times.
+    Args:
+        x (float): X-coordinate of the starting point.
+        y (float): Y-coordinate of the starting point.
+        angle (float): The starting direction in degrees.
+        step_length (float): The distance moved at every step.
+        step_angle (float): The angle in degrees turned to the right after every step.
+        steps (int): The number of steps.
+    Returns:
+        A flat sequence of steps + 1 vertices (x, y), starting with (x, y): a NumPy array when NumPy is installed,
+        a list otherwise.
+    """
+    np = get_numpy()
+    if np is not None:
+        headings = np.radians(angle - step_angle * np.arange(steps))
+        coords = np.empty((steps + 1, 2))
+        coords[0] = x, y
+        coords[1:, 0] = step_length * np.cos(headings)
+        coords[1:, 1] = step_length * np.sin(headings)
+        np.cumsum(coords, axis=0, out=coords)
+        return coords.ravel()
+
+    coords = [x, y]
+    for k in range(steps):
+        heading = math.radians(angle - step_angle * k)
+        x += step_length * math.cos(heading)
+        y += step_length * math.sin(heading)
+        coords += (x, y)
+    return coords
+
+
+def arc_points(cx: float, cy: float, radius: float, start_angle: float, extent: float, steps: int):
+    """Get evenly spaced points on a circular arc.
+    Args:
+        cx (float): X-coordinate of the centre of the arc.
+        cy (float): Y-coordinate of the centre of the arc.
+        radius (float): The radius of the arc.
+        start_angle (float): Angle in degrees of the first point, seen from the centre.
+        extent (float): Angle in degrees covered by the arc, counterclockwise when positive.
+        steps (int): The number of line segments between the points.
+    Returns:
+        A flat sequence of steps + 1 points (x, y): a NumPy array when NumPy is installed, a list otherwise.
+    """
+    np = get_numpy()
+    if np is not None:
+        angles = np.radians(start_angle + extent * np.linspace(0, 1, steps + 1))
+        coords = np.empty((steps + 1, 2))
+        coords[:, 0] = cx + radius * np.cos(angles)
+        coords[:, 1] = cy + radius * np.sin(angles)
+        return coords.ravel()
+
+    coords = []
+    for k in range(steps + 1):
+        angle = math.radians(start_angle + extent * k / steps)
+        coords += (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+    return coords
+
+
+def arc_bounds(cx: float, cy: float, radius: float, start_angle: float, extent: float) -> tuple[float, float, float, float]:
+    """Get the bounding box of a circular arc.
+    Args:
+        cx (float): X-coordinate of the centre of the arc.
+        cy (float): Y-coordinate of the centre of the arc.
+        radius (float): The radius of the arc.
+        start_angle (float): Angle in degrees of the start of the arc, seen from the centre.
+        extent (float): Angle in degrees covered by the arc, counterclockwise when positive.
+    Returns:
+        tuple[float, float, float, float]: The smallest and largest x and y of the arc: (xmin, ymin, xmax, ymax).
+    """
+    low, high = sorted((start_angle, start_angle + extent))
+    angles = [low, high]
+    # The arc also reaches the extreme points of every multiple of 90 degrees it passes
+    angles += [90 * k for k in range(math.ceil(low / 90), math.floor(high / 90) + 1)]
+    xs = [cx + radius * math.cos(math.radians(angle)) for angle in angles]
+    ys = [cy + radius * math.sin(math.radians(angle)) for angle in angles]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def walk(x: float, y: float, angle: float, turns, distances):
+    """Get the positions visited by turning left then moving forward, once per command.
+    The headings are a cumulative sum of the turns, and the positions a cumulative sum of the moves.
+    Args:
+        x (float): X-coordinate of the starting point.
+        y (float): Y-coordinate of the starting point.
+        angle (float): The starting direction in degrees.
+        turns: The angle in degrees turned to the left before each move (negative to turn right).
+        distances: The distance moved forward by each command.
+    Returns:
+        tuple: The x and y coordinates of the n + 1 positions, starting with (x, y), as NumPy arrays
+            (lists when NumPy is not installed), and the final direction in degrees, between 0 and 360.
+    """
+    np = get_numpy()
+    if np is not None:
+        turns = np.asarray(turns, dtype=float)
+        distances = np.asarray(distances, dtype=float)
+        headings = np.radians(angle + np.cumsum(turns))
+        xs = np.empty(len(distances) + 1)
+        ys = np.empty(len(distances) + 1)
+        xs[0], ys[0] = x, y
+        np.cumsum(distances * np.cos(headings), out=xs[1:])
+        np.cumsum(distances * np.sin(headings), out=ys[1:])
+        xs[1:] += x
+        ys[1:] += y
+        return xs, ys, float((angle + turns.sum()) % 360)
+
+    xs, ys = [x], [y]
+    for turn, distance in zip(turns, distances):
+        angle = (angle + turn) % 360
+        x += distance * math.cos(math.radians(angle))
+        y += distance * math.sin(math.radians(angle))
+        xs.append(x)
+        ys.append(y)
+    return xs, ys, angle % 360
+
+
+def clip_segments(x0, y0, x1, y1, xmin: float, ymin: float, xmax: float, ymax: float):
+    """Find the part of every line segment inside a rectangle, with the Liang-Barsky algorithm.
+    The segment from (x0, y0) to (x1, y1) is the set of points (x0 + t * (x1 - x0), y0 + t * (y1 - y0)) for t in [0, 1].
+    Each side of the rectangle limits t from below or above, and the segment crosses the rectangle if some t is left.
+    Args:
+        x0, y0, x1, y1: NumPy arrays with the coordinates of the start and end of every segment.
+        xmin (float): Left side of the rectangle.
+        ymin (float): Bottom side of the rectangle.
+        xmax (float): Right side of the rectangle.
+        ymax (float): Top side of the rectangle.
+    Returns:
+        tuple: Arrays t0 and t1, the parameters where every segment enters and leaves the rectangle, and a boolean
+            array telling which segments cross it (t0 <= t1).
+    """
+    np = get_numpy()
+    dx, dy = x1 - x0, y1 - y0
+    t0 = np.zeros(np.shape(x0))
+    t1 = np.ones(np.shape(x0))
+    inside = np.ones(np.shape(x0), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in ((-dx, x0 - xmin), (dx, xmax - x0), (-dy, y0 - ymin), (dy, ymax - y0)):
+            # Parallel to this side: inside only if on the inner side of it
+            inside &= (p != 0) | (q >= 0)
+            ratio = q / p
+            t0 = np.where(p < 0, np.maximum(t0, ratio), t0)
+            t1 = np.where(p > 0, np.minimum(t1, ratio), t1)
+    return t0, t1, inside & (t0 <= t1)
+
+
+def _clip_segment(x0: float, y0: float, x1: float, y1: float, xmin: float, ymin: float, xmax: float, ymax: float):
+    """Find the part of one line segment inside a rectangle, with the Liang-Barsky algorithm in plain Python.
+    Returns:
+        tuple[float, float]: The parameters t0 < t1 where the segment enters and leaves the rectangle, or None.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x0 - xmin), (dx, xmax - x0), (-dy, y0 - ymin), (dy, ymax - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+        elif p < 0:
+            t0 = max(t0, q / p)
+        else:
+            t1 = min(t1, q / p)
+    return (t0, t1) if t0 < t1 else None
+
+
+def clip_polyline(coords, xmin: float, ymin: float, xmax: float, ymax: float) -> list:
+    """Find the parts of a polyline inside a rectangle.
+    Consecutive segments that stay inside the rectangle form one part, and the polyline is split wherever it leaves it.
+    Long polylines are clipped with NumPy in one pass over all their segments, and short ones in plain Python.
+    Args:
+        coords: Flat sequence (or NumPy array) of floats holding x, y for every vertex.
+        xmin (float): Left side of the rectangle.
+        ymin (float): Bottom side of the rectangle.
+        xmax (float): Right side of the rectangle.
+        ymax (float): Top side of the rectangle.
+    Returns:
+        list: The flat x, y coordinates of every part inside the rectangle, in order.
+    """
+    np = get_numpy()
+    if np is not None and len(coords) >= 32:      #Below about 16 segments, NumPy's overhead outweighs its speed
+        points = np.asarray(coords, dtype=float).reshape(-1, 2)
+        deltas = points[1:] - points[:-1]
+        t0, t1, crossing = clip_segments(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1], xmin, ymin, xmax, ymax)
+        crossing = np.flatnonzero(crossing & (t0 < t1))
+        if not len(crossing):
+            return []
+        starts = points[crossing] + t0[crossing, None] * deltas[crossing]
+        ends = points[crossing] + t1[crossing, None] * deltas[crossing]
+        # A segment continues the part of the one before if it leaves where that one went on inside
+        joined = (np.diff(crossing) == 1) & (t1[crossing[:-1]] == 1) & (t0[crossing[1:]] == 0)
+        bounds = np.concatenate(([0], np.flatnonzero(~joined) + 1, [len(crossing)]))
+        return [np.vstack((starts[start], ends[start:end])).ravel() for start, end in zip(bounds[:-1], bounds[1:])]
+
+    parts, part, last = [], None, None
+    for i in range(0, len(coords) - 2, 2):
+        x0, y0, x1, y1 = coords[i], coords[i + 1], coords[i + 2], coords[i + 3]
+        clipped = _clip_segment(x0, y0, x1, y1, xmin, ymin, xmax, ymax)
+        if clipped is None:
+            continue
+        t0, t1 = clipped
+        if part is None or t0 != 0 or last != i - 2:
+            part = [x0 + t0 * (x1 - x0), y0 + t0 * (y1 - y0)]
+            parts.append(part)
+        part += (x0 + t1 * (x1 - x0), y0 + t1 * (y1 - y0))
+        # Only a segment ending inside the rectangle can be continued by the next one
+        last = i if t1 == 1 else None
+    return parts
+
+
+def wrap_point(x: float, y: float, xmin: float, ymin: float, xmax: float, ymax: float) -> tuple[float, float]:
+    """Move a point into a rectangle whose opposite sides are joined, as on a torus.
+    Returns:
+        tuple[float, float]: The point, unchanged if it is inside the rectangle.
+    """
+    width, height = xmax - xmin, ymax - ymin
+    if not xmin <= x <= xmax:
+        x -= math.floor((x - xmin) / width) * width
+    if not ymin <= y <= ymax:
+        y -= math.floor((y - ymin) / height) * height
+    return x, y
+
+
+def wrap_polyline(coords, xmin: float, ymin: float, xmax: float, ymax: float) -> list:
+    """Split a polyline where it leaves a rectangle whose opposite sides are joined, as on a torus, and move every
+    part into the rectangle, so that leaving it on one side enters it again on the opposite side.
+    Args:
+        coords: Flat sequence (or NumPy array) of floats holding x, y for every vertex.
+        xmin (float): Left side of the rectangle.
+        ymin (float): Bottom side of the rectangle.
+        xmax (float): Right side of the rectangle.
+        ymax (float): Top side of the rectangle.
+    Returns:
+        list[list[float]]: The flat x, y coordinates of every part, inside the rectangle, in order.
+    """
+    width, height = xmax - xmin, ymax - ymin
+    px, py = float(coords[0]), float(coords[1])
+    wrapped_x, wrapped_y = wrap_point(px, py, xmin, ymin, xmax, ymax)
+    shift_x, shift_y = px - wrapped_x, py - wrapped_y       #Offset of the copy of the rectangle the polyline is in
+    parts, part = [], [wrapped_x, wrapped_y]
+    for i in range(2, len(coords) - 1, 2):
+        x1, y1 = float(coords[i]), float(coords[i + 1])
+        while not (xmin <= x1 - shift_x <= xmax and ymin <= y1 - shift_y <= ymax):
+            # The segment leaves this copy of the rectangle through the nearest side in its direction
+            dx, dy = x1 - px, y1 - py
+            tx = ((xmax if dx > 0 else xmin) + shift_x - px) / dx if dx else math.inf
+            ty = ((ymax if dy > 0 else ymin) + shift_y - py) / dy if dy else math.inf
+            t = min(tx, ty)
+            px, py = px + t * dx, py + t * dy
+            part += (px - shift_x, py - shift_y)
+            if part[0] != part[-2] or part[1] != part[-1] or len(part) > 4:
+                parts.append(part)
+            if tx <= ty:
+                shift_x += width if dx > 0 else -width
+            if ty <= tx:
+                shift_y += height if dy > 0 else -height
+            part = [px - shift_x, py - shift_y]
+        part += (x1 - shift_x, y1 - shift_y)
+        px, py = x1, y1
+    if len(part) >= 4:
+        parts.append(part)
+    return parts
@@ -0,0 +1,297 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Instrumentation for Turtle Graphics Implementation in Python
+
+This module tells where the time of a slow drawing goes. When enabled, it counts the calls to every Turtle method
+and times them, counts the line segments recorded in segment stores and the time spent recording them, and times
+every phase of rendering: preparing the line data, creating the matplotlib artists, laying out and drawing the
+figure, and writing the file. The figures are collected in a DrawingStats object, which can also be sent to a
+callback or a logger every few seconds.
+
+Instrumentation is switched on by replacing the methods of Turtle and SegmentStore, and the drawing functions,
+with wrappers that measure them, and switched off by putting the original functions back. When it is disabled
+the classes and modules hold their original functions, so it costs nothing at all.
+
+Classes:
+    DrawingStats: The counts and times collected while instrumentation is enabled.
+
+Functions:
+    enable(timing=True, renderers=True, callback=None, interval=1.0, log=False): Starts instrumenting.
+    disable(): Stops instrumenting.
+    instrumented(**options): Context manager instrumenting the code it runs.
+    get_stats(): Gets the stats being collected.
+
+Usage:
+    from turtle_graphics import instrument
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.drawing import render_to_file
+
+    with instrument.instrumented() as stats:
+        t = Turtle()
+        t.circle(50)
+        render_to_file("circle.png", t)
+    print(stats.calls['Turtle.circle'], stats.segments, stats.phases)
+
+Note:
+    Method times include the methods they call, e.g. Turtle.circle includes Turtle._emit_polyline, which includes
+    SegmentStore.add_polyline. The time of a Turtle method minus the time spent recording in the store is therefore
+    the time of its argument checks, geometry and boundary checks. Timing a call costs about as much as a short
+    method, so use timing=False to only count calls when measuring very hot loops.
+
+Dependencies:
+    - functools: Keeps the names and docstrings of the wrapped functions.
+    - logging: Optionally logs the stats.
+    - time: Measures the durations.
+    - weakref: Tracks the segment stores recorded into, without keeping them alive.
+    - turtle: The Turtle methods instrumented.
+    - segments: The SegmentStore methods instrumented.
+    - drawing: The drawing functions instrumented. matplotlib is imported when renderers are instrumented.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import logging
+import time
+import weakref
+from contextlib import contextmanager
+from functools import wraps
+from . import drawing
+from .segments import SegmentStore
+from .turtle import Turtle
+
+logger = logging.getLogger(__name__)
+
+class DrawingStats:
+    """The counts and times collected while instrumentation is enabled.
+    Attributes:
+        calls (dict[str, int]): The number of calls of every instrumented method, e.g. 'Turtle.forward'.
+        times (dict[str, float]): The seconds spent in every instrumented method, including the methods it calls.
+            Only collected with timing on.
+        segments (int): The number of line segments recorded in segment stores.
+        phases (dict[str, float]): The seconds spent in every render phase: 'data' (preparing the lines),
+            'artists' (creating the matplotlib artists), 'layout' (creating the figure, and matplotlib laying it out
+            and drawing it) and 'write' (encoding and writing the file).
+        renders (int): The number of figures drawn by matplotlib.
+    """
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.calls = {}
+        self.times = {}
+        self.segments = 0
+        self.phases = dict.fromkeys(('data', 'artists', 'layout', 'write'), 0.0)
+        self.renders = 0
+        self._stores = weakref.WeakSet()      #Stores recorded into, for drawing_bytes
+
+
+    @property
+    def drawing_bytes(self) -> int:
+        """The bytes of drawing data held by the segment stores recorded into, which are still alive."""
+        return sum(store.nbytes for store in self._stores)
+
+
+    def snapshot(self) -> dict:
+        """Get a copy of the stats as plain dictionaries and numbers, e.g. to save as JSON."""
+        return {'calls': dict(self.calls), 'times': dict(self.times), 'segments': self.segments,
+                'drawing_bytes': self.drawing_bytes, 'phases': dict(self.phases), 'renders': self.renders}
+
+
+    def reset(self) -> None:
+        """Set every count and time back to zero."""
+        self.__init__()
+
+
+    def __repr__(self) -> str:
+        calls = ', '.join(f"{name}={count}" for name, count in sorted(self.calls.items(), key=lambda item: -item[1])[:5])
+        phases = ', '.join(f"{phase}={seconds:.3f}s" for phase, seconds in self.phases.items())
+        return f"DrawingStats(calls: {calls}; segments={self.segments}, {self.drawing_bytes} bytes; {phases})"
+
+
+_stats = None           #The DrawingStats being collected, or None when disabled
+_originals = {}         #(owner, name): original function, for every function replaced by a wrapper
+_report = None          #(callback, interval, time of the last report)
+
+_TURTLE_METHODS = ('forward', 'backward', 'right', 'left', 'circle', '_arc', 'walk', '_emit_polyline', 'pen_up',
+                   'pen_down', 'goto', 'set_initial_angle', 'reset', 'set_pen_color', 'set_turtle_color', 'set_line_thickness')
+_STORE_METHODS = ('add_segment', 'add_polyline', 'add_arc')
+
+
+def _maybe_report() -> None:
+    """Send the stats to the callback if interval seconds have passed since the last report."""
+    global _report
+    callback, interval, last = _report
+    now = time.perf_counter()
+    if now - last >= interval:
+        _report = (callback, interval, now)
+        callback(_stats)
+
+
+def _method_wrapper(function, name: str, timing: bool):
+    """Wrap a method so that its calls are counted and, with timing, timed."""
+    stats = _stats
+    calls, times = stats.calls, stats.times
+    calls.setdefault(name, 0)
+    if not timing:
+        @wraps(function)
+        def counted(*args, **kwargs):
+            calls[name] += 1
+            if _report is not None:
+                _maybe_report()
+            return function(*args, **kwargs)
+        return counted
+
+    times.setdefault(name, 0.0)
+    perf_counter = time.perf_counter
+
+    @wraps(function)
+    def timed(*args, **kwargs):
+        calls[name] += 1
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            times[name] += perf_counter() - start
+            if _report is not None:
+                _maybe_report()
+    return timed
+
+
+def _store_wrapper(function, name: str, timing: bool):
+    """Wrap a SegmentStore method so that the segments it records are counted as well."""
+    stats = _stats
+    wrapped = _method_wrapper(function, name, timing)
+
+    @wraps(function)
+    def recording(store, *args, **kwargs):
+        before = len(store)
+        try:
+            return wrapped(store, *args, **kwargs)
+        finally:
+            stats.segments += len(store) - before
+            stats._stores.add(store)
+    return recording
+
+
+def _phase_wrapper(function, phase: str, nested_phase: str = None):
+    """Wrap a drawing function so that its time is added to a render phase.
+    The time of nested_phase spent within the call is left out of it, as it is counted in nested_phase already.
+    """
+    stats = _stats
+
+    @wraps(function)
+    def timed(*args, **kwargs):
+        nested = stats.phases[nested_phase] if nested_phase else 0.0
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if nested_phase:
+                elapsed -= stats.phases[nested_phase] - nested
+            stats.phases[phase] += elapsed
+    return timed
+
+
+def _render_wrapper(function):
+    """Wrap render_to_file so that the time of writing the file, without matplotlib's drawing, is timed."""
+    stats = _stats
+
+    @wraps(function)
+    def render(*args, **kwargs):
+        layout = stats.phases['layout']
+        timings = function(*args, **kwargs)
+        # Saving the figure draws it first, which Figure.draw already added to the layout phase
+        drawn = stats.phases['layout'] - layout
+        stats.phases['layout'] += timings['prepare']
+        stats.phases['write'] += timings['write'] - drawn
+        return timings
+    return render
+
+
+def _figure_wrapper(function):
+    """Wrap Figure.draw so that matplotlib's layout and drawing of every figure is timed."""
+    stats = _stats
+    wrapped = _phase_wrapper(function, 'layout')
+
+    @wraps(function)
+    def draw(*args, **kwargs):
+        stats.renders += 1
+        return wrapped(*args, **kwargs)
+    return draw
+
+
+def _replace(owner, name: str, wrapper) -> None:
+    """Replace a function of a class or module with a wrapper, keeping the original to put it back later."""
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _originals[owner, name] = original
+    setattr(owner, name, wrapper(original))
+
+
+def enable(timing: bool = True, renderers: bool = True, callback=None, interval: float = 1.0,
+           log: bool = False) -> DrawingStats:
+    """Start instrumenting Turtle, SegmentStore and, optionally, the renderers.
+    Args:
+        timing (bool): Whether to time the methods, or only count their calls.
+        renderers (bool): Whether to time the render phases. This imports matplotlib.
+        callback: A function called with the DrawingStats at most every interval seconds, after an instrumented call.
+        interval (float): The least number of seconds between two calls of the callback.
+        log (bool): Whether to log the stats at INFO level every interval seconds, when no callback is given.
+    Returns:
+        DrawingStats: The stats being collected.
+    Raises:
+        RuntimeError: If instrumentation is already enabled.
+    """
+    global _stats, _report
+    if _stats is not None:
+        raise RuntimeError("Instrumentation is already enabled.")
+    _stats = DrawingStats()
+    if callback is None and log:
+        callback = lambda stats: logger.info("%r", stats)
+    _report = (callback, interval, time.perf_counter()) if callback is not None else None
+
+    for name in _TURTLE_METHODS:
+        _replace(Turtle, name, lambda function, name=name: _method_wrapper(function, f"Turtle.{name}", timing))
+    for name in _STORE_METHODS:
+        _replace(SegmentStore, name, lambda function, name=name: _store_wrapper(function, f"SegmentStore.{name}", timing))
+    if renderers:
+        from matplotlib.figure import Figure
+        _replace(drawing, '_line_data', lambda function: _phase_wrapper(function, 'data'))
+        _replace(drawing, 'draw_lines', lambda function: _phase_wrapper(function, 'artists', 'data'))
+        _replace(drawing, 'render_to_file', _render_wrapper)
+        _replace(Figure, 'draw', _figure_wrapper)
+    return _stats
+
+
+def disable() -> DrawingStats:
+    """Stop instrumenting, putting the original functions back.
+    Returns:
+        DrawingStats: The stats collected, or None if instrumentation was not enabled.
+    """
+    global _stats, _report
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+    stats, _stats, _report = _stats, None, None
+    return stats
+
+
+@contextmanager
+def instrumented(**options):
+    """Instrument the code run in a with block.
+    Args:
+        options: Keyword arguments passed on to enable.
+    Yields:
+        DrawingStats: The stats being collected.
+    """
+    stats = enable(**options)
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def get_stats() -> DrawingStats:
+    """Get the stats being collected, or None if instrumentation is not enabled."""
+    return _stats
@@ -0,0 +1,238 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Level of detail for Turtle Graphics Implementation in Python
+
+This module simplifies the polylines of a drawing to the resolution it is rendered at. A drawing with a
+million lines rendered in a few hundred pixels has far more vertices than pixels, and the vertices that
+move a polyline by less than a fraction of a pixel can be dropped without any visible change.
+
+The simplification is the Douglas-Peucker algorithm: a polyline is replaced by the line joining its ends,
+unless some vertex is further from that line than the tolerance, in which case the polyline is split at the
+furthest vertex and both halves are simplified in turn. Rather than running it again for every tolerance,
+the importance of every vertex (the largest tolerance it is kept at) is computed once, for all polylines at
+the same time with NumPy, and any level of detail is then a simple comparison with the importances.
+
+Classes:
+    LevelOfDetail: The vertices of a segment store with their importances, and the simplified levels built from them.
+
+Functions:
+    douglas_peucker_importance(vertices, bounds): Computes the Douglas-Peucker importance of every vertex.
+    get_lod(store, tolerance=None): Gets the level of detail of a segment store, building it again only when the store has changed.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.lod import get_lod
+
+    t = Turtle()
+    t.circle(100, tolerance=0.01)
+    vertices, bounds, run_styles = get_lod(t.get_drawing_data()).level(0.5)
+
+Note:
+    Polylines are simplified one at a time, never joined, so lines of different colours or thicknesses stay apart,
+    and the first and last vertex of every polyline are always kept.
+
+Dependencies:
+    - math: Provides mathematical functions for calculations.
+    - weakref: Lets the cached levels of detail go away with their segment stores.
+    - collections: Provides the ordered dictionary behind the cache of levels.
+    - numpy: Computes the importances and the levels.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+import weakref
+from collections import OrderedDict
+import numpy as np
+
+def douglas_peucker_importance(vertices, bounds, min_tolerance: float = 0):
+    """Compute the Douglas-Peucker importance of every vertex of a set of polylines.
+    The importance of a vertex is the largest tolerance at which Douglas-Peucker simplification keeps it, so
+    simplifying to a tolerance keeps exactly the vertices whose importance is larger than the tolerance.
+    All the polylines are split at the same time: each pass finds the furthest vertex of every piece left.
+    Args:
+        vertices: (n, 2) array with the vertices of all the polylines.
+        bounds: Array with the index of the first vertex of every polyline, plus a final end index.
+        min_tolerance (float): The smallest tolerance the importances are needed for. Pieces whose vertices are all
+            within it of the line joining their ends are not split further, and all their inner vertices get the
+            importance of the furthest one, so the importances are only exact above min_tolerance.
+    Returns:
+        numpy.ndarray: The importance of every vertex, infinite for the first and last vertex of every polyline.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    xs, ys = np.ascontiguousarray(vertices[:, 0]), np.ascontiguousarray(vertices[:, 1])
+    bounds = np.asarray(bounds, dtype=np.int64)
+    importance = np.zeros(len(vertices))
+    starts, ends = bounds[:-1], bounds[1:] - 1
+    importance[starts] = importance[ends] = np.inf
+
+    # Pieces still to split: first and last vertex, and the importance of the split that made them
+    first, last = starts, ends
+    parent = np.full(len(first), np.inf)
+    while True:
+        keep = last - first > 1
+        first, last, parent = first[keep], last[keep], parent[keep]
+        if not len(first):
+            return importance
+
+        # Squared distance from every inner vertex of every piece to the line segment joining the ends of its piece
+        counts = last - first - 1
+        group_starts = np.cumsum(counts) - counts
+        inner = np.arange(counts.sum()) + np.repeat(first + 1 - group_starts, counts)
+        start, end = np.repeat(first, counts), np.repeat(last, counts)
+        x0, y0 = xs[start], ys[start]
+        dx, dy = xs[end] - x0, ys[end] - y0
+        ox, oy = xs[inner] - x0, ys[inner] - y0
+        lengths = dx * dx + dy * dy
+        t = np.divide(ox * dx + oy * dy, lengths, out=np.zeros(len(inner)), where=lengths > 0)
+        np.clip(t, 0, 1, out=t)
+        ox -= t * dx
+        oy -= t * dy
+        distances = ox * ox + oy * oy
+
+        # The furthest vertex of every piece (the first one on a tie) is where it is split
+        furthest = np.maximum.reduceat(distances, group_starts)
+        is_furthest = distances == np.repeat(furthest, counts)
+        furthest = np.sqrt(furthest)
+        candidates = np.flatnonzero(is_furthest)
+        groups = np.searchsorted(group_starts, candidates, side='right') - 1
+        first_of_group = np.ones(len(candidates), dtype=bool)
+        first_of_group[1:] = groups[1:] != groups[:-1]
+        split = inner[candidates[first_of_group]]
+        # A vertex is never more important than the vertex whose split made its piece
+        split_importance = np.minimum(furthest, parent)
+        importance[split] = split_importance
+
+        settled = furthest <= min_tolerance
+        if settled.any():
+            in_settled = np.repeat(settled, counts)
+            importance[inner[in_settled]] = np.repeat(split_importance, counts)[in_settled]
+            split, split_importance = split[~settled], split_importance[~settled]
+            first, last = first[~settled], last[~settled]
+        first, last = np.concatenate((first, split)), np.concatenate((split, last))
+        parent = np.concatenate((split_importance, split_importance))
+
+
+class LevelOfDetail:
+    """The vertices of a segment store with their importances, and the simplified levels built from them.
+    Attributes:
+        vertices (numpy.ndarray): (n, 2) array with a copy of the vertices of every run.
+        bounds (numpy.ndarray): The index of the first vertex of every run, plus a final end index.
+        run_styles (numpy.ndarray): The style index of every run.
+        importance (numpy.ndarray): The Douglas-Peucker importance of every vertex.
+        min_tolerance (float): The smallest tolerance levels are built for. Smaller tolerances are rounded up to it.
+        max_levels (int): The largest number of simplified levels kept.
+    """
+    def __init__(self, store, tolerance: float = None, min_tolerance: float = 2 ** -6, max_levels: int = 8) -> None:
+        """Copy the vertices of a segment store and compute their importances.
+        Args:
+            store (SegmentStore): The store of a turtle.
+            tolerance (float): The largest distance allowed between an exact arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+            min_tolerance (float): The smallest tolerance levels are built for. Smaller tolerances are rounded up to it.
+            max_levels (int): The largest number of simplified levels kept.
+        """
+        self.vertices, self.bounds, self.run_styles = store.to_numpy_polylines(tolerance)
+        self.min_tolerance = min_tolerance
+        self.importance = douglas_peucker_importance(self.vertices, self.bounds, min_tolerance)
+        self.max_levels = max_levels
+        self._levels = OrderedDict()     #Level: (vertices, bounds, run_styles), least recently used first
+
+
+    def level(self, tolerance: float, drop_subpixel: bool = True):
+        """Get the polylines simplified to a tolerance, e.g. the size of half a pixel.
+        The tolerance is rounded down to a power of two, so that close tolerances share one cached level
+        and the result is never coarser than asked, but not below min_tolerance.
+        Args:
+            tolerance (float): The largest distance allowed between a polyline and its simplification.
+            drop_subpixel (bool): Whether to also drop the vertices that are within the tolerance of the previous
+                vertex kept, and the polylines that fit within the tolerance. The polylines are then within twice
+                the tolerance of the original ones, rather than within the tolerance.
+        Returns:
+            tuple: A (n, 2) array with the vertices kept, an array with the start of every polyline plus a final
+                end index, and an array with the style index of every polyline.
+        Raises:
+            ValueError: If the tolerance is not positive.
+        """
+        if not tolerance > 0:
+            raise ValueError("Tolerance must be positive.")
+        level = (math.floor(math.log2(max(tolerance, self.min_tolerance))), drop_subpixel)
+        cached = self._levels.get(level)
+        if cached is not None:
+            self._levels.move_to_end(level)
+            return cached
+
+        tolerance = 2.0 ** level[0]
+        kept = self.importance > tolerance
+        run_of = np.repeat(np.arange(len(self.run_styles)), np.diff(self.bounds))
+        if drop_subpixel and len(self.vertices):
+            kept &= self._drop_subpixel(kept, run_of, tolerance)
+
+        counts = np.bincount(run_of[kept], minlength=len(self.run_styles))
+        if drop_subpixel:
+            # A polyline that fits within the tolerance is no more than a dot
+            if len(self.vertices):
+                lows = np.minimum.reduceat(self.vertices, self.bounds[:-1])
+                highs = np.maximum.reduceat(self.vertices, self.bounds[:-1])
+                visible = np.any(highs - lows > tolerance, axis=1)
+            else:
+                visible = np.zeros(0, dtype=bool)
+            kept &= visible[run_of]
+            counts[~visible] = 0
+        runs = counts > 1
+        bounds = np.zeros(runs.sum() + 1, dtype=np.int64)
+        np.cumsum(counts[runs], out=bounds[1:])
+        result = (self.vertices[kept], bounds, self.run_styles[runs])
+
+        self._levels[level] = result
+        if len(self._levels) > self.max_levels:
+            self._levels.popitem(last=False)
+        return result
+
+
+    def _drop_subpixel(self, kept, run_of, tolerance: float):
+        """Mark the kept vertices that lie in the same cell as the previous kept vertex, in a grid whose cells have
+        a diagonal as long as the tolerance. The last vertex of every polyline is always kept.
+        A vertex dropped is then within the tolerance of the vertex kept before it, so the simplified polyline moves
+        by less than the tolerance, and by less than twice the tolerance from the original polyline.
+        """
+        indices = np.flatnonzero(kept)
+        cells = np.floor(self.vertices[indices] * (math.sqrt(2) / tolerance))
+        repeated = np.zeros(len(indices), dtype=bool)
+        repeated[1:] = np.all(cells[1:] == cells[:-1], axis=1) & (run_of[indices[1:]] == run_of[indices[:-1]])
+        repeated[np.isin(indices, self.bounds[1:] - 1)] = False
+        keep = np.ones(len(self.vertices), dtype=bool)
+        keep[indices[repeated]] = False
+        return keep
+
+
+    def __repr__(self) -> str:
+        return f"LevelOfDetail({len(self.vertices)} vertices, {len(self.run_styles)} runs, {len(self._levels)} levels)"
+
+
+_levels_of_detail = weakref.WeakKeyDictionary()     #SegmentStore: ((generation, segment count, run count), {tolerance level: LevelOfDetail})
+
+def get_lod(store, tolerance: float = None) -> LevelOfDetail:
+    """Get the level of detail of a segment store, building it again only when the store has changed.
+    The tolerance is rounded down to a power of two, as for the levels themselves, and one level of detail is kept
+    per power of two, so that close tolerances share the segments of the exact arcs of the store.
+    Args:
+        store (SegmentStore): The store of a turtle.
+        tolerance (float): The largest distance allowed between an exact arc and its line segments.
+            When None, arcs use the number of steps given when they were recorded.
+    Returns:
+        LevelOfDetail: The level of detail of the current lines of the store.
+    """
+    # The tolerance only changes the segments of exact arcs, so it is left out of the key of a store without arcs
+    level = math.floor(math.log2(tolerance)) if tolerance is not None and len(store.arcs) else None
+    key = (store.generation, len(store), len(store.run_starts))
+    cached = _levels_of_detail.get(store)
+    if cached is None or cached[0] != key:
+        cached = _levels_of_detail[store] = (key, {})
+    lod = cached[1].get(level)
+    if lod is None:
+        lod = cached[1][level] = LevelOfDetail(store, None if level is None else 2.0 ** level)
+    return lod
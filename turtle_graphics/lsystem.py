@@ -0,0 +1,248 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+L-systems for Turtle Graphics Implementation in Python
+
+This module draws fractals described as L-systems (Lindenmayer systems): an axiom, a string of symbols,
+is rewritten depth times by replacing every symbol with its rule, and the resulting symbols are read as
+turtle commands. The symbols are produced by an iterative generator, in chunks, instead of building the
+whole string or recursing once per level, so deep fractals need neither much memory nor a deep stack.
+The interpreter buffers the moves and turns it reads and draws them in batches with Turtle.walk.
+
+Classes:
+    LSystem: An L-system grammar with its turtle interpretation.
+
+Functions:
+    interpret(turtle, symbols, angle, step, draw='FG', move='f', batch_size=65536): Drives a turtle with a stream of symbols.
+
+Symbols:
+    F, G: Move forward by step, drawing a line (configurable with draw).
+    f: Move forward by step without drawing (configurable with move).
+    +: Turn left by angle.
+    -: Turn right by angle.
+    |: Turn around.
+    [: Save the turtle's position and direction.
+    ]: Go back to the last saved position and direction without drawing.
+    Any other symbol is only used by the rules and does nothing when interpreted.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.lsystem import KOCH_SNOWFLAKE
+
+    t = Turtle()
+    KOCH_SNOWFLAKE.draw(t, depth=8, length=100)
+
+Dependencies:
+    - turtle: The turtle driven by the interpreter.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+class LSystem:
+    """An L-system grammar with its turtle interpretation.
+    Attributes:
+        axiom (str): The symbols the expansion starts from.
+        rules (dict[str, str]): The symbols each symbol is replaced with at every level of the expansion.
+        angle (float): The angle in degrees turned by + and -.
+        scale (float): The factor by which lines get shorter at every level, e.g. 3 for the Koch curve.
+        max_chunk (int): The size in symbols of the chunks produced by the expansion, and of the largest expansions cached.
+    """
+    def __init__(self, axiom: str, rules: dict, angle: float, scale: float = 1, max_chunk: int = 4096) -> None:
+        """Initialize the L-system with its axiom, rules, angle and scale.
+        Raises:
+            TypeError: If the axiom or the rules are not strings, or the angle or the scale is not a number.
+            ValueError: If a rule is not for a single symbol.
+        """
+        if not isinstance(axiom, str):
+            raise TypeError("Axiom must be a string.")
+        for symbol, replacement in rules.items():
+            if not isinstance(symbol, str) or not isinstance(replacement, str):
+                raise TypeError("Rules must map symbols to strings.")
+            if len(symbol) != 1:
+                raise ValueError(f"Invalid rule for {symbol!r}. Expected a single symbol.")
+        if not isinstance(angle, (int, float)) or not isinstance(scale, (int, float)):
+            raise TypeError("Angle and scale must be numbers.")
+
+        self.axiom = axiom
+        self.rules = dict(rules)
+        self.angle = angle
+        self.scale = scale
+        self.max_chunk = max_chunk
+        self._lengths = [{}]        #Length of the expansion of every symbol, per depth
+        self._expansions = {}       #(symbol, depth): expansion, for the expansions up to max_chunk symbols long
+        self._expanded_depth = 0    #Depth up to which the short expansions have been built
+
+
+    def _length(self, symbol: str, depth: int) -> int:
+        """Get the number of symbols a symbol expands to after depth levels, without expanding it."""
+        if depth == 0 or symbol not in self.rules:
+            return 1
+        # The lengths are counted level by level, so no level is counted twice and nothing recurses
+        while len(self._lengths) <= depth:
+            below = self._lengths[-1]
+            self._lengths.append({rule_symbol: sum(below.get(s, 1) for s in replacement)
+                                  for rule_symbol, replacement in self.rules.items()})
+        return self._lengths[depth][symbol]
+
+
+    def _expansion(self, symbol: str, depth: int):
+        """Get the expansion of a symbol after depth levels if it is at most max_chunk symbols long.
+        Returns:
+            str: The expansion, or None if it is too long.
+        """
+        if depth == 0 or symbol not in self.rules:
+            return symbol
+        # The short expansions are built level by level from the ones of the level below, each of them once
+        while self._expanded_depth < depth:
+            level = self._expanded_depth = self._expanded_depth + 1
+            for rule_symbol, replacement in self.rules.items():
+                if self._length(rule_symbol, level) <= self.max_chunk:
+                    self._expansions[rule_symbol, level] = ''.join(
+                        self._expansions.get((s, level - 1), s) for s in replacement)
+        return self._expansions.get((symbol, depth))
+
+
+    def length(self, depth: int) -> int:
+        """Get the number of symbols of the expansion of the axiom after depth levels, without expanding it.
+        Args:
+            depth (int): The number of levels of the expansion.
+        Returns:
+            int: The number of symbols.
+        """
+        return sum(self._length(symbol, depth) for symbol in self.axiom)
+
+
+    def chunks(self, depth: int):
+        """Expand the axiom depth times, producing the symbols in chunks of about max_chunk symbols.
+        The expansion keeps one iterator per level on an explicit stack instead of recursing, and reuses the
+        expansions short enough to be cached, so it needs memory for depth levels and one chunk only.
+        Args:
+            depth (int): The number of levels of the expansion.
+        Yields:
+            str: Consecutive chunks of the expanded symbols.
+        Raises:
+            TypeError: If the depth is not an integer.
+            ValueError: If the depth is negative.
+        """
+        if not isinstance(depth, int):
+            raise TypeError(f"Invalid type for depth: {type(depth).__name__}. Expected an integer.")
+        if depth < 0:
+            raise ValueError("Depth must not be negative.")
+
+        buffer, buffered = [], 0
+        stack = [(iter(self.axiom), depth)]
+        while stack:
+            symbols, remaining = stack[-1]
+            for symbol in symbols:
+                expansion = self._expansion(symbol, remaining)
+                if expansion is None:
+                    # Too long to cache: expand the rule one level down, then carry on with this level
+                    stack.append((iter(self.rules[symbol]), remaining - 1))
+                    break
+                buffer.append(expansion)
+                buffered += len(expansion)
+                if buffered >= self.max_chunk:
+                    yield ''.join(buffer)
+                    buffer, buffered = [], 0
+            else:
+                stack.pop()
+        if buffer:
+            yield ''.join(buffer)
+
+
+    def expand(self, depth: int):
+        """Expand the axiom depth times, one symbol at a time.
+        Args:
+            depth (int): The number of levels of the expansion.
+        Yields:
+            str: The expanded symbols, one at a time.
+        """
+        for chunk in self.chunks(depth):
+            yield from chunk
+
+
+    def draw(self, turtle, depth: int, length: float, **options) -> None:
+        """Draw the L-system with a turtle, expanded depth times.
+        Args:
+            turtle (Turtle): The turtle to draw with.
+            depth (int): The number of levels of the expansion.
+            length (float): The length of a line at depth 0. Lines are scale times shorter at every level.
+            options: Keyword arguments passed on to interpret.
+        Raises:
+            ValueError: If the turtle would move outside the screen limits.
+        """
+        interpret(turtle, self.chunks(depth), self.angle, length / self.scale ** depth, **options)
+
+
+    def __repr__(self) -> str:
+        return f"LSystem({self.axiom!r}, {self.rules!r}, angle={self.angle}, scale={self.scale})"
+
+
+def interpret(turtle, symbols, angle: float, step: float, draw: str = 'FG', move: str = 'f',
+              batch_size: int = 65536) -> None:
+    """Drive a turtle with a stream of L-system symbols.
+    The moves and turns are buffered and drawn in batches of batch_size moves with Turtle.walk. The buffer is
+    also drawn before the state is saved with [ or restored with ].
+    Args:
+        turtle (Turtle): The turtle to drive.
+        symbols: An iterable of strings, e.g. a single string or the chunks produced by LSystem.chunks.
+        angle (float): The angle in degrees turned by + and -.
+        step (float): The distance moved by the drawing and moving symbols.
+        draw (str): The symbols that move forward drawing a line, if the pen is down.
+        move (str): The symbols that move forward without drawing.
+        batch_size (int): The largest number of moves drawn at once.
+    Raises:
+        ValueError: If the turtle would move outside the screen limits, or ] has no matching [.
+            The batches drawn before the error are kept.
+    """
+    pen = turtle.is_pen_down
+    turns, distances, pens = [], [], []
+    turn = 0.0
+    saved = []
+
+    def flush():
+        nonlocal turns, distances, pens, turn
+        if distances:
+            turtle.walk(turns, distances, pens)
+            turns, distances, pens = [], [], []
+        if turn:
+            turtle.angle = (turtle.angle + turn) % 360
+            turn = 0.0
+
+    for chunk in symbols:
+        for symbol in chunk:
+            if symbol in draw:
+                turns.append(turn)
+                distances.append(step)
+                pens.append(pen)
+                turn = 0.0
+            elif symbol in move:
+                turns.append(turn)
+                distances.append(step)
+                pens.append(False)
+                turn = 0.0
+            elif symbol == '+':
+                turn += angle
+            elif symbol == '-':
+                turn -= angle
+            elif symbol == '|':
+                turn += 180
+            elif symbol == '[':
+                flush()
+                saved.append((turtle.x, turtle.y, turtle.angle))
+            elif symbol == ']':
+                if not saved:
+                    raise ValueError("Unbalanced ']' in the L-system symbols.")
+                flush()
+                turtle.x, turtle.y, turtle.angle = saved.pop()
+        if len(distances) >= batch_size:
+            flush()
+    flush()
+
+
+# Classic fractals. Their lines are scaled so that a drawing keeps the same size at every depth.
+KOCH_SNOWFLAKE = LSystem('F--F--F', {'F': 'F+F--F+F'}, angle=60, scale=3)
+SIERPINSKI_TRIANGLE = LSystem('F-G-G', {'F': 'F-G+F+G-F', 'G': 'GG'}, angle=120, scale=2)
+SIERPINSKI_ARROWHEAD = LSystem('F', {'F': 'G-F-G', 'G': 'F+G+F'}, angle=60, scale=2)
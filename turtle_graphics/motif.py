@@ -0,0 +1,334 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Motif memoization for Turtle Graphics Implementation in Python
+
+This module memoizes sub-drawings. A motif is the drawing made by a procedure, recorded once relative to
+the turtle that starts it: from the origin, facing along the x axis. Drawing the motif again somewhere else
+("stamping" it) only needs one rotation and one translation of its vertices, instead of calling the procedure
+and every Turtle method it calls again. Self-similar drawings such as the Koch snowflake reuse the same motif
+thousands of times, so memoizing each level turns an exponential number of calls into a few array transforms.
+
+Classes:
+    Motif: A sub-drawing recorded relative to the turtle that drew it.
+    MotifCache: Bounded cache of motifs, evicting the least recently used ones.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.motif import MotifCache
+
+    cache = MotifCache()
+
+    @cache.memoize
+    def koch(turtle, length, depth):
+        if depth == 0:
+            turtle.forward(length)
+            return
+        for turn in (0, 60, -120, 60):
+            turtle.left(turn)
+            koch(turtle, length / 3, depth - 1)
+
+    t = Turtle()
+    koch(t, 150, 8)
+
+Note:
+    A motif is recorded by running its procedure on a new turtle, so the procedure must only use the turtle it is
+    given and must not call goto, whose coordinates are not relative to the turtle. The motif is recorded with the
+    pen colour, thickness and pen state of the turtle it is first stamped with, which are part of the cache key.
+    Circles are recorded as line segments. The motif is recorded without screen limits, as its position on the screen
+    is only known when it is stamped, where the boundary policy of the turtle stamping it applies. The path of the
+    moves made with the pen up is recorded as well, so that a motif only passes the screen limits check if calling
+    its procedure would have.
+
+Dependencies:
+    - math: Provides mathematical functions for calculations.
+    - collections: Provides the ordered dictionary behind the cache.
+    - functools: Keeps the name and docstring of memoized procedures.
+    - geometry: Checks whether NumPy is installed, and clips or wraps motifs leaving the screen.
+    - segments: Stores the path of the pen-up moves of a motif while it is recorded.
+    - turtle: Provides the turtle that records motifs.
+    - config: Provides the canvas size limits.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+from collections import OrderedDict
+from functools import wraps
+from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from .geometry import get_numpy, clip_polyline, wrap_point, wrap_polyline
+from .segments import SegmentStore
+from .turtle import Turtle
+
+class _Recorder(Turtle):
+    """Turtle recording a motif, which also keeps the path of the moves it makes with the pen up.
+    Attributes:
+        hidden (SegmentStore): The path of the pen-up moves, and of the pen-up moves of the motifs stamped with it.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.hidden = SegmentStore()
+
+
+    def _move(self, move, *args):
+        """Make a move, sending its path to the hidden store instead of drawing it if the pen is up."""
+        if self.is_pen_down:
+            return move(*args)
+        outputs, self._outputs, self.is_pen_down = self._outputs, (self.hidden,), True
+        try:
+            return move(*args)
+        finally:
+            self._outputs, self.is_pen_down = outputs, False
+
+
+    def forward(self, distance: float) -> None:
+        self._move(super().forward, distance)
+
+
+    def circle(self, radius: float, extent: float = 360, tolerance: float = None) -> None:
+        self._move(super().circle, radius, extent, tolerance)
+
+
+    def walk(self, turns, distances, pens=None):
+        if pens is None:
+            return self._move(super().walk, turns, distances)
+        #The moves drawn or not are picked by pens whatever the pen state, so the whole path is kept
+        xs, ys = super().walk(turns, distances, pens)
+        if len(xs) > 1:
+            self.hidden.add_polyline([value for point in zip(xs, ys) for value in point], self.line_color, self.line_thickness)
+        return xs, ys
+
+
+class Motif:
+    """A sub-drawing recorded relative to the turtle that drew it, which started at the origin facing along the x axis.
+    Attributes:
+        vertices: The vertices of all the polylines of the motif, as a (n, 2) NumPy array (a flat list of x, y when
+            NumPy is not installed).
+        run_starts (list[int]): Index of the first vertex of every polyline, plus a final end index.
+        run_styles (list[tuple[str, float]]): The (color, thickness) of every polyline.
+        segment_count (int): The number of line segments of the motif.
+        end (tuple[float, float, float]): The x, y and angle of the turtle at the end of the motif.
+        end_state (tuple[bool, str, float]): The pen state, pen colour and line thickness at the end of the motif.
+        hidden: The vertices of the path of the moves made with the pen up, in the same form as vertices. They are
+            not drawn, but count towards the screen limits.
+    """
+    def __init__(self, turtle) -> None:
+        """Record the lines drawn by a turtle that started at the origin facing along the x axis.
+        Args:
+            turtle (Turtle): The turtle that drew the motif.
+        """
+        store = turtle.get_drawing_data()
+        coords, self.run_starts, self.run_styles = [], [0], []
+        for start, end, style_index, arc in store.runs():
+            coords.extend(store.run_coords(start, end, arc))
+            self.run_starts.append(len(coords) // 2)
+            self.run_styles.append(store.styles[style_index])
+
+        hidden = list(turtle.hidden.vertices) if isinstance(turtle, _Recorder) else []
+
+        np = get_numpy()
+        self.vertices = np.array(coords, dtype=float).reshape(-1, 2) if np is not None else coords
+        self.hidden = np.array(hidden, dtype=float).reshape(-1, 2) if np is not None else hidden
+        self.segment_count = len(store)
+        self.end = (turtle.x, turtle.y, turtle.angle)
+        self.end_state = (turtle.is_pen_down, turtle.line_color, turtle.line_thickness)
+
+
+    @classmethod
+    def record(cls, procedure, turtle, *args, **kwargs) -> 'Motif':
+        """Record the drawing a procedure makes when called with a turtle.
+        Args:
+            procedure: A function taking a turtle as its first argument.
+            turtle (Turtle): The turtle whose pen colour, thickness and state the motif starts with. It does not move.
+            args: Positional arguments passed on to the procedure after the turtle.
+            kwargs: Keyword arguments passed on to the procedure.
+        Returns:
+            Motif: The recorded motif.
+        """
+        recorder = _Recorder(turtle.name, 0, 0, init_angle=0, line_color=turtle.line_color, boundary='unbounded')
+        recorder.line_thickness = turtle.line_thickness
+        recorder.is_pen_down = turtle.is_pen_down
+        procedure(recorder, *args, **kwargs)
+        return cls(recorder)
+
+
+    def stamp(self, turtle) -> None:
+        """Draw the motif with a turtle, rotated to its direction and moved to its position.
+        The turtle ends where and as the motif ends.
+        Args:
+            turtle (Turtle): The turtle to draw with.
+        Raises:
+            ValueError: If the motif would be drawn outside the screen limits and the boundary policy of the turtle is
+                'raise'. Nothing is drawn then. Under the other policies it is clipped, wrapped or drawn as a whole.
+        """
+        cos, sin = math.cos(math.radians(turtle.angle)), math.sin(math.radians(turtle.angle))
+        x, y = turtle.x, turtle.y
+        end_x, end_y, end_angle = self.end
+        end_x, end_y = x + end_x * cos - end_y * sin, y + end_x * sin + end_y * cos
+
+        vertices, hidden = self._place(self.vertices, x, y, cos, sin), self._place(self.hidden, x, y, cos, sin)
+        np = get_numpy()
+        if np is not None:
+            points = np.concatenate((vertices, hidden, [(end_x, end_y)]))
+            xmin, xmax, ymin, ymax = points[:, 0].min(), points[:, 0].max(), points[:, 1].min(), points[:, 1].max()
+        else:
+            xs, ys = vertices[0::2] + hidden[0::2] + [end_x], vertices[1::2] + hidden[1::2] + [end_y]
+            xmin, xmax, ymin, ymax = min(xs), max(xs), min(ys), max(ys)
+        split = None
+        if not (-SCREEN_LIMIT_X <= xmin and xmax <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= ymin and ymax <= SCREEN_LIMIT_Y):
+            boundary = getattr(turtle, 'boundary', 'raise')
+            if boundary == 'raise':
+                raise ValueError(f"Turtle {turtle.name} would move outside the screen limits ({-SCREEN_LIMIT_X}, {-SCREEN_LIMIT_Y}, {SCREEN_LIMIT_X}, {SCREEN_LIMIT_Y}).")
+            if boundary == 'unbounded':
+                turtle._extend_bounds(xmin, ymin, xmax, ymax)
+            else:
+                split = clip_polyline if boundary == 'clip' else wrap_polyline
+                if boundary == 'wrap':
+                    end_x, end_y = wrap_point(end_x, end_y, -SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)
+
+        for i, (color, thickness) in enumerate(self.run_styles):
+            start, end = self.run_starts[i], self.run_starts[i + 1]
+            coords = vertices[start:end].ravel() if np is not None else vertices[2 * start:2 * end]
+            parts = [coords] if split is None else split(coords, -SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)
+            for part in parts:
+                for output in turtle._outputs:
+                    output.add_polyline(part, color, thickness)
+        if isinstance(turtle, _Recorder) and len(hidden):
+            #Recording a motif made of this one, whose pen-up moves it keeps as well
+            turtle.hidden.add_polyline(hidden.ravel() if np is not None else hidden, turtle.line_color, turtle.line_thickness)
+
+        turtle.x, turtle.y = end_x, end_y
+        turtle.angle = (turtle.angle + end_angle) % 360
+        turtle.is_pen_down, turtle.line_color, turtle.line_thickness = self.end_state
+
+
+    @staticmethod
+    def _place(vertices, x: float, y: float, cos: float, sin: float):
+        """Rotate vertices by the angle whose cosine and sine are given, then move them by x, y.
+        Args:
+            vertices: A (n, 2) NumPy array of vertices, or a flat list of x, y when NumPy is not installed.
+            x (float): The x coordinate to move the origin to.
+            y (float): The y coordinate to move the origin to.
+            cos (float): The cosine of the angle to rotate by.
+            sin (float): The sine of the angle to rotate by.
+        Returns:
+            The moved vertices, in the same form.
+        """
+        np = get_numpy()
+        if np is not None:
+            placed = vertices @ np.array([[cos, sin], [-sin, cos]])
+            placed += (x, y)
+            return placed
+        placed = []
+        for i in range(0, len(vertices), 2):
+            vx, vy = vertices[i], vertices[i + 1]
+            placed += (x + vx * cos - vy * sin, y + vx * sin + vy * cos)
+        return placed
+
+
+    def __repr__(self) -> str:
+        return f"Motif({self.segment_count} segments, {len(self.run_styles)} runs)"
+
+
+class MotifCache:
+    """Bounded cache of motifs, evicting the least recently used ones.
+    Attributes:
+        max_segments (int): The largest total number of line segments of the cached motifs.
+        segment_count (int): The total number of line segments of the cached motifs.
+        hits (int): The number of stamps that found their motif in the cache.
+        misses (int): The number of stamps that had to record their motif.
+    """
+    def __init__(self, max_segments: int = 1 << 20) -> None:
+        """Initialize an empty cache holding motifs of up to max_segments line segments in total."""
+        if not isinstance(max_segments, int):
+            raise TypeError("Maximum number of segments must be an integer.")
+        self.max_segments = max_segments
+        self.segment_count = 0
+        self.hits = self.misses = 0
+        self._motifs = OrderedDict()    #Least recently used first
+
+
+    def get(self, key):
+        """Get a cached motif, marking it as the most recently used.
+        Args:
+            key: The key the motif was cached with.
+        Returns:
+            Motif: The motif, or None if it is not cached.
+        """
+        motif = self._motifs.get(key)
+        if motif is not None:
+            self._motifs.move_to_end(key)
+        return motif
+
+
+    def put(self, key, motif: Motif) -> None:
+        """Cache a motif, evicting the least recently used motifs until the cache is within max_segments.
+        Motifs larger than max_segments on their own are not cached.
+        Args:
+            key: The key to cache the motif with.
+            motif (Motif): The motif to cache.
+        """
+        if key in self._motifs:
+            self.segment_count -= self._motifs.pop(key).segment_count
+        if motif.segment_count > self.max_segments:
+            return
+        while self.segment_count + motif.segment_count > self.max_segments:
+            self.segment_count -= self._motifs.popitem(last=False)[1].segment_count
+        self._motifs[key] = motif
+        self.segment_count += motif.segment_count
+
+
+    def stamp(self, turtle, procedure, *args, **kwargs) -> Motif:
+        """Draw what a procedure draws, stamping its cached motif or recording it first.
+        The motif is cached by procedure, arguments, and the pen colour, thickness and state of the turtle.
+        Args:
+            turtle (Turtle): The turtle to draw with.
+            procedure: A function taking a turtle as its first argument. The arguments must be hashable.
+            args: Positional arguments passed on to the procedure after the turtle.
+            kwargs: Keyword arguments passed on to the procedure.
+        Returns:
+            Motif: The motif that was stamped.
+        Raises:
+            ValueError: If the motif would be drawn outside the screen limits and the boundary policy of the turtle is 'raise'.
+        """
+        key = (procedure, args, tuple(sorted(kwargs.items())),
+               turtle.line_color, turtle.line_thickness, turtle.is_pen_down)
+        motif = self.get(key)
+        if motif is None:
+            self.misses += 1
+            motif = Motif.record(procedure, turtle, *args, **kwargs)
+            self.put(key, motif)
+        else:
+            self.hits += 1
+        motif.stamp(turtle)
+        return motif
+
+
+    def memoize(self, procedure):
+        """Decorate a drawing procedure so that every call stamps its cached motif.
+        Recursive procedures also memoize their recursive calls, as these go through the decorated function.
+        Args:
+            procedure: A function taking a turtle as its first argument.
+        Returns:
+            The decorated function.
+        """
+        @wraps(procedure)
+        def stamped(turtle, *args, **kwargs):
+            self.stamp(turtle, procedure, *args, **kwargs)
+        return stamped
+
+
+    def clear(self) -> None:
+        """Remove every motif from the cache."""
+        self._motifs.clear()
+        self.segment_count = 0
+
+
+    def __len__(self) -> int:
+        return len(self._motifs)
+
+
+    def __repr__(self) -> str:
+        return f"MotifCache({len(self._motifs)} motifs, {self.segment_count}/{self.max_segments} segments)"
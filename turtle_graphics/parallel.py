@@ -0,0 +1,137 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Parallel scene generation for Turtle Graphics Implementation in Python
+
+This module draws the turtles of a scene in parallel. Each turtle program is a function that draws with the fresh
+Turtle it is given, such as a fractal, and programs that do not share a turtle are independent of each other, so
+they can run in separate processes, one per CPU core, instead of one after the other in a single Python thread.
+Each process sends back the raw arrays of its turtle's segment store, which are pickled as flat byte buffers
+rather than as one tuple per line, and the turtles are rebuilt from them in the main process, ready to be
+drawn together with draw_all_turtles or render_to_file.
+
+Functions:
+    generate_scene(programs, processes=None, **turtle_options): Runs turtle programs in a process pool and returns their turtles.
+
+Usage:
+    from functools import partial
+    from turtle_graphics.parallel import generate_scene
+    from turtle_graphics.lsystem import KOCH_SNOWFLAKE
+    from turtle_graphics.drawing import render_to_file
+
+    def snowflake(turtle, depth):
+        KOCH_SNOWFLAKE.draw(turtle, depth, 100)
+
+    programs = [(partial(snowflake, depth=8), {'x': x, 'y': 0, 'init_angle': 0}) for x in (-180, -60, 60)]
+    turtles = generate_scene(programs)
+    render_to_file("snowflakes.png", "Snowflakes", *turtles)
+
+Note:
+    Programs and their arguments are sent to the worker processes with pickle, so they must be functions defined at
+    the top level of a module, or functools.partial objects of such functions, not lambdas or nested functions.
+    Only the lines and the final state of every turtle come back: sinks attached inside a program, or any other
+    side effect, stay in its worker process. The lines of a turtle with a memory budget come back in memory, and
+    are spilled to disk again under the same budget as its turtle is rebuilt.
+
+Dependencies:
+    - concurrent.futures: Provides the process pool.
+    - os: Counts the CPU cores.
+    - turtle: The turtles the programs draw with.
+    - segments: Rebuilds the segment stores from their arrays.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .segments import DrawingArrays, SegmentStore
+from .turtle import Turtle
+
+_STATE = ('x', 'y', 'angle', 'is_pen_down', 'line_color', 'turtle_color', 'line_thickness', 'boundary', 'bounds')     #Turtle attributes sent back
+
+def _run_program(program, options: dict) -> tuple:
+    """Run a turtle program on a new turtle, in a worker process.
+    Returns:
+        tuple: The arrays of the turtle's segment store as a tuple, and the final state of the turtle.
+    """
+    turtle = Turtle(**options)
+    program(turtle)
+    # A DrawingArrays is sent as a plain tuple of array.array objects, which pickle as raw bytes
+    return tuple(turtle.get_drawing_data().arrays()), {name: getattr(turtle, name) for name in _STATE}
+
+
+def _rebuild_store(arrays: tuple, memory_budget: int = None) -> SegmentStore:
+    """Rebuild the segment store of a turtle from the arrays sent back by a worker process.
+    Args:
+        arrays (tuple): The arrays of the store, as returned by _run_program.
+        memory_budget (int): The memory budget of the turtle, or None for a store kept in memory.
+    Returns:
+        SegmentStore: A store holding the same lines, which spills them to disk under the same budget when one is given.
+    """
+    store = SegmentStore.from_arrays(DrawingArrays(*arrays))
+    if memory_budget is None:
+        return store
+    # The runs are added again to a store with the same budget, which spills full chunks to disk as they are added
+    from .spill import SpillingSegmentStore     #Only imported by turtles that spill their lines to disk
+    spilling = SpillingSegmentStore(memory_budget)
+    for start, end, style, arc in store.runs():
+        color, thickness = store.styles[style]
+        if arc is None:
+            spilling.add_polyline(store.vertices[2 * start:2 * end], color, thickness)
+        else:
+            spilling.add_arc(*arc, color, thickness)
+    return spilling
+
+
+def _split_program(program) -> tuple:
+    """Split a program given as a callable or a (callable, options) pair into both parts.
+    Raises:
+        TypeError: If the program is not callable.
+    """
+    program, options = program if isinstance(program, tuple) else (program, {})
+    if not callable(program):
+        raise TypeError(f"Invalid turtle program: {type(program).__name__}. Expected a callable taking a Turtle.")
+    return program, dict(options)
+
+
+def generate_scene(programs, processes: int = None, **turtle_options) -> list:
+    """Run turtle programs in a pool of processes, and rebuild their turtles in this process.
+    Args:
+        programs: An iterable of turtle programs. A program is a callable taking a new Turtle, or a (callable, options)
+            pair where options is a dictionary of Turtle arguments, e.g. {'x': -100, 'line_color': 'blue'},
+            which override turtle_options for that program.
+        processes (int): The number of worker processes. Defaults to the number of CPU cores, and never more than
+            the number of programs. With 1, the programs run one after the other in this process.
+        turtle_options: Turtle arguments used for every program, e.g. init_angle=0.
+    Returns:
+        list[Turtle]: The turtles drawn by the programs, in the order of the programs.
+    Raises:
+        TypeError: If a program is not callable.
+        ValueError: If a program moves its turtle outside the screen limits.
+            Any other exception raised by a program is raised again here.
+    """
+    jobs = []
+    for program in programs:
+        program, options = _split_program(program)
+        jobs.append((program, {**turtle_options, **options}))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(min(processes, len(jobs)), 1)
+
+    if processes == 1:
+        results = [_run_program(program, options) for program, options in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_run_program, *zip(*jobs)))
+
+    turtles = []
+    for (_, options), (arrays, state) in zip(jobs, results):
+        turtle = Turtle(**options)
+        turtle.lines_to_draw = _rebuild_store(arrays, turtle.memory_budget)
+        turtle._update_outputs()
+        for name, value in state.items():
+            setattr(turtle, name, value)
+        turtles.append(turtle)
+    return turtles
@@ -0,0 +1,349 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Compiled turtle programs for Turtle Graphics Implementation in Python
+
+This module records a sequence of Turtle calls once, as a compact program of opcodes and operands,
+and replays it against any Turtle as many times as needed. The arguments are checked when the program
+is recorded, so replaying it skips the per-call type checks and method calls of the Turtle class.
+A program can also be replayed with NumPy, computing every heading and position of a run of moves and
+turns as cumulative sums.
+
+Classes:
+    Program: A recorded sequence of turtle commands.
+    ProgramRecorder: Turtle-like object that records the calls made on it into a Program.
+
+Functions:
+    record(procedure, *args, **kwargs): Records the turtle calls made by a procedure into a Program.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.program import record
+    from examples.example_4 import draw_koch_snowflake
+
+    program = record(draw_koch_snowflake, 100, 4)
+    for start_angle in (0, 120, 240):
+        t = Turtle(init_angle=start_angle)
+        program.run(t)
+
+Note:
+    Procedures are recorded by calling them with a ProgramRecorder instead of a Turtle. The recorder only
+    supports the drawing commands, so procedures that read the turtle's position or angle cannot be recorded.
+
+Dependencies:
+    - math: Provides mathematical functions for calculations.
+    - array: Provides the compact storage of opcodes and operands.
+    - geometry: Checks whether NumPy is installed. Runs of moves and turns are computed in one batch by Turtle.walk.
+    - config: Provides the canvas size limits.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+from array import array
+from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from .geometry import get_numpy
+
+# Opcodes and the number of operands each of them takes
+FORWARD, LEFT, PEN_UP, PEN_DOWN, SET_COLOR, SET_THICKNESS, SET_ANGLE, GOTO, CIRCLE = range(9)
+ARITY = (1, 1, 0, 0, 1, 1, 1, 2, 3)
+NAMES = ('forward', 'left', 'pen_up', 'pen_down', 'set_pen_color', 'set_line_thickness', 'set_initial_angle', 'goto', 'circle')
+
+
+class Program:
+    """A recorded sequence of turtle commands.
+    Attributes:
+        opcodes (array): One byte per command.
+        operands (array): The numeric operands of every command, in order. Colours are stored as indices into strings.
+        strings (list[str]): The colours used by the program.
+    """
+    def __init__(self) -> None:
+        """Initialise an empty program."""
+        self.opcodes = array('B')
+        self.operands = array('d')
+        self.strings = []
+        self._blocks = None     #Cached form of the program for run_vectorized
+
+
+    def append(self, opcode: int, *operands: float) -> None:
+        """Append a command to the program.
+        Args:
+            opcode (int): The command's opcode.
+            operands (float): The command's operands.
+        """
+        self.opcodes.append(opcode)
+        self.operands.extend(operands)
+        self._blocks = None
+
+
+    def string(self, value: str) -> int:
+        """Get the index of a string in the program's string table, adding it if it is new."""
+        if value not in self.strings:
+            self.strings.append(value)
+        return self.strings.index(value)
+
+
+    def commands(self):
+        """Iterate over the commands of the program.
+        Yields:
+            tuple[str, tuple]: The name of the Turtle method and its arguments.
+        """
+        k = 0
+        for opcode in self.opcodes:
+            operands = tuple(self.operands[k:k + ARITY[opcode]])
+            k += ARITY[opcode]
+            if opcode == SET_COLOR:
+                operands = (self.strings[int(operands[0])],)
+            elif opcode == CIRCLE:
+                operands = operands[:2] + ((None,) if math.isnan(operands[2]) else operands[2:])
+            yield NAMES[opcode], operands
+
+
+    def run(self, turtle) -> None:
+        """Run the program on a turtle, starting from the turtle's current position, angle, pen and colours.
+        The result is the same as calling the recorded Turtle methods one by one.
+        Args:
+            turtle (Turtle): The turtle to run the program on.
+        Raises:
+            ValueError: If the turtle would move outside the screen limits and its boundary policy is 'raise'.
+        """
+        x, y, angle = turtle.x, turtle.y, turtle.angle
+        pen, color, thickness = turtle.is_pen_down, turtle.line_color, turtle.line_thickness
+        outputs, operands, strings = turtle._outputs, self.operands, self.strings
+        cos, sin, radians = math.cos, math.sin, math.radians
+        k = 0
+        try:
+            for opcode in self.opcodes:
+                if opcode == FORWARD:
+                    distance = operands[k]
+                    k += 1
+                    new_x = x + distance * cos(radians(angle))
+                    new_y = y + distance * sin(radians(angle))
+                    if not (-SCREEN_LIMIT_X <= new_x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= new_y <= SCREEN_LIMIT_Y
+                            and -SCREEN_LIMIT_X <= x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= y <= SCREEN_LIMIT_Y):
+                        # Moves leaving the screen go through the turtle, which applies its boundary policy
+                        turtle.x, turtle.y, turtle.angle = x, y, angle
+                        turtle.is_pen_down, turtle.line_color, turtle.line_thickness = pen, color, thickness
+                        turtle.forward(distance)
+                        x, y = turtle.x, turtle.y
+                        continue
+                    if pen:
+                        for output in outputs:
+                            output.add_segment(x, y, new_x, new_y, color, thickness)
+                    x, y = new_x, new_y
+                elif opcode == LEFT:
+                    angle += operands[k]
+                    angle %= 360
+                    k += 1
+                elif opcode == PEN_UP or opcode == PEN_DOWN:
+                    pen = opcode == PEN_DOWN
+                elif opcode == SET_COLOR:
+                    color = strings[int(operands[k])]
+                    k += 1
+                elif opcode == SET_THICKNESS:
+                    thickness = operands[k]
+                    k += 1
+                elif opcode == SET_ANGLE:
+                    angle = operands[k]
+                    k += 1
+                else:
+                    # goto and circle are rare, so they go through the Turtle methods
+                    turtle.x, turtle.y, turtle.angle = x, y, angle
+                    turtle.is_pen_down, turtle.line_color, turtle.line_thickness = pen, color, thickness
+                    if opcode == GOTO:
+                        turtle.goto(operands[k], operands[k + 1])
+                    else:
+                        tolerance = operands[k + 2]
+                        turtle.circle(operands[k], operands[k + 1], None if math.isnan(tolerance) else tolerance)
+                    k += ARITY[opcode]
+                    x, y, angle = turtle.x, turtle.y, turtle.angle
+        finally:
+            turtle.x, turtle.y, turtle.angle = x, y, angle
+            turtle.is_pen_down, turtle.line_color, turtle.line_thickness = pen, color, thickness
+
+
+    def _compile_blocks(self) -> list:
+        """Split the program into walks (runs of moves, turns and pen changes) and other commands.
+        Returns:
+            list: ('walk', turns, distances, pens, final_pen) and ('command', name, arguments) tuples. In a walk, each
+                move is preceded by the turns recorded before it, and pens holds 1 (down), 0 (up) or -1 (as at the
+                start of the walk) for every move. A final turn without a move is a move of 0 with the pen up.
+        """
+        blocks = []
+        turns, distances, pens = [], [], []
+        pending_turn, pen = 0.0, -1
+
+        def close_walk():
+            nonlocal turns, distances, pens, pending_turn, pen
+            if pending_turn:
+                turns.append(pending_turn)
+                distances.append(0.0)
+                pens.append(0)
+            if distances:
+                blocks.append(('walk', turns, distances, pens, pen))
+            elif pen >= 0:
+                blocks.append(('command', 'pen_down' if pen else 'pen_up', ()))
+            turns, distances, pens, pending_turn, pen = [], [], [], 0.0, -1
+
+        for name, operands in self.commands():
+            if name == 'forward':
+                turns.append(pending_turn)
+                distances.append(operands[0])
+                pens.append(pen)
+                pending_turn = 0.0
+            elif name == 'left':
+                pending_turn += operands[0]
+            elif name in ('pen_up', 'pen_down'):
+                pen = int(name == 'pen_down')
+            else:
+                close_walk()
+                blocks.append(('command', name, operands))
+        close_walk()
+        return blocks
+
+
+    def run_vectorized(self, turtle) -> None:
+        """Run the program on a turtle, computing every run of moves and turns with NumPy cumulative sums.
+        The drawing matches run() within floating-point error. Without NumPy, the runs are computed by Turtle.walk in
+        plain Python, which is no faster than run() but still checks each run before drawing it.
+        Args:
+            turtle (Turtle): The turtle to run the program on.
+        Raises:
+            ValueError: If the turtle would move outside the screen limits and its boundary policy is 'raise'.
+                Each run of moves is checked before any of it is drawn.
+        """
+        np = get_numpy()
+        if self._blocks is None:
+            self._blocks = self._compile_blocks()
+
+        for block in self._blocks:
+            if block[0] == 'command':
+                getattr(turtle, block[1])(*block[2])
+                continue
+
+            _, turns, distances, pens, final_pen = block
+            if np is not None:
+                pens = np.asarray(pens)
+                pens = np.where(pens < 0, turtle.is_pen_down, pens)
+            else:
+                pens = [turtle.is_pen_down if pen < 0 else bool(pen) for pen in pens]
+            turtle.walk(turns, distances, pens)
+            if final_pen >= 0:
+                turtle.is_pen_down = bool(final_pen)
+
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+
+    def __repr__(self) -> str:
+        return f"Program({len(self)} commands)"
+
+
+class ProgramRecorder:
+    """Turtle-like object that records the drawing commands called on it into a Program.
+    Arguments are checked the same way as by the Turtle class when they are recorded.
+    Attributes:
+        program (Program): The program being recorded.
+    """
+    def __init__(self, program: Program = None) -> None:
+        """Initialise the recorder with a new or an existing program."""
+        self.program = Program() if program is None else program
+
+
+    @staticmethod
+    def _check_number(value, name: str) -> None:
+        """Raise a TypeError if a value is not a number."""
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Invalid type for {name}: {type(value).__name__}. Expected a number.")
+
+
+    def forward(self, distance: float) -> None:
+        """Record a move forward."""
+        self._check_number(distance, 'distance')
+        self.program.append(FORWARD, distance)
+
+
+    def backward(self, distance: float) -> None:
+        """Record a move backward."""
+        self._check_number(distance, 'distance')
+        self.program.append(FORWARD, -distance)
+
+
+    def right(self, angle: float) -> None:
+        """Record a turn to the right."""
+        self._check_number(angle, 'angle')
+        self.program.append(LEFT, -angle)
+
+
+    def left(self, angle: float) -> None:
+        """Record a turn to the left."""
+        self._check_number(angle, 'angle')
+        self.program.append(LEFT, angle)
+
+
+    def circle(self, radius: float, extent: float = 360, tolerance: float = None) -> None:
+        """Record a circle."""
+        self._check_number(radius, 'radius')
+        self._check_number(extent, 'extent')
+        if tolerance is not None:
+            self._check_number(tolerance, 'tolerance')
+            if tolerance <= 0:
+                raise ValueError("Tolerance must be positive.")
+        self.program.append(CIRCLE, radius, extent, math.nan if tolerance is None else tolerance)
+
+
+    def pen_up(self) -> None:
+        """Record lifting the pen."""
+        self.program.append(PEN_UP)
+
+
+    def pen_down(self) -> None:
+        """Record putting the pen down."""
+        self.program.append(PEN_DOWN)
+
+
+    def set_initial_angle(self, angle: float) -> None:
+        """Record setting the angle."""
+        if not isinstance(angle, (int, float)):
+            raise TypeError("Angle must be a number.")
+        self.program.append(SET_ANGLE, angle)
+
+
+    def goto(self, x: float, y: float) -> None:
+        """Record a move to a specific set of coordinates."""
+        if x is None or y is None:
+            x, y = 0, 0
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+            raise TypeError(f"Invalid coordinate types: x is {type(x).__name__}, y is {type(y).__name__}. Expected numbers.")
+        self.program.append(GOTO, x, y)
+
+
+    def set_pen_color(self, color: str) -> None:
+        """Record setting the colour of the pen."""
+        if not isinstance(color, str):
+            raise TypeError("Line colour must be a string.")
+        self.program.append(SET_COLOR, self.program.string(color))
+
+
+    def set_line_thickness(self, thickness: float) -> None:
+        """Record setting the thickness of the line."""
+        if not isinstance(thickness, (int, float)):
+            raise TypeError("Line thickness must be a number.")
+        self.program.append(SET_THICKNESS, thickness)
+
+
+def record(procedure, *args, **kwargs) -> Program:
+    """Record the turtle commands made by a procedure.
+    Args:
+        procedure: A function whose first argument is the turtle to draw with, e.g. draw_koch_snowflake.
+        args: The other positional arguments of the procedure.
+        kwargs: The keyword arguments of the procedure.
+    Returns:
+        Program: The recorded program.
+    """
+    recorder = ProgramRecorder()
+    procedure(recorder, *args, **kwargs)
+    return recorder.program
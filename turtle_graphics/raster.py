@@ -0,0 +1,320 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+NumPy rasterizer for Turtle Graphics Implementation in Python
+
+This module provides an optional rendering backend that does not use matplotlib at all.
+It draws the Turtles' lines and symbols straight into a NumPy RGBA image using vectorized operations,
+and includes a minimal PNG encoder built on zlib, which makes it well suited to bulk thumbnail generation.
+
+Functions:
+    parse_color(color): Converts a colour name or hex string into an RGBA tuple.
+    rasterize(*args, width=400, height=400, dpi=100, antialias=True, background='white', draw_symbols=True):
+        Draws the paths of all provided Turtle instances into a uint8 RGBA image.
+    encode_png(image, compression=6): Encodes an RGBA image as PNG bytes.
+    render_png(target, *args, **options): Rasterizes the provided Turtle instances and writes them to a PNG file.
+
+Example:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.raster import render_png
+
+    t = Turtle()
+    t.forward(100)
+    render_png("example.png", t, width=256, height=256)
+
+Note:
+    The image covers the canvas (-SCREEN_LIMIT_X, SCREEN_LIMIT_X) x (-SCREEN_LIMIT_Y, SCREEN_LIMIT_Y), like the
+    matplotlib plot, but without axes, ticks or title. The canvas is fitted with an equal aspect and centred, so an
+    image of another shape than the canvas has margins rather than stretched lines. Line thickness is given in
+    points, as in matplotlib, and converted to pixels with the dpi argument.
+
+Dependencies:
+    - numpy: Used for the vectorized rasterization.
+    - zlib: Used to compress the PNG image data.
+    - config: Provides the canvas size limits.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+import os
+import struct
+import time
+import zlib
+import numpy as np
+from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+
+# Colours understood without matplotlib: matplotlib's single letter colours plus common CSS names
+NAMED_COLORS = {
+    'b': (0, 0, 255), 'g': (0, 128, 0), 'r': (255, 0, 0), 'c': (0, 191, 191),
+    'm': (191, 0, 191), 'y': (191, 191, 0), 'k': (0, 0, 0), 'w': (255, 255, 255),
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 128, 0),
+    'blue': (0, 0, 255), 'yellow': (255, 255, 0), 'cyan': (0, 255, 255), 'magenta': (255, 0, 255),
+    'orange': (255, 165, 0), 'purple': (128, 0, 128), 'brown': (165, 42, 42), 'pink': (255, 192, 203),
+    'gray': (128, 128, 128), 'grey': (128, 128, 128), 'lime': (0, 255, 0), 'navy': (0, 0, 128),
+    'teal': (0, 128, 128), 'olive': (128, 128, 0), 'maroon': (128, 0, 0), 'gold': (255, 215, 0),
+    'silver': (192, 192, 192), 'violet': (238, 130, 238), 'indigo': (75, 0, 130),
+    'darkgreen': (0, 100, 0), 'darkblue': (0, 0, 139), 'darkred': (139, 0, 0), 'lightblue': (173, 216, 230),
+}
+
+SYMBOL_SIZE = 5                 #Same size as the triangle drawn by drawing.draw_symbol
+SAMPLES_PER_BATCH = 1 << 16     #Bounds the temporary memory used per rasterization step
+
+
+def parse_color(color: str) -> tuple[int, int, int, int]:
+    """Convert a colour into an RGBA tuple.
+    Args:
+        color (str): A colour name or a '#rgb', '#rrggbb' or '#rrggbbaa' hex string.
+    Returns:
+        tuple[int, int, int, int]: The red, green, blue and alpha components between 0 and 255.
+    Raises:
+        ValueError: If the colour is not recognised.
+    """
+    name = color.strip().lower()
+    if name in NAMED_COLORS:
+        return NAMED_COLORS[name] + (255,)
+    if name.startswith('#') and len(name) in (4, 7, 9):
+        digits = name[1:]
+        if len(digits) == 3:
+            digits = ''.join(digit * 2 for digit in digits)
+        try:
+            components = tuple(int(digits[i:i + 2], 16) for i in range(0, len(digits), 2))
+        except ValueError:
+            pass
+        else:
+            return components + (255,) if len(components) == 3 else components
+
+    try:
+        # Fall back on matplotlib's colour names when it is installed
+        from matplotlib.colors import to_rgba
+    except ImportError:
+        raise ValueError(f"Unknown colour: {color}.") from None
+    return tuple(int(round(component * 255)) for component in to_rgba(color))
+
+
+def _pixel_scale(width: int, height: int) -> float:
+    """Get the number of pixels per canvas unit that fits the whole canvas in the image with an equal aspect."""
+    return min(width / (2 * SCREEN_LIMIT_X), height / (2 * SCREEN_LIMIT_Y))
+
+
+def _to_pixels(x, y, width: int, height: int):
+    """Convert canvas coordinates to (continuous) pixel coordinates, with y pointing down.
+    The canvas is fitted in the image with an equal aspect and centred, so circles stay round in any image size.
+    """
+    scale = _pixel_scale(width, height)
+    px = width / 2 + x * scale
+    py = height / 2 - y * scale
+    return px, py
+
+
+def _line_coverage(segments, half_width: float, width: int, height: int, antialias: bool):
+    """Compute the coverage of a set of lines of the same thickness.
+    Each line is sampled every half pixel, and the pixels around every sample are given a coverage based on
+    their exact distance to the line the sample belongs to.
+    Args:
+        segments: A (n, 4) array of x0, y0, x1, y1 pixel coordinates.
+        half_width (float): Half of the line thickness in pixels.
+        width (int): Width of the image in pixels.
+        height (int): Height of the image in pixels.
+        antialias (bool): Whether the edges of the lines are smoothed.
+    Returns:
+        A flat float32 array of height * width coverage values between 0 and 1.
+    """
+    coverage = np.zeros(width * height, dtype=np.float32)
+    x0, y0, x1, y1 = segments.T
+    dx, dy = x1 - x0, y1 - y0
+    length_sq = dx * dx + dy * dy
+    counts = np.ceil(np.sqrt(length_sq) * 2).astype(np.int64) + 1
+
+    reach = int(math.ceil(half_width + 1))
+    offsets = np.arange(-reach, reach + 1)
+    kernel_x, kernel_y = (k.ravel() for k in np.meshgrid(offsets, offsets))
+
+    # Process the lines in batches so that the temporary arrays stay small
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        processed = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, processed + SAMPLES_PER_BATCH, side='right')), start + 1)
+        batch = slice(start, stop)
+        n = counts[batch]
+        owner = np.repeat(np.arange(start, stop), n)
+        first = np.repeat(np.cumsum(n) - n, n)
+        t = (np.arange(len(owner)) - first) / np.maximum(np.repeat(n, n) - 1, 1)
+        sample_x = np.floor(x0[owner] + t * dx[owner]).astype(np.int64)
+        sample_y = np.floor(y0[owner] + t * dy[owner]).astype(np.int64)
+        # Consecutive samples of a line in the same pixel cover the same pixels, so only the first one is kept
+        repeated = np.zeros(len(owner), dtype=bool)
+        repeated[1:] = (sample_x[1:] == sample_x[:-1]) & (sample_y[1:] == sample_y[:-1]) & (owner[1:] == owner[:-1])
+        if repeated.any():
+            owner, sample_x, sample_y = owner[~repeated], sample_x[~repeated], sample_y[~repeated]
+
+        for kx, ky in zip(kernel_x, kernel_y):
+            px, py = sample_x + kx, sample_y + ky
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            if not inside.any():
+                continue
+            px, py, line = px[inside], py[inside], owner[inside]
+
+            # Distance from the pixel centre to the closest point of its line
+            cx, cy = px + 0.5 - x0[line], py + 0.5 - y0[line]
+            u = np.clip((cx * dx[line] + cy * dy[line]) / np.maximum(length_sq[line], 1e-12), 0, 1)
+            distance = np.hypot(cx - u * dx[line], cy - u * dy[line])
+            if antialias:
+                value = np.clip(half_width + 0.5 - distance, 0, 1).astype(np.float32)
+            else:
+                value = (distance <= max(half_width, 0.5)).astype(np.float32)
+            np.maximum.at(coverage, py * width + px, value)
+        start = stop
+    return coverage
+
+
+def _triangle_coverage(vertices, width: int, height: int):
+    """Compute the coverage of a filled triangle given in pixel coordinates."""
+    coverage = np.zeros(width * height, dtype=np.float32)
+    xs, ys = zip(*vertices)
+    left, right = max(int(math.floor(min(xs))), 0), min(int(math.ceil(max(xs))), width)
+    top, bottom = max(int(math.floor(min(ys))), 0), min(int(math.ceil(max(ys))), height)
+    if left >= right or top >= bottom:
+        return coverage
+
+    grid_y, grid_x = np.mgrid[top:bottom, left:right] + 0.5
+    signs = []
+    for (ax, ay), (bx, by) in zip(vertices, vertices[1:] + vertices[:1]):
+        signs.append((bx - ax) * (grid_y - ay) - (by - ay) * (grid_x - ax))
+    inside = ((signs[0] >= 0) & (signs[1] >= 0) & (signs[2] >= 0)) | ((signs[0] <= 0) & (signs[1] <= 0) & (signs[2] <= 0))
+    rows, columns = np.nonzero(inside)
+    coverage[(rows + top) * width + columns + left] = 1
+    return coverage
+
+
+def _composite(image, coverage, color: str) -> None:
+    """Blend a colour over the image, weighted by a flat coverage array.
+    The image holds straight (not premultiplied) alpha, as PNG does, so over a transparent background the colour
+    keeps its components and only the alpha follows the coverage.
+    """
+    red, green, blue, alpha = parse_color(color)
+    # Only the covered pixels are blended, so the cost follows the lines rather than the size of the image
+    pixels = image.reshape(-1, 4)
+    covered = np.flatnonzero(coverage)
+    blended = pixels[covered]
+    weight = coverage[covered, None] * (alpha / 255)
+    below = blended[:, 3:] / 255 * (1 - weight)         #Alpha of the image left showing under the colour
+    out_alpha = weight + below
+    rgb = weight * np.array((red, green, blue), dtype=np.float32) + blended[:, :3] * below
+    np.divide(rgb, out_alpha, out=blended[:, :3], where=out_alpha > 0)
+    blended[:, 3:] = out_alpha * 255
+    pixels[covered] = blended
+
+
+def rasterize(*args, width: int = 400, height: int = 400, dpi: float = 100, antialias: bool = True,
+              background: str = 'white', draw_symbols: bool = True):
+    """Draw all provided turtles into an RGBA image.
+    Args:
+        args: A list that may start with a title (str) followed by Turtle objects. The title is not drawn.
+        width (int): Width of the image in pixels.
+        height (int): Height of the image in pixels.
+        dpi (float): Dots per inch, used to convert line thickness from points to pixels.
+        antialias (bool): Whether the edges of the lines are smoothed.
+        background (str): Colour of the background, or None for a transparent background.
+        draw_symbols (bool): Whether the turtles' symbols are drawn.
+    Returns:
+        numpy.ndarray: A (height, width, 4) uint8 array with the image.
+    """
+    turtles = args[1:] if args and isinstance(args[0], str) else args
+    image = np.zeros((height, width, 4), dtype=np.float32)
+    if background is not None:
+        image[...] = parse_color(background)
+
+    for turtle in turtles:
+        joint = None    #(style index, coverage) of the last polyline of the previous chunk, not yet blended
+        for store in turtle.get_drawing_data().chunks():
+            if not len(store):
+                continue
+            # Arcs are turned into lines accurate to a quarter of a pixel
+            lines, ids = store.to_numpy_segments(tolerance=0.25 / _pixel_scale(width, height))
+            px0, py0 = _to_pixels(lines[:, 0, 0], lines[:, 0, 1], width, height)
+            px1, py1 = _to_pixels(lines[:, 1, 0], lines[:, 1, 1], width, height)
+            segments = np.column_stack((px0, py0, px1, py1))
+            last_style, following = store.run_styles[-1], None
+            for style_index in np.unique(ids):
+                color, thickness = store.styles[style_index]
+                half_width = max(thickness * dpi / 72, 1) / 2
+                coverage = _line_coverage(segments[ids == style_index], half_width, width, height, antialias)
+                if joint is not None and joint[0] == style_index:
+                    # A polyline going on from the previous chunk shares its first vertex with it: blend it only once
+                    np.maximum(coverage, joint[1], out=coverage)
+                    joint = None
+                if style_index == last_style:
+                    following = (style_index, coverage)
+                else:
+                    _composite(image, coverage, color)
+            if joint is not None:
+                _composite(image, joint[1], store.styles[joint[0]][0])
+            joint = following
+        if joint is not None:
+            _composite(image, joint[1], turtle.get_drawing_data().styles[joint[0]][0])
+
+        if draw_symbols:
+            angle = math.radians(turtle.angle)
+            vertices = [_to_pixels(turtle.x + SYMBOL_SIZE * math.cos(angle + k * 2.0 * math.pi / 3),
+                                   turtle.y + SYMBOL_SIZE * math.sin(angle + k * 2.0 * math.pi / 3), width, height)
+                        for k in range(3)]
+            _composite(image, _triangle_coverage(vertices, width, height), turtle.turtle_color)
+
+    return np.clip(np.rint(image), 0, 255).astype(np.uint8)
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk: length, type, data and CRC."""
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+
+
+def encode_png(image, compression: int = 6) -> bytes:
+    """Encode an RGBA image as a PNG file.
+    Args:
+        image: A (height, width, 4) uint8 array.
+        compression (int): The zlib compression level, from 0 (fastest) to 9 (smallest).
+    Returns:
+        bytes: The PNG file contents.
+    Raises:
+        ValueError: If the image is not a (height, width, 4) array.
+    """
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    if image.ndim != 3 or image.shape[2] != 4:
+        raise ValueError(f"Invalid image shape: {image.shape}. Expected (height, width, 4).")
+
+    height, width = image.shape[:2]
+    # Every row starts with a filter type byte, 0 meaning no filter
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * 4)
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)   #8 bits per channel, colour type 6 (RGBA)
+    return (b'\x89PNG\r\n\x1a\n' + _chunk(b'IHDR', header)
+            + _chunk(b'IDAT', zlib.compress(rows.tobytes(), compression)) + _chunk(b'IEND', b''))
+
+
+def render_png(target, *args, compression: int = 6, **options) -> dict[str, float]:
+    """Rasterize all provided turtles and write them to a PNG file.
+    Args:
+        target: A file path or a binary file-like object to write the image to.
+        args: A list that may start with a title (str) followed by Turtle objects.
+        compression (int): The zlib compression level, from 0 (fastest) to 9 (smallest).
+        options: Keyword arguments passed on to rasterize.
+    Returns:
+        dict[str, float]: Duration in seconds of each render phase ('draw', 'write') and the 'total'.
+    """
+    start = time.perf_counter()
+    image = rasterize(*args, **options)
+    drawn = time.perf_counter()
+
+    data = encode_png(image, compression)
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, 'wb') as file:
+            file.write(data)
+    else:
+        target.write(data)
+    written = time.perf_counter()
+
+    return {'draw': drawn - start, 'write': written - drawn, 'total': written - start}
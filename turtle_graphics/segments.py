@@ -0,0 +1,546 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Segment storage for Turtle Graphics Implementation in Python
+
+This module provides a compact, columnar store for the lines recorded by a Turtle.
+Instead of keeping one nested tuple per line, the store keeps the lines as polylines ("runs"):
+a line that starts where the previous one ended, with the same colour and thickness, only adds
+its end point to the current run. The vertices of every run live in one contiguous array of floats,
+and each run has a start index and a small integer index into an interned (colour, thickness) style table.
+Circular arcs can also be recorded exactly, as a centre, radius, start angle and extent, and are only
+turned into line segments when they are read, with as many segments as the reader needs.
+
+Classes:
+    SegmentStore: Append-only store of line segments backed by contiguous arrays.
+    DrawingArrays: The raw arrays of a SegmentStore, for bulk consumers such as renderers.
+
+Usage:
+    from turtle_graphics.segments import SegmentStore
+    store = SegmentStore()
+    store.add_segment(0, 0, 10, 0, 'black', 1)
+    store.add_segment(10, 0, 10, 10, 'black', 1)     # continues the first run
+    store[1]            # ((10.0, 0.0), (10.0, 10.0), 'black', 1)
+    vertices, run_starts, run_styles, styles, run_arcs, arcs = store.arrays()
+
+Note:
+    The arrays are Python array.array objects and therefore support the buffer protocol, so they can be
+    wrapped by NumPy without copying, e.g. numpy.frombuffer(vertices, dtype=float).reshape(-1, 2).
+    While such a view is alive the array cannot grow, so release views before recording more lines.
+
+Dependencies:
+    - array: Provides the contiguous, amortised-growth storage.
+    - functools: Defers copying the memoryviews a store is built on until lines are added or removed.
+    - geometry: Turns arcs into line segments.
+    - numpy: Optional. Only needed by the to_numpy_* conversion methods.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import partial
+from typing import NamedTuple
+import math
+from .geometry import arc_points, arc_steps
+
+
+def _float_array(coords) -> array:
+    """Convert a flat sequence or NumPy array of coordinates into a new array of floats."""
+    if hasattr(coords, 'tobytes') and not isinstance(coords, array):
+        return array('d', coords.astype(float).tobytes())     #NumPy arrays are copied in bulk
+    return array('d', coords)
+
+
+class DrawingArrays(NamedTuple):
+    """The raw arrays of a SegmentStore.
+    Attributes:
+        vertices (array): Flat array of floats holding x, y for every vertex of every run.
+        run_starts (array): Index (in vertices, not floats) of the first vertex of every run.
+        run_styles (array): One unsigned integer per run, indexing into styles.
+        styles (list[tuple[str, float]]): The interned (color, thickness) style table.
+        run_arcs (array): Index of the arc of every run in arcs, or -1 for polyline runs.
+        arcs (array): Flat array of floats holding cx, cy, radius, start_angle, extent, steps for every arc.
+    """
+    vertices: array
+    run_starts: array
+    run_styles: array
+    styles: list
+    run_arcs: array
+    arcs: array
+
+
+class SegmentStore(Sequence):
+    """Append-only store of the line segments drawn by a turtle, coalesced into polylines.
+    The store behaves as a read-only sequence of (start, end, color, thickness) tuples, which are
+    built lazily on access, so it can be used wherever the old list of lines was used.
+    An arc run only keeps its start and end vertices; its parameters live in arcs, and it reads as
+    the number of line segments given when it was recorded.
+    Attributes:
+        vertices (array): Flat array of floats holding x, y for every vertex of every run.
+        run_starts (array): Index (in vertices, not floats) of the first vertex of every run.
+        run_styles (array): One unsigned integer per run, indexing into styles.
+        run_segments (array): Index of the first line segment of every run, as read through the sequence interface.
+        run_arcs (array): Index of the arc of every run in arcs, or -1 for polyline runs.
+        arcs (array): Flat array of floats holding cx, cy, radius, start_angle, extent, steps for every arc.
+        styles (list[tuple[str, float]]): The interned (color, thickness) style table.
+        generation (int): Incremented whenever lines are removed from the arrays, by clear, truncate, or by spilling
+            them to disk for stores that do. As lines are otherwise only appended, (generation, len(store)) identifies
+            the content of the store, e.g. to tell whether a cache is stale.
+    """
+    ARC_FIELDS = 6
+    _ARRAY_TYPES = {'vertices': 'd', 'run_starts': 'q', 'run_styles': 'I', 'run_arcs': 'q', 'arcs': 'd', 'run_segments': 'q'}
+    _WRITERS = ('add_segment', 'add_polyline', 'add_arc', 'clear', 'truncate')     #The methods changing the arrays
+
+    def __init__(self) -> None:
+        """Initialise an empty store."""
+        self.vertices = array('d')
+        self.run_starts = array('q')
+        self.run_styles = array('I')
+        self.run_segments = array('q')
+        self.run_arcs = array('q')
+        self.arcs = array('d')
+        self.styles = []
+        self._style_lookup = {}
+        self._last_style = None      #(color, thickness, style_id) of the last added segment
+        self._end_x = self._end_y = None     #Last vertex of the last polyline run, which a new segment may continue
+        self._segment_count = 0
+        self.generation = 0
+
+
+    def style_id(self, color: str, thickness: float) -> int:
+        """Get the index of a style in the style table, adding it if it is new.
+        Args:
+            color (str): The line colour.
+            thickness (float): The line thickness.
+        Returns:
+            int: The index of (color, thickness) in the style table.
+        """
+        last = self._last_style
+        if last is not None and last[0] == color and last[1] == thickness:
+            return last[2]
+
+        key = (color, thickness)
+        index = self._style_lookup.get(key)
+        if index is None:
+            index = len(self.styles)
+            self.styles.append(key)
+            self._style_lookup[key] = index
+        self._last_style = (color, thickness, index)
+        return index
+
+
+    def _start_run(self, style: int, arc: int = -1) -> None:
+        """Start a new run at the end of the vertex array."""
+        self.run_starts.append(len(self.vertices) // 2)
+        self.run_styles.append(style)
+        self.run_segments.append(self._segment_count)
+        self.run_arcs.append(arc)
+
+
+    def add_segment(self, x0: float, y0: float, x1: float, y1: float, color: str, thickness: float) -> None:
+        """Append a line segment to the store, extending the last run when the segment continues it.
+        Args:
+            x0 (float): X-coordinate of the start of the line.
+            y0 (float): Y-coordinate of the start of the line.
+            x1 (float): X-coordinate of the end of the line.
+            y1 (float): Y-coordinate of the end of the line.
+            color (str): The line colour.
+            thickness (float): The line thickness.
+        """
+        # Most segments are drawn in the style of the one before, which is checked here without calling style_id
+        last = self._last_style
+        if last is not None and last[0] == color and last[1] == thickness:
+            style = last[2]
+        else:
+            style = self.style_id(color, thickness)
+        if x0 == self._end_x and y0 == self._end_y and style == self.run_styles[-1]:
+            self.vertices.extend((x1, y1))
+        else:
+            self._start_run(style)
+            self.vertices.extend((x0, y0, x1, y1))
+        self._end_x, self._end_y = x1, y1
+        self._segment_count += 1
+
+
+    def add_polyline(self, coords, color: str, thickness: float) -> None:
+        """Append a polyline to the store, extending the last run when the polyline continues it.
+        Args:
+            coords: Flat sequence (or NumPy array) of floats holding x, y for at least two vertices.
+            color (str): The line colour.
+            thickness (float): The line thickness.
+        """
+        coords = _float_array(coords)
+        if len(coords) < 4:
+            return
+        style = self.style_id(color, thickness)
+        if coords[0] == self._end_x and coords[1] == self._end_y and style == self.run_styles[-1]:
+            del coords[:2]
+        else:
+            self._start_run(style)
+            self._segment_count -= 1     #The first vertex of a new run does not end a segment
+        self.vertices.extend(coords)
+        self._segment_count += len(coords) // 2
+        self._end_x, self._end_y = coords[-2], coords[-1]
+
+
+    def add_arc(self, cx: float, cy: float, radius: float, start_angle: float, extent: float, steps: int,
+                color: str, thickness: float) -> None:
+        """Append an exact circular arc to the store, as a run of its own.
+        Args:
+            cx (float): X-coordinate of the centre of the arc.
+            cy (float): Y-coordinate of the centre of the arc.
+            radius (float): The radius of the arc.
+            start_angle (float): Angle in degrees of the start of the arc, seen from the centre.
+            extent (float): Angle in degrees covered by the arc, counterclockwise when positive.
+            steps (int): The number of line segments the arc reads as through the sequence interface.
+            color (str): The line colour.
+            thickness (float): The line thickness.
+        """
+        self._start_run(self.style_id(color, thickness), len(self.arcs) // self.ARC_FIELDS)
+        self.arcs.extend((cx, cy, radius, start_angle, extent, steps))
+        self.vertices.extend(arc_points(cx, cy, radius, start_angle, extent, 1))     #Start and end points
+        self._segment_count += steps
+        self._end_x = self._end_y = None     #Lines never extend an arc run
+
+
+    def arrays(self) -> DrawingArrays:
+        """Get the raw arrays backing the store, without copying them.
+        Returns:
+            DrawingArrays: The vertex array, the run start and run style arrays, the style table and the arc arrays.
+        """
+        return DrawingArrays(self.vertices, self.run_starts, self.run_styles, self.styles, self.run_arcs, self.arcs)
+
+
+    def chunks(self):
+        """Iterate over the chunks of the store, for renderers and exporters that stream the drawing.
+        A store is a single chunk; stores that spill lines to disk yield one store per spilled chunk as well.
+        Yields:
+            SegmentStore: The stores holding the lines of each chunk, in the order they were drawn.
+        """
+        yield self
+
+
+    def chunk_arrays(self):
+        """Iterate over the raw arrays of every chunk, with the run indices shifted so that the chunks, one after the
+        other, form the arrays of a single store, e.g. to write them to a file in bulk.
+        Yields:
+            tuple[DrawingArrays, array]: The arrays of a chunk and its run_segments array. The vertex and arc arrays
+                are not copied, and neither are the run arrays of the first chunk.
+        """
+        vertex_offset = arc_offset = segment_offset = 0
+        for chunk in self.chunks():
+            run_starts, run_segments, run_arcs = chunk.run_starts, chunk.run_segments, chunk.run_arcs
+            if vertex_offset:
+                run_starts = array('q', (start + vertex_offset for start in run_starts))
+                run_segments = array('q', (segment + segment_offset for segment in run_segments))
+                run_arcs = array('q', (arc + arc_offset if arc >= 0 else arc for arc in run_arcs))
+            yield DrawingArrays(chunk.vertices, run_starts, chunk.run_styles, chunk.styles, run_arcs, chunk.arcs), run_segments
+            vertex_offset += len(chunk.vertices) // 2
+            arc_offset += len(chunk.arcs) // self.ARC_FIELDS
+            segment_offset += len(chunk)
+
+
+    @classmethod
+    def from_arrays(cls, arrays: DrawingArrays, run_segments=None) -> 'SegmentStore':
+        """Build a store from the raw arrays of another store, e.g. received from another process or mapped from a file.
+        Args:
+            arrays (DrawingArrays): The arrays, as returned by arrays(). Arrays, or memoryviews, of the right type are
+                used without copying. Memoryviews, e.g. of a mapped file, are copied into arrays the first time lines
+                are added to or removed from the store.
+            run_segments: The index of the first line segment of every run. Computed from the runs when not given.
+        Returns:
+            SegmentStore: A store holding the same lines.
+        """
+        store = cls()
+        for name, typecode in cls._ARRAY_TYPES.items():
+            values = getattr(arrays, name) if name != 'run_segments' else run_segments
+            if values is None:
+                continue
+            if not (isinstance(values, array) and values.typecode == typecode
+                    or isinstance(values, memoryview) and values.format == typecode):
+                values = array(typecode, values)
+            setattr(store, name, values)
+        store.styles = list(arrays.styles)
+        store._style_lookup = {style: index for index, style in enumerate(store.styles)}
+
+        count = len(store.run_starts)
+        if run_segments is None:
+            for i in range(count - 1):
+                store.run_segments.append(store._segment_count)
+                store._segment_count += store._run_length(i, store.run_starts[i + 1])
+        if count:
+            if run_segments is None:
+                store.run_segments.append(store._segment_count)
+            store._segment_count = store.run_segments[-1] + store._run_length(count - 1, len(store.vertices) // 2)
+            if store.run_arcs[-1] < 0:
+                store._end_x, store._end_y = store.vertices[-2], store.vertices[-1]
+        if any(isinstance(getattr(store, name), memoryview) for name in store._ARRAY_TYPES):
+            # The methods changing the arrays are shadowed until the first call, which copies them
+            for method in store._WRITERS:
+                setattr(store, method, partial(store._copy_on_write, method))
+        return store
+
+
+    def _copy_on_write(self, method: str, *args):
+        """Copy the memoryviews backing the store into arrays that can grow, then call one of the _WRITERS methods."""
+        for name, typecode in self._ARRAY_TYPES.items():
+            values = getattr(self, name)
+            if isinstance(values, memoryview):
+                copy = array(typecode)
+                copy.frombytes(values.cast('B'))
+                setattr(self, name, copy)
+        for name in self._WRITERS:
+            del self.__dict__[name]
+        return getattr(self, method)(*args)
+
+
+    def _run_length(self, run: int, end: int) -> int:
+        """Get the number of line segments of a run that ends at the given vertex index."""
+        if self.run_arcs[run] >= 0:
+            return self.arc(self.run_arcs[run])[5]
+        return end - self.run_starts[run] - 1
+
+
+    def arc(self, index: int) -> tuple[float, float, float, float, float, int]:
+        """Get the parameters of an arc.
+        Args:
+            index (int): The index of the arc, as found in run_arcs.
+        Returns:
+            tuple[float, float, float, float, float, int]: The centre x and y, radius, start angle, extent and number of steps.
+        """
+        cx, cy, radius, start_angle, extent, steps = self.arcs[self.ARC_FIELDS * index:self.ARC_FIELDS * (index + 1)]
+        return cx, cy, radius, start_angle, extent, int(steps)
+
+
+    def runs(self):
+        """Iterate over the runs of the store.
+        Yields:
+            tuple[int, int, int, tuple]: The first vertex index, the end vertex index (exclusive), the style index
+                and, for arc runs, the arc parameters (None for polyline runs) of each run.
+        """
+        starts, styles, arcs = self.run_starts, self.run_styles, self.run_arcs
+        count = len(starts)
+        for i in range(count):
+            end = starts[i + 1] if i + 1 < count else len(self.vertices) // 2
+            yield starts[i], end, styles[i], self.arc(arcs[i]) if arcs[i] >= 0 else None
+
+
+    def run_coords(self, start: int, end: int, arc: tuple = None, tolerance: float = None):
+        """Get the vertices of a run, turning arcs into line segments.
+        Args:
+            start (int): The first vertex index of the run.
+            end (int): The end vertex index (exclusive) of the run.
+            arc (tuple): The arc parameters of the run, or None for a polyline run.
+            tolerance (float): The largest distance allowed between an arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+        Returns:
+            A flat sequence of floats holding x, y for every vertex of the run.
+        """
+        if arc is None:
+            return self.vertices[2 * start:2 * end]
+        cx, cy, radius, start_angle, extent, steps = arc
+        if tolerance is not None:
+            steps = arc_steps(radius, extent, tolerance)
+        return arc_points(cx, cy, radius, start_angle, extent, steps)
+
+
+    def to_numpy_polylines(self, tolerance: float = None):
+        """Copy the store into NumPy arrays, one polyline per run.
+        Args:
+            tolerance (float): The largest distance allowed between an arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+        Returns:
+            tuple: A (n, 2) float array with a copy of the vertices (a read-only view of them for a store built on
+                read-only memoryviews), an int64 array with the start of every run plus a final end index, and an
+                array with the style index of every run.
+        """
+        import numpy as np
+        run_styles = np.array(self.run_styles, dtype=np.int64)
+        if not self.arcs:
+            # Vertices that can grow are copied, while read-only memoryviews, e.g. of a mapped file, are used as they are
+            vertices = np.frombuffer(self.vertices, dtype=float).reshape(-1, 2)
+            if not isinstance(self.vertices, memoryview):
+                vertices = vertices.copy()
+            bounds = np.append(np.array(self.run_starts, dtype=np.int64), len(vertices))
+            return vertices, bounds, run_styles
+
+        pieces = [np.asarray(self.run_coords(start, end, arc, tolerance), dtype=float).reshape(-1, 2)
+                  for start, end, _, arc in self.runs()]
+        bounds = np.zeros(len(pieces) + 1, dtype=np.int64)
+        np.cumsum([len(piece) for piece in pieces], out=bounds[1:])
+        return np.concatenate(pieces), bounds, run_styles
+
+
+    def to_numpy_segments(self, tolerance: float = None):
+        """Copy the store into NumPy arrays, one row per line segment.
+        Args:
+            tolerance (float): The largest distance allowed between an arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+        Returns:
+            tuple: A (n, 2, 2) float array with the start and end of every segment, and an array with
+                the style index of every segment.
+        """
+        import numpy as np
+        vertices, bounds, run_styles = self.to_numpy_polylines(tolerance)
+        lengths = np.diff(bounds)
+        # A segment joins every vertex to the next one, except for the last vertex of each run
+        starts = np.ones(len(vertices), dtype=bool)
+        starts[bounds[1:] - 1] = False
+        starts = np.flatnonzero(starts)
+        segments = np.stack((vertices[starts], vertices[starts + 1]), axis=1)
+        return segments, np.repeat(run_styles, lengths - 1)
+
+
+    def polylines_since(self, vertex_count: int, run_count: int, tolerance: float = None):
+        """Get the lines added since the store had vertex_count vertices and run_count runs, e.g. to draw only new lines.
+        Lines continuing the last old run come first, as a polyline starting at its last old vertex.
+        Args:
+            vertex_count (int): The number of vertices of the store at that time.
+            run_count (int): The number of runs of the store at that time.
+            tolerance (float): The largest distance allowed between an arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+        Returns:
+            list[tuple]: The flat x, y coordinates and the style index of every new polyline.
+        """
+        count = len(self.run_starts)
+        polylines = []
+        if run_count:
+            # Only polyline runs grow, so the last old run has new vertices if it ends after vertex_count
+            end = self.run_starts[run_count] if run_count < count else len(self.vertices) // 2
+            if end > vertex_count:
+                polylines.append((self.vertices[2 * (vertex_count - 1):2 * end], self.run_styles[run_count - 1]))
+        for i in range(run_count, count):
+            end = self.run_starts[i + 1] if i + 1 < count else len(self.vertices) // 2
+            arc = self.arc(self.run_arcs[i]) if self.run_arcs[i] >= 0 else None
+            polylines.append((self.run_coords(self.run_starts[i], end, arc, tolerance), self.run_styles[i]))
+        return polylines
+
+
+    def position(self) -> tuple:
+        """Get the position of the end of the store, to get the lines added after it later with since.
+        Returns:
+            tuple: The generation, the number of chunks before the chunk in memory (0), the numbers of vertices, runs and
+                arc floats of the chunk in memory, and the length of the style table.
+        """
+        return (self.generation, 0, len(self.vertices) // 2, len(self.run_starts), len(self.arcs), len(self.styles))
+
+
+    def since(self, position: tuple):
+        """Get the chunks holding the lines added since a position was taken, e.g. to hash or draw only the new lines.
+        Args:
+            position (tuple): A position returned by position().
+        Returns:
+            list[tuple[SegmentStore, int, int, int]]: Every chunk with new lines, with its numbers of vertices, runs and
+                arc floats at the position, in the order they were drawn. None if lines were removed since, so that
+                the whole drawing has to be read again.
+        """
+        generation, _, vertex_count, run_count, arc_count, _ = position
+        if generation != self.generation:
+            return None
+        return [(self, vertex_count, run_count, arc_count)]
+
+
+    def clear(self) -> None:
+        """Remove every segment and style from the store."""
+        for values in (self.vertices, self.run_starts, self.run_styles, self.run_segments, self.run_arcs, self.arcs):
+            del values[:]
+        self.styles.clear()
+        self._style_lookup.clear()
+        self._last_style = None
+        self._end_x = self._end_y = None
+        self._segment_count = 0
+        self.generation += 1
+
+
+    def mark(self) -> tuple:
+        """Get a marker of the current end of the store, to remove the lines added after it later with truncate.
+        Returns:
+            tuple: The lengths of the arrays and of the style table, and the end of the last run.
+        """
+        return (len(self.vertices), len(self.run_starts), len(self.arcs), self._segment_count, len(self.styles),
+                self._end_x, self._end_y)
+
+
+    def truncate(self, mark: tuple) -> None:
+        """Remove the lines and styles added since a marker was taken.
+        As the store is append-only, this only cuts the ends of the arrays, so it does not depend on the number of
+        lines before the marker. The generation is incremented if any line is removed.
+        Args:
+            mark (tuple): A marker returned by mark(), taken since the store was last cleared.
+        Raises:
+            ValueError: If the store is shorter than the marker, i.e. the marker was taken before it was cleared
+                or truncated to an earlier marker.
+        """
+        vertices, runs, arcs, segments, styles, end_x, end_y = mark
+        if vertices > len(self.vertices) or runs > len(self.run_starts) or arcs > len(self.arcs) or styles > len(self.styles):
+            raise ValueError("Invalid marker: the store holds fewer lines than when the marker was taken.")
+        if (vertices, runs, arcs, styles) == (len(self.vertices), len(self.run_starts), len(self.arcs), len(self.styles)):
+            return
+
+        del self.vertices[vertices:]
+        for values in (self.run_starts, self.run_styles, self.run_segments, self.run_arcs):
+            del values[runs:]
+        del self.arcs[arcs:]
+        for style in self.styles[styles:]:
+            del self._style_lookup[style]
+        del self.styles[styles:]
+        self._last_style = None
+        self._end_x, self._end_y = end_x, end_y
+        self._segment_count = segments
+        self.generation += 1
+
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes held by the vertex, run and arc arrays."""
+        return sum(values.itemsize * len(values) for values in
+                   (self.vertices, self.run_starts, self.run_styles, self.run_segments, self.run_arcs, self.arcs))
+
+
+    def _line(self, index: int) -> tuple[tuple[float, float], tuple[float, float], str, float]:
+        """Build the legacy tuple for the segment at a non-negative index."""
+        run = bisect_right(self.run_segments, index) - 1
+        offset = index - self.run_segments[run]
+        color, thickness = self.styles[self.run_styles[run]]
+        if self.run_arcs[run] >= 0:
+            cx, cy, radius, start_angle, extent, steps = self.arc(self.run_arcs[run])
+            a0 = math.radians(start_angle + extent * offset / steps)
+            a1 = math.radians(start_angle + extent * (offset + 1) / steps)
+            return ((cx + radius * math.cos(a0), cy + radius * math.sin(a0)),
+                    (cx + radius * math.cos(a1), cy + radius * math.sin(a1)), color, thickness)
+
+        vertex = self.run_starts[run] + offset
+        x0, y0, x1, y1 = self.vertices[2 * vertex:2 * vertex + 4]
+        return (x0, y0), (x1, y1), color, thickness
+
+
+    def __len__(self) -> int:
+        return self._segment_count
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._line(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return self._line(index)
+
+
+    def __iter__(self):
+        styles = self.styles
+        for start, end, style_index, arc in self.runs():
+            color, thickness = styles[style_index]
+            coords = self.run_coords(start, end, arc)
+            for i in range(0, len(coords) - 2, 2):
+                yield (coords[i], coords[i + 1]), (coords[i + 2], coords[i + 3]), color, thickness
+
+
+    def __repr__(self) -> str:
+        return (f"SegmentStore({len(self)} segments, {len(self.run_starts)} runs, "
+                f"{len(self.arcs) // self.ARC_FIELDS} arcs, {len(self.styles)} styles)")
@@ -0,0 +1,251 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Spatial index for Turtle Graphics Implementation in Python
+
+This module provides a uniform grid over the line segments drawn by a turtle, so that the segments in a
+region of the canvas, or the segment nearest to a point, can be found without looking at every segment.
+Renderers use it to draw only the segments visible in a viewport, e.g. when rendering zoomed tiles of a
+large drawing, so the cost of a render depends on the number of visible segments.
+
+Classes:
+    SegmentGrid: Uniform grid of cells listing the line segments that cross them.
+
+Functions:
+    get_index(store, tolerance=None): Gets the grid of a segment store, building it again only when the store has changed.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.spatial import get_index
+
+    t = Turtle()
+    t.circle(100)
+    grid = get_index(t.get_drawing_data())
+    visible = grid.query_rect(0, 0, 50, 50)       # indices of the segments crossing the rectangle
+    index, distance = grid.nearest(10, 20)
+
+Note:
+    The grid is built with NumPy in a handful of array operations. Each segment is listed in every cell its bounding
+    box covers, except for segments covering more than max_cells_per_segment cells, which are kept in a separate
+    list checked by every query, so a few long lines cannot make the grid grow quadratically.
+
+Dependencies:
+    - math: Provides mathematical functions for calculations.
+    - weakref: Lets the cached grids go away with their segment stores.
+    - numpy: Stores the grid and runs the queries.
+    - geometry: Finds which segments cross a rectangle.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import math
+import weakref
+import numpy as np
+from .geometry import clip_segments
+
+class SegmentGrid:
+    """Uniform grid of cells listing the line segments that cross them.
+    Attributes:
+        segments (numpy.ndarray): (n, 2, 2) array with the start and end of every segment.
+        segment_styles (numpy.ndarray): The style index of every segment.
+        styles (list[tuple[str, float]]): The (color, thickness) style table the style indices refer to.
+        origin (tuple[float, float]): The lower left corner of the grid.
+        cell_size (float): The width and height of a cell.
+        shape (tuple[int, int]): The number of cells along x and y.
+    """
+    def __init__(self, segments, segment_styles=None, styles=None, cell_size: float = None,
+                 segments_per_cell: int = 4, max_cells_per_segment: int = 64) -> None:
+        """Build the grid over a set of line segments.
+        Args:
+            segments: (n, 2, 2) array with the start and end of every segment.
+            segment_styles: The style index of every segment. Defaults to 0 for all of them.
+            styles (list[tuple[str, float]]): The style table the style indices refer to.
+            cell_size (float): The width and height of a cell. By default, it is chosen to have about
+                segments_per_cell segments per cell.
+            segments_per_cell (int): The average number of segments per cell when cell_size is not given.
+            max_cells_per_segment (int): The largest number of cells a segment is listed in. Longer segments are
+                checked by every query instead.
+        """
+        self.segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+        count = len(self.segments)
+        self.segment_styles = (np.zeros(count, dtype=np.int64) if segment_styles is None
+                               else np.asarray(segment_styles, dtype=np.int64))
+        self.styles = styles if styles is not None else []
+
+        lows, highs = self.segments.min(axis=1), self.segments.max(axis=1)     #Bounding box of every segment
+        if count:
+            xmin, ymin = lows.min(axis=0)
+            xmax, ymax = highs.max(axis=0)
+        else:
+            xmin = ymin = xmax = ymax = 0.0
+        if cell_size is None:
+            side = max(xmax - xmin, ymax - ymin, 1e-9)
+            cell_size = side / max(math.ceil(math.sqrt(count / segments_per_cell)), 1)
+        # At most 512 x 512 cells, so the cell table stays small
+        cell_size = max(cell_size, (xmax - xmin) / 512, (ymax - ymin) / 512, 1e-9)
+        self.origin = (float(xmin), float(ymin))
+        self.cell_size = float(cell_size)
+        nx = int((xmax - xmin) // cell_size) + 1
+        ny = int((ymax - ymin) // cell_size) + 1
+        self.shape = (nx, ny)
+
+        # Range of cells covered by the bounding box of every segment
+        cx0, cy0 = self._cells(lows[:, 0], lows[:, 1])
+        cx1, cy1 = self._cells(highs[:, 0], highs[:, 1])
+        widths, heights = cx1 - cx0 + 1, cy1 - cy0 + 1
+        counts = widths * heights
+        large = counts > max_cells_per_segment
+        self.large_segments = np.flatnonzero(large)
+        counts[large] = 0
+
+        # One entry per (segment, cell) pair, sorted by cell, so each cell is a slice of cell_segments
+        ids = np.repeat(np.arange(count), counts)
+        offsets = np.arange(len(ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = np.repeat(cx0, counts) + offsets % np.repeat(widths, counts)
+        cell_y = np.repeat(cy0, counts) + offsets // np.repeat(widths, counts)
+        cell_ids = cell_y * nx + cell_x
+        order = np.argsort(cell_ids, kind='stable')
+        self.cell_segments = ids[order]
+        self.cell_starts = np.zeros(nx * ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_ids, minlength=nx * ny), out=self.cell_starts[1:])
+
+
+    @classmethod
+    def from_store(cls, store, tolerance: float = None, **options) -> 'SegmentGrid':
+        """Build the grid over the segments of a segment store.
+        Args:
+            store (SegmentStore): The store of a turtle.
+            tolerance (float): The largest distance allowed between an exact arc and its line segments.
+                When None, arcs use the number of steps given when they were recorded.
+            options: Keyword arguments passed on to SegmentGrid.
+        Returns:
+            SegmentGrid: The grid.
+        """
+        segments, segment_styles = store.to_numpy_segments(tolerance)
+        return cls(segments, segment_styles, list(store.styles), **options)
+
+
+    def _cells(self, x, y):
+        """Get the column and row of the cells containing points, clamped to the grid."""
+        nx, ny = self.shape
+        cx = np.clip(np.floor((np.asarray(x) - self.origin[0]) / self.cell_size), 0, nx - 1).astype(np.int64)
+        cy = np.clip(np.floor((np.asarray(y) - self.origin[1]) / self.cell_size), 0, ny - 1).astype(np.int64)
+        return cx, cy
+
+
+    def _candidates(self, cx0: int, cy0: int, cx1: int, cy1: int):
+        """Get the segments listed in a block of cells, and the long segments, without duplicates."""
+        nx = self.shape[0]
+        starts, ends = self.cell_starts[:-1], self.cell_starts[1:]
+        # Cells are sorted by row, so the cells of one row of the block form one slice
+        pieces = [self.cell_segments[starts[row * nx + cx0]:ends[row * nx + cx1]] for row in range(cy0, cy1 + 1)]
+        pieces.append(self.large_segments)
+        return np.unique(np.concatenate(pieces))
+
+
+    def query_rect(self, xmin: float, ymin: float, xmax: float, ymax: float):
+        """Find the segments that cross a rectangle.
+        Args:
+            xmin (float): Left side of the rectangle.
+            ymin (float): Bottom side of the rectangle.
+            xmax (float): Right side of the rectangle.
+            ymax (float): Top side of the rectangle.
+        Returns:
+            numpy.ndarray: The sorted indices of the segments crossing or inside the rectangle.
+        """
+        gx, gy = self.origin
+        nx, ny = self.shape
+        if xmax < gx or ymax < gy or xmin > gx + nx * self.cell_size or ymin > gy + ny * self.cell_size:
+            candidates = self.large_segments
+        else:
+            (cx0, cx1), (cy0, cy1) = self._cells((xmin, xmax), (ymin, ymax))
+            candidates = self._candidates(cx0, cy0, cx1, cy1)
+        segments = self.segments[candidates]
+        *_, crossing = clip_segments(segments[:, 0, 0], segments[:, 0, 1], segments[:, 1, 0], segments[:, 1, 1],
+                                     xmin, ymin, xmax, ymax)
+        return candidates[crossing]
+
+
+    def _distances(self, candidates, x: float, y: float):
+        """Get the distance from a point to each of the given segments."""
+        segments = self.segments[candidates]
+        start, direction = segments[:, 0], segments[:, 1] - segments[:, 0]
+        lengths = np.einsum('ij,ij->i', direction, direction)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.einsum('ij,ij->i', (x, y) - start, direction) / lengths
+        t = np.clip(np.nan_to_num(t), 0, 1)     #Zero-length segments are points
+        closest = start + t[:, None] * direction
+        return np.hypot(closest[:, 0] - x, closest[:, 1] - y)
+
+
+    def nearest(self, x: float, y: float) -> tuple[int, float]:
+        """Find the segment nearest to a point.
+        The cells are searched in growing squares around the point, until no segment outside the square can be nearer.
+        Args:
+            x (float): X-coordinate of the point.
+            y (float): Y-coordinate of the point.
+        Returns:
+            tuple[int, float]: The index of the nearest segment and its distance to the point, or (-1, inf) if there are no segments.
+        """
+        if not len(self.segments):
+            return -1, math.inf
+        nx, ny = self.shape
+        gx, gy = self.origin
+        cx, cy = (int(c) for c in self._cells(x, y))
+        best, best_distance = -1, math.inf
+        seen = np.zeros(0, dtype=np.int64)
+        for ring in range(max(nx, ny) + 1):
+            cx0, cy0 = max(cx - ring, 0), max(cy - ring, 0)
+            cx1, cy1 = min(cx + ring, nx - 1), min(cy + ring, ny - 1)
+            candidates = np.setdiff1d(self._candidates(cx0, cy0, cx1, cy1), seen, assume_unique=True)
+            if len(candidates):
+                distances = self._distances(candidates, x, y)
+                closest = int(np.argmin(distances))
+                if distances[closest] < best_distance:
+                    best, best_distance = int(candidates[closest]), float(distances[closest])
+                seen = np.union1d(seen, candidates)
+            if cx0 == 0 and cy0 == 0 and cx1 == nx - 1 and cy1 == ny - 1:
+                break
+            # Any segment not seen yet lies outside the searched block, on a side that is not the grid's edge
+            margins = [x - (gx + cx0 * self.cell_size) if cx0 > 0 else math.inf,
+                       gx + (cx1 + 1) * self.cell_size - x if cx1 < nx - 1 else math.inf,
+                       y - (gy + cy0 * self.cell_size) if cy0 > 0 else math.inf,
+                       gy + (cy1 + 1) * self.cell_size - y if cy1 < ny - 1 else math.inf]
+            if best_distance <= min(margins):
+                break
+        return best, best_distance
+
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+
+    def __repr__(self) -> str:
+        return f"SegmentGrid({len(self.segments)} segments, {self.shape[0]}x{self.shape[1]} cells of {self.cell_size:.4g})"
+
+
+_grids = weakref.WeakKeyDictionary()     #SegmentStore: ((generation, segment count, run count), {tolerance level: SegmentGrid})
+
+def get_index(store, tolerance: float = None) -> SegmentGrid:
+    """Get the grid of a segment store, building it again only when the store has changed.
+    The tolerance is rounded down to a power of two, as for levels of detail, and one grid is kept per power of two,
+    so that rendering the same store at a few zoom levels in turn does not build its grid again every time.
+    Args:
+        store (SegmentStore): The store of a turtle.
+        tolerance (float): The largest distance allowed between an exact arc and its line segments.
+            When None, arcs use the number of steps given when they were recorded.
+    Returns:
+        SegmentGrid: The grid over the current segments of the store.
+    """
+    # The tolerance only changes the segments of exact arcs, so it is left out of the key of a store without arcs
+    level = math.floor(math.log2(tolerance)) if tolerance is not None and len(store.arcs) else None
+    key = (store.generation, len(store), len(store.run_starts))
+    cached = _grids.get(store)
+    if cached is None or cached[0] != key:
+        cached = _grids[store] = (key, {})
+    grid = cached[1].get(level)
+    if grid is None:
+        grid = cached[1][level] = SegmentGrid.from_store(store, None if level is None else 2.0 ** level)
+    return grid
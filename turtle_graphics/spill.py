@@ -0,0 +1,276 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Spill-to-disk segment storage for Turtle Graphics Implementation in Python
+
+This module provides a segment store for drawings larger than the memory available. A SpillingSegmentStore records
+lines like a SegmentStore, but once the arrays in memory reach a memory budget, they are written to a temporary file
+as one chunk and emptied, so the memory used by the drawing stays bounded however long the turtle draws. The spilled
+chunks are memory-mapped back as read-only segment stores, whose pages the operating system loads when they are read
+and can drop again under memory pressure. Renderers and exporters read the drawing chunk by chunk with chunks().
+
+Classes:
+    SpillingSegmentStore: Segment store keeping a bounded chunk of lines in memory and spilling full chunks to disk.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.drawing import render_to_file
+
+    t = Turtle(memory_budget=1_000_000)     # at most about 1 MB of lines in memory
+    for _ in range(100_000):
+        t.forward(1)
+        t.left(1.01)
+    render_to_file("spiral.png", t)
+
+Note:
+    A new chunk always starts a new polyline, so a line crossing the boundary of two chunks is drawn as two polylines.
+    The arrays of the store (vertices, run_starts, ...) only hold the chunk in memory. The whole drawing is read
+    through the sequence interface, to_numpy_polylines, to_numpy_segments and arrays(), which copy it, or chunk by
+    chunk through chunks(). Spilling a chunk increments the generation, as its lines leave the arrays in memory, and
+    readers following the lines as they are drawn, such as LiveScene and TileRenderer, get the lines added since
+    their last read from since(), which tells spilled lines from removed ones.
+
+Dependencies:
+    - bisect: Finds the chunk holding a line.
+    - mmap: Maps the spilled chunks back into memory.
+    - sys: Tells the byte order of the machine.
+    - tempfile: Creates the file the chunks are spilled to.
+    - segments: The segment store recording the chunk in memory.
+    - storage: Writes the chunks and builds stores on their mapped arrays.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import mmap
+import sys
+import tempfile
+from array import array
+from bisect import bisect_right
+from .segments import DrawingArrays, SegmentStore
+from .storage import _write_arrays, _store
+
+_BYTES_PER_VERTEX = 54      #Most bytes per vertex: arc runs of 2 vertices (32 bytes), 28 bytes of run arrays and 48 of arc
+
+class SpillingSegmentStore(SegmentStore):
+    """Segment store that keeps at most a memory budget of lines in memory, and spills the rest to a temporary file.
+    Attributes:
+        memory_budget (int): The largest number of bytes of arrays kept in memory before they are spilled.
+            A single polyline larger than the budget is spilled as soon as it is added.
+        spilled_bytes (int): The number of bytes written to the temporary file.
+        All attributes of SegmentStore, where the arrays only hold the lines still in memory.
+    """
+    def __init__(self, memory_budget: int) -> None:
+        """Initialise an empty store with a memory budget in bytes.
+        Raises:
+            TypeError: If the memory budget is not an integer.
+            ValueError: If the memory budget is not positive.
+        """
+        if not isinstance(memory_budget, int) or isinstance(memory_budget, bool):
+            raise TypeError(f"Invalid memory budget type: {type(memory_budget).__name__}. Expected an integer number of bytes.")
+        if memory_budget <= 0:
+            raise ValueError(f"Invalid memory budget: {memory_budget}. Expected a positive number of bytes.")
+        super().__init__()
+        self.memory_budget = memory_budget
+        self.spilled_bytes = 0
+        self._file = None
+        self._chunks = []               #Read-only stores mapped from the spilled chunks
+        self._chunk_segments = []       #Index of the first line segment of every spilled chunk
+        self._spilled_segments = 0
+        self._check_at = 0              #Vertex count at which the memory used is measured again
+        self._removed_at = 0            #Generation since which no line was removed, only spilled
+        self._live_store = None         #(key, store) sharing the arrays in memory, until they change
+
+
+    def add_segment(self, x0: float, y0: float, x1: float, y1: float, color: str, thickness: float) -> None:
+        """Append a line segment as SegmentStore.add_segment does, spilling the chunk in memory once it is full."""
+        super().add_segment(x0, y0, x1, y1, color, thickness)
+        if len(self.vertices) >= self._check_at:
+            self._check_budget()
+
+
+    def add_polyline(self, coords, color: str, thickness: float) -> None:
+        """Append a polyline as SegmentStore.add_polyline does, spilling the chunk in memory once it is full."""
+        super().add_polyline(coords, color, thickness)
+        if len(self.vertices) >= self._check_at:
+            self._check_budget()
+
+
+    def add_arc(self, cx: float, cy: float, radius: float, start_angle: float, extent: float, steps: int,
+                color: str, thickness: float) -> None:
+        """Append an exact arc as SegmentStore.add_arc does, spilling the chunk in memory once it is full."""
+        super().add_arc(cx, cy, radius, start_angle, extent, steps, color, thickness)
+        if len(self.vertices) >= self._check_at:
+            self._check_budget()
+
+
+    def _check_budget(self) -> None:
+        """Spill the chunk in memory if it has reached the memory budget.
+        Otherwise measure again once enough vertices are added to reach it, so most lines only cost a comparison.
+        """
+        used = self.nbytes
+        if used >= self.memory_budget:
+            self.spill()
+        else:
+            self._check_at = len(self.vertices) + 2 * ((self.memory_budget - used) // _BYTES_PER_VERTEX) + 2
+
+
+    def spill(self) -> None:
+        """Write the lines in memory to the temporary file as a new chunk, and empty the arrays in memory."""
+        if not self._segment_count:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix='turtle-', suffix='.chunks')
+        # Chunks start at a multiple of the allocation granularity, so each can be mapped on its own
+        start = self.spilled_bytes + -self.spilled_bytes % mmap.ALLOCATIONGRANULARITY
+        self._file.seek(start)
+        offsets, size = _write_arrays(self._file, self._live(), 0)
+        self._file.flush()
+        buffer = memoryview(mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ, offset=start))
+        self._chunks.append(_store(buffer, {'arrays': offsets, 'styles': self.styles}, sys.byteorder, True))
+        self._chunk_segments.append(self._spilled_segments)
+        self._spilled_segments += self._segment_count
+        self.spilled_bytes = start + size
+
+        for values in (self.vertices, self.run_starts, self.run_styles, self.run_segments, self.run_arcs, self.arcs):
+            del values[:]
+        self._end_x = self._end_y = None
+        self._segment_count = 0
+        self._check_at = 0
+        self.generation += 1
+
+
+    def _live(self) -> SegmentStore:
+        """Get a plain store sharing the arrays of the lines in memory, without copying them.
+        The same store is returned until lines are added or removed, so caches keyed on it, e.g. spatial grids, last.
+        """
+        key = (self.generation, self._segment_count, len(self.run_starts), len(self.styles))
+        if self._live_store is None or self._live_store[0] != key:
+            self._live_store = (key, SegmentStore.from_arrays(DrawingArrays(self.vertices, self.run_starts, self.run_styles,
+                                                                            self.styles, self.run_arcs, self.arcs),
+                                                              self.run_segments))
+        return self._live_store[1]
+
+
+    def chunks(self):
+        """Iterate over the chunks of the store: the spilled chunks, then the lines in memory.
+        Yields:
+            SegmentStore: The read-only store of every spilled chunk, then a store sharing the arrays in memory.
+        """
+        yield from self._chunks
+        if self._segment_count:
+            yield self._live()
+
+
+    def arrays(self) -> DrawingArrays:
+        """Get the arrays of the whole drawing, copying the spilled chunks into memory.
+        Returns:
+            DrawingArrays: The arrays of a single store holding every line, as for SegmentStore.
+        """
+        merged = DrawingArrays(array('d'), array('q'), array('I'), list(self.styles), array('q'), array('d'))
+        for arrays, _ in self.chunk_arrays():
+            for values, chunk_values in zip(merged, arrays):
+                if isinstance(values, array):
+                    values.frombytes(memoryview(chunk_values).cast('B'))
+        return merged
+
+
+    def to_numpy_polylines(self, tolerance: float = None):
+        """Copy the whole drawing into NumPy arrays, one polyline per run, as for SegmentStore."""
+        import numpy as np
+        pieces = [chunk.to_numpy_polylines(tolerance) for chunk in self.chunks()]
+        if not pieces:
+            return SegmentStore().to_numpy_polylines(tolerance)
+        offsets = np.cumsum([0] + [len(vertices) for vertices, _, _ in pieces])
+        bounds = [bounds[:-1] + offset for (_, bounds, _), offset in zip(pieces, offsets)] + [offsets[-1:]]
+        return (np.concatenate([vertices for vertices, _, _ in pieces]), np.concatenate(bounds),
+                np.concatenate([run_styles for _, _, run_styles in pieces]))
+
+
+    def position(self) -> tuple:
+        """Get the position of the end of the store, as for SegmentStore, with the number of spilled chunks."""
+        return (self.generation, len(self._chunks)) + super().position()[2:]
+
+
+    def since(self, position: tuple):
+        """Get the chunks holding the lines added since a position was taken, as for SegmentStore.
+        The chunk that was in memory at the position may have been spilled since, and is then read from the file.
+        """
+        generation, chunks, vertex_count, run_count, arc_count, _ = position
+        if generation < self._removed_at or chunks > len(self._chunks):
+            return None
+        if generation == self.generation:
+            return [(self._live(), vertex_count, run_count, arc_count)]
+        # Only spills happened since, so the chunk in memory at the position is the spilled chunk at its index
+        found = [(self._chunks[chunks], vertex_count, run_count, arc_count)]
+        found += [(chunk, 0, 0, 0) for chunk in self._chunks[chunks + 1:]]
+        if self._segment_count:
+            found.append((self._live(), 0, 0, 0))
+        return found
+
+
+    def clear(self) -> None:
+        """Remove every segment and style from the store, and drop the spilled chunks."""
+        super().clear()
+        self._removed_at = self.generation
+        if self._file is not None:
+            self._file.close()      #The file is deleted once the chunks still mapped elsewhere are released
+        self._file = None
+        self._chunks, self._chunk_segments = [], []
+        self._spilled_segments = self.spilled_bytes = self._check_at = 0
+
+
+    def mark(self) -> tuple:
+        """Get a marker of the current end of the store, as for SegmentStore, including the number of spilled chunks."""
+        return (len(self._chunks),) + super().mark()
+
+
+    def truncate(self, mark: tuple) -> None:
+        """Remove the lines and styles added since a marker was taken, as for SegmentStore.
+        If chunks were spilled since, they are dropped, and the chunk that was in memory when the marker was taken is
+        copied back into memory, so this costs at most one chunk. The temporary file is not shrunk.
+        Raises:
+            ValueError: If the store is shorter than the marker.
+        """
+        chunks, mark = mark[0], mark[1:]
+        if chunks > len(self._chunks):
+            raise ValueError("Invalid marker: the store holds fewer lines than when the marker was taken.")
+        generation = self.generation
+        if chunks < len(self._chunks):
+            chunk = self._chunks[chunks]
+            for name in ('vertices', 'run_starts', 'run_styles', 'run_segments', 'run_arcs', 'arcs'):
+                values = getattr(self, name)
+                del values[:]
+                values.frombytes(memoryview(getattr(chunk, name)).cast('B'))
+            self._segment_count = len(chunk)
+            self._spilled_segments = self._chunk_segments[chunks]
+            del self._chunks[chunks:], self._chunk_segments[chunks:]
+            self._check_at = 0
+            self._end_x, self._end_y = mark[5], mark[6]
+            self.generation += 1
+        super().truncate(mark)
+        if self.generation != generation:
+            self._removed_at = self.generation
+
+
+    def _line(self, index: int) -> tuple[tuple[float, float], tuple[float, float], str, float]:
+        if index >= self._spilled_segments:
+            return super()._line(index - self._spilled_segments)
+        chunk = bisect_right(self._chunk_segments, index) - 1
+        return self._chunks[chunk]._line(index - self._chunk_segments[chunk])
+
+
+    def __len__(self) -> int:
+        return self._spilled_segments + self._segment_count
+
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+        yield from super().__iter__()
+
+
+    def __repr__(self) -> str:
+        return (f"SpillingSegmentStore({len(self)} segments, {len(self._chunks)} spilled chunks, "
+                f"{self.nbytes} bytes in memory, {self.spilled_bytes} bytes spilled)")
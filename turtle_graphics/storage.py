@@ -0,0 +1,207 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Binary drawing files for Turtle Graphics Implementation in Python
+
+This module saves the drawing data of turtles to a compact, versioned binary file, and loads it back. Pickling the
+lines of a turtle as a list of tuples is slow and takes several times the memory of the lines themselves. A drawing
+file instead holds the arrays of every turtle's segment store as they are in memory, so it is written in bulk with
+a few writes, and loading it maps the file into memory and uses the arrays where they are, so rendering can start
+without parsing or copying the lines.
+
+Format (version 1, all numbers little-endian unless the directory says otherwise):
+    Header: 32 bytes: the magic bytes b'TGDF', the version (uint16), flags (uint16, 0), the number of turtles
+        (uint32), and the offset and length in bytes of the directory (uint64 each), padded with zeros.
+    Arrays: The vertices, run_starts, run_styles, run_segments, run_arcs and arcs arrays of every turtle, one after
+        the other, each starting at a multiple of 8 bytes.
+    Directory: UTF-8 JSON object with the byte order of the arrays and one entry per turtle: its name, its state
+        (position, angle, pen, colours, boundary policy and bounds), its style table of [color, thickness] pairs, and the offset and number
+        of items of each of its arrays.
+
+Functions:
+    save_drawing(target, *turtles): Writes the drawing data of turtles to a file.
+    load_drawing(source, mmap=True): Reads the turtles of a file, with their drawing data.
+    load_stores(source, mmap=True): Reads the segment stores of a file.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.storage import save_drawing, load_drawing
+    from turtle_graphics.drawing import render_to_file
+
+    t = Turtle()
+    t.circle(100)
+    save_drawing("circle.tgd", t)
+    render_to_file("circle.png", *load_drawing("circle.tgd"))
+
+Note:
+    The segment stores of memory-mapped turtles use the arrays of the file, which stays open while they are alive,
+    until they draw or remove lines: their arrays are then copied into memory once, and the file is left as it is.
+
+Dependencies:
+    - array: Holds the arrays loaded without memory mapping.
+    - json: Encodes the directory.
+    - mmap: Maps the files into memory.
+    - struct: Encodes the header.
+    - sys: Tells the byte order of the machine.
+    - segments: Builds the segment stores from the arrays.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import json
+import mmap as mmap_module
+import struct
+import sys
+from array import array
+from .segments import DrawingArrays, SegmentStore
+
+MAGIC = b'TGDF'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIQQ4x')      #Magic, version, flags, turtle count, directory offset and length
+ARRAYS = (('vertices', 'd'), ('run_starts', 'q'), ('run_styles', 'I'), ('run_segments', 'q'), ('run_arcs', 'q'), ('arcs', 'd'))
+STATE = ('x', 'y', 'angle', 'is_pen_down', 'line_color', 'turtle_color', 'line_thickness', 'record_arcs', 'boundary', 'bounds')
+
+def _entries(turtles):
+    """Get the name, state and segment store of every turtle, or of every segment store given instead."""
+    for turtle in turtles:
+        if isinstance(turtle, SegmentStore):
+            yield None, None, turtle
+        else:
+            yield turtle.name, {name: getattr(turtle, name) for name in STATE}, turtle.get_drawing_data()
+
+
+def _write_arrays(target, store: SegmentStore, position: int) -> tuple[dict, int]:
+    """Write the arrays of a segment store, chunk by chunk, each array starting at a multiple of 8 bytes.
+    Args:
+        target: A binary file opened for writing.
+        store (SegmentStore): The store to write.
+        position (int): The offset of the file position from the start of the drawing file.
+    Returns:
+        tuple[dict, int]: The [offset, count] of every array, and the offset of the end of the arrays.
+    """
+    offsets = {}
+    for field, typecode in ARRAYS:
+        count = 0
+        for arrays, run_segments in store.chunk_arrays():
+            # The arrays are written straight from their buffers, so spilled chunks go from one file to the other
+            values = run_segments if field == 'run_segments' else getattr(arrays, field)
+            target.write(values)
+            count += len(values)
+        size = count * array(typecode).itemsize
+        padding = -size % 8
+        target.write(bytes(padding))
+        offsets[field] = [position, count]
+        position += size + padding
+    return offsets, position
+
+
+def save_drawing(target, *turtles) -> int:
+    """Write the drawing data of turtles to a binary drawing file.
+    Args:
+        target: A file path, or a binary file opened for writing that supports seek.
+        turtles: The Turtle objects, or SegmentStore objects, to save.
+    Returns:
+        int: The size of the file in bytes.
+    """
+    if isinstance(target, (str, bytes)) or hasattr(target, '__fspath__'):
+        with open(target, 'wb') as file:
+            return save_drawing(file, *turtles)
+
+    start = target.tell()
+    target.write(bytes(HEADER.size))
+    position = HEADER.size
+    entries = []
+    for name, state, store in _entries(turtles):
+        offsets, position = _write_arrays(target, store, position)
+        entries.append({'name': name, 'state': state, 'styles': [list(style) for style in store.styles],
+                        'arrays': offsets})
+
+    directory = json.dumps({'byteorder': sys.byteorder, 'turtles': entries}).encode('utf-8')
+    target.write(directory)
+    end = target.tell()
+    target.seek(start)
+    target.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), position, len(directory)))
+    target.seek(end)
+    return end - start
+
+
+def _read(source, mmap: bool):
+    """Read the header and directory of a drawing file, and get a buffer holding the whole file.
+    Raises:
+        ValueError: If the file is not a drawing file, or was written by a newer version.
+    """
+    with open(source, 'rb') as file:
+        if mmap:
+            buffer = memoryview(mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ))
+        else:
+            buffer = memoryview(file.read())
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"Invalid drawing file: {source}. The file is too short.")
+    magic, version, _, count, offset, length = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"Invalid drawing file: {source}. Expected a file starting with {MAGIC!r}.")
+    if version > VERSION:
+        raise ValueError(f"Unsupported drawing file version: {version}. Expected version {VERSION} or older.")
+    directory = json.loads(bytes(buffer[offset:offset + length]))
+    if len(directory['turtles']) != count:
+        raise ValueError(f"Invalid drawing file: {source}. The directory does not match the header.")
+    return buffer, directory
+
+
+def _store(buffer, entry: dict, byteorder: str, mmap: bool) -> SegmentStore:
+    """Build the segment store of a directory entry from the arrays in the buffer."""
+    values = {}
+    for field, typecode in ARRAYS:
+        offset, count = entry['arrays'][field]
+        data = buffer[offset:offset + count * array(typecode).itemsize]
+        if mmap and byteorder == sys.byteorder:
+            values[field] = data.cast(typecode)     #A view of the mapped file, nothing is copied
+        else:
+            values[field] = array(typecode, data.tobytes())
+            if byteorder != sys.byteorder:
+                values[field].byteswap()
+    run_segments = values.pop('run_segments')
+    styles = [tuple(style) for style in entry['styles']]
+    return SegmentStore.from_arrays(DrawingArrays(styles=styles, **values), run_segments)
+
+
+def load_stores(source, mmap: bool = True) -> list[SegmentStore]:
+    """Read the segment stores saved in a binary drawing file.
+    Args:
+        source: The path of the file.
+        mmap (bool): Whether to map the file into memory and use the arrays in place, until lines are added to or
+            removed from a store. Otherwise the arrays are copied when the file is read.
+    Returns:
+        list[SegmentStore]: The segment stores, in the order they were saved.
+    Raises:
+        ValueError: If the file is not a drawing file, or was written by a newer version.
+    """
+    buffer, directory = _read(source, mmap)
+    return [_store(buffer, entry, directory['byteorder'], mmap) for entry in directory['turtles']]
+
+
+def load_drawing(source, mmap: bool = True) -> list:
+    """Read the turtles saved in a binary drawing file, with their drawing data, e.g. to render them.
+    Args:
+        source: The path of the file.
+        mmap (bool): Whether to map the file into memory and use the arrays in place, until a turtle draws more lines
+            or removes some. Otherwise the arrays are copied when the file is read.
+    Returns:
+        list[Turtle]: The turtles, in their saved state, in the order they were saved. Segment stores saved on their
+            own come back as turtles in the default state.
+    Raises:
+        ValueError: If the file is not a drawing file, or was written by a newer version.
+    """
+    from .turtle import Turtle     #Imported here as the turtle module uses this one to save and load its lines
+    buffer, directory = _read(source, mmap)
+    turtles = []
+    for entry in directory['turtles']:
+        turtle = Turtle(entry['name']) if entry['name'] is not None else Turtle()
+        for name, value in (entry['state'] or {}).items():
+            setattr(turtle, name, tuple(value) if name == 'bounds' else value)     #JSON turns the bounds into a list
+        turtle.lines_to_draw = _store(buffer, entry, directory['byteorder'], mmap)
+        turtle._update_outputs()
+        turtles.append(turtle)
+    return turtles
@@ -0,0 +1,206 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Streaming SVG export for Turtle Graphics Implementation in Python
+
+This module provides an SVG exporter that writes the Turtles' lines to a file as they are drawn.
+An SVGWriter can be attached to a Turtle as a sink, so drawings with millions of lines can be exported
+without keeping them in memory: consecutive lines of the same style are joined into a single <path>
+element, and every path is written out through a buffered file as soon as it is complete.
+Exact arcs recorded by a Turtle are written as native SVG arc commands.
+
+Classes:
+    SVGWriter: Streaming SVG writer that can be attached to Turtle objects as a sink.
+
+Functions:
+    export_svg(target, *args, **options): Writes the lines already recorded by the provided Turtle instances to an SVG file.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.svg import SVGWriter
+
+    t = Turtle()
+    with SVGWriter("drawing.svg") as writer:
+        t.attach_sink(writer, record=False)
+        t.forward(100)
+        # ... more turtle actions ...
+        t.detach_sink(writer)
+
+Dependencies:
+    - html: Escapes colour names written into the SVG attributes.
+    - math: Computes the end points of arcs.
+    - config: Provides the canvas size limits.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import html
+import math
+import os
+from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+
+def _number(value: float) -> str:
+    """Format a coordinate compactly, rounded to 4 decimal places."""
+    return f"{round(value, 4) + 0.0:.10g}"     #Adding 0.0 turns -0.0 into 0.0
+
+class SVGWriter:
+    """Streaming SVG writer for turtle lines.
+    Attributes:
+        width (float): Width of the image in points.
+        height (float): Height of the image in points.
+        max_path_vertices (int): Maximum number of vertices in one <path> element. Bounds the memory used per path.
+        segments_written (int): Number of lines written so far.
+        arcs_written (int): Number of exact arcs written so far.
+    """
+    def __init__(self, target, width: float = 400, height: float = 400, background: str = 'white',
+                 max_path_vertices: int = 4096, buffer_size: int = 1 << 16) -> None:
+        """Open the SVG document and write its header.
+        Args:
+            target: A file path or a text file-like object to write the SVG document to.
+            width (float): Width of the image in points.
+            height (float): Height of the image in points.
+            background (str): Colour of the background, or None for a transparent background.
+            max_path_vertices (int): Maximum number of vertices in one <path> element.
+            buffer_size (int): Size in bytes of the write buffer used when target is a path.
+        """
+        if isinstance(target, (str, os.PathLike)):
+            self._file = open(target, 'w', encoding='utf-8', buffering=buffer_size)
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+
+        self.width, self.height = width, height
+        self.max_path_vertices = max_path_vertices
+        self.segments_written = 0
+        self.arcs_written = 0
+        # Line thickness is given in points, and one canvas unit is width / (2 * SCREEN_LIMIT_X) points wide
+        self._points_to_units = 2 * SCREEN_LIMIT_X / width
+
+        self._path = []             #Path data of the path being built
+        self._path_style = None     #(color, thickness) of the path being built
+        self._path_end = None       #Last point of the path being built
+
+        self._file.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}pt" height="{height}pt" '
+            f'viewBox="{-SCREEN_LIMIT_X} {-SCREEN_LIMIT_Y} {2 * SCREEN_LIMIT_X} {2 * SCREEN_LIMIT_Y}">\n')
+        if background is not None:
+            self._file.write(f'<rect x="{-SCREEN_LIMIT_X}" y="{-SCREEN_LIMIT_Y}" width="{2 * SCREEN_LIMIT_X}" '
+                             f'height="{2 * SCREEN_LIMIT_Y}" fill="{html.escape(background)}"/>\n')
+        self._file.write('<g fill="none" stroke-linecap="round" stroke-linejoin="round">\n')
+
+
+    def add_segment(self, x0: float, y0: float, x1: float, y1: float, color: str, thickness: float) -> None:
+        """Add a line to the document, extending the current path when the line continues it.
+        Args:
+            x0 (float): X-coordinate of the start of the line.
+            y0 (float): Y-coordinate of the start of the line.
+            x1 (float): X-coordinate of the end of the line.
+            y1 (float): Y-coordinate of the end of the line.
+            color (str): The line colour.
+            thickness (float): The line thickness in points.
+        """
+        style = (color, thickness)
+        if (self._path_end != (x0, y0) or self._path_style != style
+                or len(self._path) >= self.max_path_vertices):
+            self.flush_path()
+            self._path_style = style
+            self._path.append(f"M{_number(x0)} {_number(-y0)}")     #SVG's y axis points down
+        self._path.append(f"L{_number(x1)} {_number(-y1)}")
+        self._path_end = (x1, y1)
+        self.segments_written += 1
+
+
+    def add_polyline(self, coords, color: str, thickness: float) -> None:
+        """Add a polyline to the document, extending the current path when the polyline continues it.
+        Args:
+            coords: Flat sequence of floats holding x, y for at least two vertices.
+            color (str): The line colour.
+            thickness (float): The line thickness in points.
+        """
+        for i in range(2, len(coords) - 1, 2):
+            self.add_segment(coords[i - 2], coords[i - 1], coords[i], coords[i + 1], color, thickness)
+
+
+    def add_arc(self, cx: float, cy: float, radius: float, start_angle: float, extent: float, steps: int,
+                color: str, thickness: float) -> None:
+        """Add an exact circular arc to the document as SVG arc commands.
+        Args:
+            cx (float): X-coordinate of the centre of the arc.
+            cy (float): Y-coordinate of the centre of the arc.
+            radius (float): The radius of the arc.
+            start_angle (float): Angle in degrees of the start of the arc, seen from the centre.
+            extent (float): Angle in degrees covered by the arc, counterclockwise when positive.
+            steps (int): The number of line segments the arc stands for. Not needed, as the arc is drawn exactly.
+            color (str): The line colour.
+            thickness (float): The line thickness in points.
+        """
+        def point(angle):
+            return cx + radius * math.cos(math.radians(angle)), cy + radius * math.sin(math.radians(angle))
+
+        x0, y0 = point(start_angle)
+        if self._path_end != (x0, y0) or self._path_style != (color, thickness):
+            self.flush_path()
+            self._path_style = (color, thickness)
+            self._path.append(f"M{_number(x0)} {_number(-y0)}")
+
+        # One SVG arc command cannot draw a full circle, so the arc is split into pieces of at most 180 degrees.
+        # Counterclockwise arcs have a sweep flag of 0 because SVG's y axis points down.
+        pieces = max(math.ceil(abs(extent) / 180), 1)
+        sweep_flag = 1 if extent < 0 else 0
+        for k in range(1, pieces + 1):
+            x, y = point(start_angle + extent * k / pieces)
+            self._path.append(f"A{_number(radius)} {_number(radius)} 0 0 {sweep_flag} {_number(x)} {_number(-y)}")
+        self._path_end = (x, y)
+        self.arcs_written += 1
+
+
+    def flush_path(self) -> None:
+        """Write the path being built to the file."""
+        if self._path:
+            color, thickness = self._path_style
+            self._file.write(f'<path stroke="{html.escape(color)}" stroke-width="{thickness * self._points_to_units:.6g}" '
+                             f'd="{"".join(self._path)}"/>\n')
+            self._path.clear()
+        self._path_style = self._path_end = None
+
+
+    def close(self) -> None:
+        """Write the remaining path and the end of the document, and close the file if it was opened here."""
+        if self._file is None:
+            return
+        self.flush_path()
+        self._file.write('</g>\n</svg>\n')
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+        self._file = None
+
+
+    def __enter__(self) -> 'SVGWriter':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def export_svg(target, *args, **options) -> None:
+    """Write the lines recorded by all provided turtles to an SVG file.
+    Args:
+        target: A file path or a text file-like object to write the SVG document to.
+        args: A list that may start with a title (str) followed by Turtle objects. The title is not drawn.
+        options: Keyword arguments passed on to SVGWriter.
+    """
+    turtles = args[1:] if args and isinstance(args[0], str) else args
+    with SVGWriter(target, **options) as writer:
+        for turtle in turtles:
+            for store in turtle.get_drawing_data().chunks():
+                for start, end, style_index, arc in store.runs():
+                    if arc is None:
+                        writer.add_polyline(store.vertices[2 * start:2 * end], *store.styles[style_index])
+                    else:
+                        writer.add_arc(*arc, *store.styles[style_index])
@@ -0,0 +1,263 @@
+"""
+Teaching Fellow - Imperial College Dept of Computing - Interview Technical Exercise:
+
+Tiled rendering for Turtle Graphics Implementation in Python
+
+This module renders large turtle drawings as square PNG tiles for map-style viewers that zoom and pan.
+At zoom level z the canvas (-SCREEN_LIMIT_X, SCREEN_LIMIT_X) by (-SCREEN_LIMIT_Y, SCREEN_LIMIT_Y) is split into
+2 ** z by 2 ** z tiles, numbered from the top left corner as in web maps. Each tile only draws the lines that
+cross it, found with the spatial index, and is cached by the content hash of the drawing and its tile id.
+When the turtles draw more lines, only the cached tiles that the new lines touch are rendered again.
+
+Classes:
+    TileRenderer: Renders and caches the tiles of a drawing made by one or more turtles.
+
+Usage:
+    from turtle_graphics.turtle import Turtle
+    from turtle_graphics.tiles import TileRenderer
+
+    t = Turtle()
+    t.circle(100)
+    tiles = TileRenderer(t)
+    png = tiles.render_tile(2, 1, 3)      # zoom level 2, column 1, row 3
+    t.forward(50)
+    png = tiles.render_tile(2, 1, 3)      # rendered again only if the new line crosses the tile
+
+Note:
+    Lines keep their thickness in points at every zoom level, as in web maps, and the turtles' symbols are not drawn.
+
+Dependencies:
+    - hashlib: Hashes the content of the drawing.
+    - io: Collects the PNG images in memory.
+    - collections: Provides the ordered dictionary behind the cache.
+    - matplotlib: Draws the tiles, without pyplot.
+    - numpy: Finds the tiles touched by new lines.
+    - drawing: Draws the lines crossing a viewport.
+    - geometry: Computes the bounds of exact arcs.
+    - config: Provides the canvas size limits.
+
+Author: Leonardo Alves Dias
+Version: 0.1
+License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
+"""
+
+import hashlib
+import io
+from collections import OrderedDict
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from . import drawing
+from .geometry import arc_bounds
+
+class TileRenderer:
+    """Renders and caches the tiles of a drawing made by one or more turtles.
+    Attributes:
+        turtles (tuple): The turtles whose lines are drawn.
+        tile_size (int): The width and height of a tile in pixels.
+        dpi (float): The resolution used to convert line thicknesses from points to pixels.
+        max_bytes (int): The largest total size of the cached PNG images.
+        nbytes (int): The total size of the cached PNG images.
+        hits (int): The number of tiles served from the cache.
+        misses (int): The number of tiles rendered.
+    """
+    def __init__(self, *turtles, tile_size: int = 256, dpi: float = 100, background: str = 'white',
+                 max_bytes: int = 32 << 20) -> None:
+        """Initialize the renderer with the turtles to draw and an empty cache.
+        Args:
+            turtles: The Turtle objects to draw.
+            tile_size (int): The width and height of a tile in pixels.
+            dpi (float): The resolution used to convert line thicknesses from points to pixels.
+            background (str): The colour of the background.
+            max_bytes (int): The largest total size of the cached PNG images. The least recently used tiles are evicted first.
+        """
+        self.turtles = turtles
+        self.tile_size = tile_size
+        self.dpi = dpi
+        self.background = background
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = self.misses = 0
+        self._tiles = OrderedDict()     #(content hash, zoom, column, row): PNG image, least recently used first
+        self._hash = None
+        self._synced = [None] * len(turtles)     #The position of every store at the last sync
+
+
+    def tile_bounds(self, zoom: int, column: int, row: int) -> tuple[float, float, float, float]:
+        """Get the region of the canvas covered by a tile.
+        Args:
+            zoom (int): The zoom level. The canvas is split into 2 ** zoom tiles along each axis.
+            column (int): The column of the tile, from 0 on the left.
+            row (int): The row of the tile, from 0 at the top.
+        Returns:
+            tuple[float, float, float, float]: The region (xmin, ymin, xmax, ymax).
+        Raises:
+            TypeError: If the zoom level, column or row is not an integer.
+            ValueError: If the zoom level is negative or the tile is outside the canvas.
+        """
+        if not all(isinstance(value, int) for value in (zoom, column, row)):
+            raise TypeError("Zoom level, column and row must be integers.")
+        if zoom < 0 or not (0 <= column < 2 ** zoom and 0 <= row < 2 ** zoom):
+            raise ValueError(f"Tile ({zoom}, {column}, {row}) is outside the canvas.")
+        width, height = 2 * SCREEN_LIMIT_X / 2 ** zoom, 2 * SCREEN_LIMIT_Y / 2 ** zoom
+        xmin, ymax = -SCREEN_LIMIT_X + column * width, SCREEN_LIMIT_Y - row * height
+        return xmin, ymax - height, xmin + width, ymax
+
+
+    @property
+    def content_hash(self) -> str:
+        """The hash of the lines drawn by the turtles, updated with the lines added since it was last read."""
+        self._sync()
+        return self._hash.hexdigest()
+
+
+    def _sync(self) -> None:
+        """Update the content hash with the lines added since the last sync.
+        The cached tiles that the new lines touch are evicted, and the others are kept under the new hash.
+        The whole cache is cleared if lines were removed.
+        """
+        if self._hash is None:
+            self._hash = hashlib.blake2b(digest_size=16)
+        old_hash = self._hash.hexdigest()
+        boxes = []
+        for i, turtle in enumerate(self.turtles):
+            store = turtle.get_drawing_data()
+            position = store.position()
+            synced = self._synced[i]
+            if synced == position:
+                continue
+            chunks = store.since(synced) if synced is not None else [(chunk, 0, 0, 0) for chunk in store.chunks()]
+            if chunks is None:
+                # Lines were removed: nothing cached can be trusted, and the hash starts again from every store
+                self.clear()
+                self._hash = None
+                self._synced = [None] * len(self.turtles)
+                self._sync()
+                return
+
+            self._hash.update(i.to_bytes(4, 'little'))
+            # Stores that spill to disk are read chunk by chunk, from the chunk that was in memory at the last sync
+            for chunk, vertex_count, run_count, arc_count in chunks:
+                for values, start in ((chunk.vertices, 2 * vertex_count), (chunk.run_starts, run_count),
+                                      (chunk.run_styles, run_count), (chunk.arcs, arc_count)):
+                    self._hash.update(values[start:].tobytes())
+                if self._tiles:
+                    boxes.append(self._new_boxes(chunk, vertex_count, run_count))
+            for style in store.styles[synced[5] if synced is not None else 0:]:
+                self._hash.update(repr(style).encode())
+            self._synced[i] = position
+
+        new_hash = self._hash.hexdigest()
+        if new_hash != old_hash and self._tiles:
+            if boxes:
+                self._evict_touched(np.concatenate(boxes))
+            self._tiles = OrderedDict(((new_hash, *key[1:]), image) for key, image in self._tiles.items())
+
+
+    def _new_boxes(self, store, vertex_count: int, run_count: int):
+        """Get the bounding boxes of the lines added to a store since it had vertex_count vertices and run_count runs.
+        Returns:
+            numpy.ndarray: (n, 4) array of (xmin, ymin, xmax, ymax), with the largest line thickness in points appended.
+        """
+        # The last old vertex is included, as the first new line may continue the last old run
+        first = max(vertex_count - 1, 0)
+        vertices = np.array(store.vertices[2 * first:], dtype=float).reshape(-1, 2)
+        lows = np.minimum(vertices[:-1], vertices[1:])
+        highs = np.maximum(vertices[:-1], vertices[1:])
+        boxes = np.hstack((lows, highs))
+        # Consecutive vertices of different runs are not joined by a line, and arc runs are only their end points
+        new_runs = range(run_count, len(store.run_starts))
+        not_lines = [store.run_starts[run] - 1 - first for run in new_runs if store.run_starts[run] > first]
+        boxes = np.delete(boxes, not_lines, axis=0)
+        arcs = [arc_bounds(*store.arc(store.run_arcs[run])[:5]) for run in new_runs if store.run_arcs[run] >= 0]
+        if arcs:
+            boxes = np.vstack((boxes, arcs))
+        thickness = max((store.styles[store.run_styles[run]][1] for run in range(max(run_count - 1, 0), len(store.run_starts))), default=0)
+        return np.hstack((boxes, np.full((len(boxes), 1), thickness)))
+
+
+    def _evict_touched(self, boxes) -> None:
+        """Evict the cached tiles that any of the given bounding boxes overlaps, lines' thickness included."""
+        for key in list(self._tiles):
+            _, zoom, column, row = key
+            xmin, ymin, xmax, ymax = self.tile_bounds(zoom, column, row)
+            # Half the thickness of a line, converted from points to canvas units at this zoom level, plus a pixel
+            pixel = (xmax - xmin) / self.tile_size
+            margin = (boxes[:, 4] * self.dpi / 72 / 2 + 1) * pixel
+            touched = ((boxes[:, 0] - margin <= xmax) & (boxes[:, 2] + margin >= xmin)
+                       & (boxes[:, 1] - margin <= ymax) & (boxes[:, 3] + margin >= ymin))
+            if touched.any():
+                self.nbytes -= len(self._tiles.pop(key))
+
+
+    def render_tile(self, zoom: int, column: int, row: int) -> bytes:
+        """Get a tile as a PNG image, from the cache or rendered if it is not cached.
+        Args:
+            zoom (int): The zoom level. The canvas is split into 2 ** zoom tiles along each axis.
+            column (int): The column of the tile, from 0 on the left.
+            row (int): The row of the tile, from 0 at the top.
+        Returns:
+            bytes: The PNG image.
+        Raises:
+            TypeError: If the zoom level, column or row is not an integer.
+            ValueError: If the zoom level is negative or the tile is outside the canvas.
+        """
+        viewport = self.tile_bounds(zoom, column, row)
+        self._sync()
+        key = (self._hash.hexdigest(), zoom, column, row)
+        image = self._tiles.get(key)
+        if image is not None:
+            self._tiles.move_to_end(key)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self._render(viewport)
+        if len(image) <= self.max_bytes:
+            while self.nbytes + len(image) > self.max_bytes:
+                self.nbytes -= len(self._tiles.popitem(last=False)[1])
+            self._tiles[key] = image
+            self.nbytes += len(image)
+        return image
+
+
+    def _render(self, viewport: tuple[float, float, float, float]) -> bytes:
+        """Render the lines crossing a region of the canvas to a PNG image of tile_size pixels."""
+        size = self.tile_size / self.dpi
+        figure = Figure(figsize=(size, size), dpi=self.dpi)
+        FigureCanvasAgg(figure)
+        ax = figure.add_axes((0, 0, 1, 1))
+        ax.set_axis_off()
+        xmin, ymin, xmax, ymax = viewport
+        # Exact arcs are turned into lines accurate to half a pixel of the tile
+        tolerance = (xmax - xmin) / (2 * self.tile_size)
+        pixel = (xmax - xmin) / self.tile_size
+        for turtle in self.turtles:
+            # Lines just outside the tile still cover its edge by half their thickness, as for _evict_touched
+            thickness = max((style[1] for style in turtle.get_drawing_data().styles), default=0)
+            margin = (thickness * self.dpi / 72 / 2 + 1) * pixel
+            drawing.draw_lines(turtle, ax, tolerance, (xmin - margin, ymin - margin, xmax + margin, ymax + margin))
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+
+        output = io.BytesIO()
+        try:
+            figure.savefig(output, format='png', dpi=self.dpi, facecolor=self.background)
+        finally:
+            figure.clear()
+        return output.getvalue()
+
+
+    def clear(self) -> None:
+        """Remove every tile from the cache."""
+        self._tiles.clear()
+        self.nbytes = 0
+
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+
+    def __repr__(self) -> str:
+        return f"TileRenderer({len(self.turtles)} turtles, {len(self._tiles)} tiles, {self.nbytes}/{self.max_bytes} bytes)"
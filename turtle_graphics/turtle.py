@@ -7,6 +7,7 @@ Users can control the turtle's movement, color, and pen state to create various
 
 Classes:
     Turtle: Represents a turtle in the Turtle Graphics system. It can move forward and backward, turn left and right, lift or put down its pen, and draw circles.
+    Checkpoint: A saved state of a Turtle and of the end of its lines, to go back to with Turtle.restore or Turtle.undo.
 
 Usage:
     from turtle_graphics.turtle import Turtle
@@ -16,21 +17,46 @@ Usage:
     # ... more turtle actions ...
 
 Dependencies:
-    - matplotlib: Used for rendering the graphical representation of the Turtle's and its path.
     - math: Provides mathematical functions for calculations.
     - config: Provides the canvas size limits.
+    - segments: Provides the compact store for the lines drawn by the turtle.
+    - spill: Provides the store that spills lines to disk. Only imported by turtles with a memory budget.
+    - geometry: Computes the vertices of circles and of bulk walks in one batch, the bounds of exact arcs, and clips or
+      wraps lines leaving the screen.
 
 Note:
     This implementation is designed for educational purposes and may not cover all features found in standard Turtle Graphics libraries.
+    The module only needs the standard library: the turtle computes geometry, and rendering lives in drawing.py.
 
 Author: Leonardo Alves Dias
 Version: 0.1
 License: This project is open-source and free to use. You are permitted to use, modify, distribute, and perform the software for any purpose, including commercial applications, with no restrictions.
 """
 
-import matplotlib.pyplot as plt
 import math
+from typing import NamedTuple
 from .config import SCREEN_LIMIT_X, SCREEN_LIMIT_Y
+from .segments import SegmentStore, DrawingArrays
+from .geometry import get_numpy, circle_steps, polygon_walk, arc_points, arc_bounds, walk as walk_path
+from .geometry import clip_polyline, wrap_point, wrap_polyline
+
+BOUNDARY_POLICIES = ('raise', 'clip', 'wrap', 'unbounded')      #What a turtle does when it would leave the screen
+
+class Checkpoint(NamedTuple):
+    """The state of a turtle and the end of its lines when a checkpoint was taken.
+    Attributes:
+        x, y, angle, is_pen_down, line_color, turtle_color, line_thickness: The state of the turtle.
+        mark (tuple): The marker of the end of the turtle's segment store, as returned by SegmentStore.mark.
+    """
+    x: float
+    y: float
+    angle: float
+    is_pen_down: bool
+    line_color: str
+    turtle_color: str
+    line_thickness: float
+    mark: tuple
+
 
 class Turtle:
     """Represents a turtle in a turtle graphics system.
@@ -43,12 +69,23 @@ class Turtle:
         line_color (str): Color of the line the turtle draws.
         turtle_color (str): Color of the turtle's symbol.
         line_thickness (float): Thickness of the line the turtle draws.
-        lines_to_draw (List[tuple[tuple[float, float], tuple[float, float], str, float]]): List of lines to draw, each represented as a tuple containing start and end coordinates, color, and thickness.
+        lines_to_draw (SegmentStore): Store of lines to draw. It behaves as a sequence of tuples containing start and end coordinates, color, and thickness.
+        is_recording (bool): Whether lines are recorded in lines_to_draw. Only turned off when a sink receives the lines instead.
+        record_arcs (bool): Whether circle records exact arcs, turned into lines only when rendered, instead of line segments.
+        memory_budget (int): The most bytes of lines kept in memory before they are spilled to a temporary file, or None to keep every line in memory.
+        boundary (str): What the turtle does when it would leave the screen limits: 'raise' a ValueError before moving,
+            'clip' the lines to the screen, 'wrap' around to the opposite side, or go on 'unbounded'. Under 'raise',
+            forward and goto only check where the turtle ends, so a turtle created outside the screen can move back
+            onto it, while circles and walks check every vertex, their start included.
+        bounds (tuple[float, float, float, float]): The smallest box (xmin, ymin, xmax, ymax) holding the screen and
+            every position the turtle has moved through outside it, used to fit the plot to unbounded turtles.
     """
     def __init__(self, name: str = "Turtle", x: float = 0, y: float = 0,
                  init_angle: float = 90, line_color: str = 'black',
-                 turtle_color: str = 'green') -> None:
-        """Initialize the Turtle with a name, position, angle, and colors."""
+                 turtle_color: str = 'green', record_arcs: bool = False, memory_budget: int = None,
+                 boundary: str = 'raise') -> None:
+        """Initialize the Turtle with a name, position, angle, colors, how circles are recorded, how much memory lines may use
+        and what happens at the screen limits."""
         self.name = name
         self.x, self.y = x, y               #start in the canvas centre by default as (x,y) = (0,0)
         self.angle = init_angle             #start facing the north of the canvas by default as init_angle = 90
@@ -56,30 +93,59 @@ class Turtle:
         self.line_color = line_color        #default line colour: black
         self.turtle_color = turtle_color    #default turtle colour: green
         self.line_thickness = 1
-        self.lines_to_draw = []
+        self.record_arcs = record_arcs
+        self.memory_budget = memory_budget
+        if memory_budget is None:
+            self.lines_to_draw = SegmentStore()
+        else:
+            from .spill import SpillingSegmentStore     #Only imported by turtles that spill their lines to disk
+            self.lines_to_draw = SpillingSegmentStore(memory_budget)
+        self.is_recording = True
+        self._sinks = []
+        self._checkpoints = []              #Stack of the checkpoints that can be restored
+        self.set_boundary(boundary)
+        self.bounds = (min(x, -SCREEN_LIMIT_X), min(y, -SCREEN_LIMIT_Y), max(x, SCREEN_LIMIT_X), max(y, SCREEN_LIMIT_Y))
+        self._outputs = (self.lines_to_draw,)   #Everything a new line is sent to: the store and/or the sinks
 
 
     # Turtle moves
     def forward(self, distance: float) -> None:
         """Move the turtle forward by a specified distance.
         Args:
-            distance (float): The distance to move backward.        
+            distance (float): The distance to move forward.
         Raises:
             TypeError: If the distance is not a number.
+            ValueError: If the turtle would leave the screen limits and its boundary policy is 'raise'. It does not move then.
         """
         if not isinstance(distance, (int, float)):
             raise TypeError(f"Invalid type for distance: {type(distance).__name__}. Expected a number.")
         
         # Calculate new position
-        new_x = self.x + distance * math.cos(math.radians(self.angle))
-        new_y = self.y + distance * math.sin(math.radians(self.angle))
-
-        if self.is_pen_down:
-            self.lines_to_draw.append(((self.x, self.y), (new_x, new_y), self.line_color, self.line_thickness))
+        x, y = self.x, self.y
+        heading = math.radians(self.angle)
+        new_x = x + distance * math.cos(heading)
+        new_y = y + distance * math.sin(heading)
+        outputs = self._outputs
+        if self.boundary == 'raise' and len(outputs) == 1:
+            # Fast path for the default turtle, sending its lines to a single output such as its store: only the destination is checked
+            if not (-SCREEN_LIMIT_X <= new_x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= new_y <= SCREEN_LIMIT_Y):
+                self._leave_screen(None, min(x, new_x), min(y, new_y), max(x, new_x), max(y, new_y))
+            self.x, self.y = new_x, new_y
+            if self.is_pen_down:
+                outputs[0].add_segment(x, y, new_x, new_y, self.line_color, self.line_thickness)
+            return
+
+        # Under 'raise' only the destination is checked, so a turtle created outside the screen can move back onto it
+        if not (-SCREEN_LIMIT_X <= new_x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= new_y <= SCREEN_LIMIT_Y
+                and (self.boundary == 'raise' or -SCREEN_LIMIT_X <= x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= y <= SCREEN_LIMIT_Y)):
+            self.x, self.y = self._leave_screen((x, y, new_x, new_y), min(x, new_x), min(y, new_y), max(x, new_x), max(y, new_y))
+            return
+
+        # The turtle moves before the line is sent, so sinks drawing its symbol see where it ends
         self.x, self.y = new_x, new_y
-
-        if not (-SCREEN_LIMIT_X <= self.x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= self.y <= SCREEN_LIMIT_Y):
-            raise ValueError(f"Turtle {self.name} has moved outside the screen limits ({-SCREEN_LIMIT_X}, {-SCREEN_LIMIT_Y}, {SCREEN_LIMIT_X}, {SCREEN_LIMIT_Y}).")
+        if self.is_pen_down:
+            for output in outputs:
+                output.add_segment(x, y, new_x, new_y, self.line_color, self.line_thickness)
 
 
     def backward(self, distance: float) -> None:
@@ -123,40 +189,278 @@ class Turtle:
         self.angle %= 360
 
     
-    def circle(self, radius: float, extent: float = 360) -> None:
+    def circle(self, radius: float, extent: float = 360, tolerance: float = None) -> None:
         """Draw a circle with a given radius and extent by approximating it with line segments.
         Args:
             radius (float): The radius of the circle.
             extent (float): The extent of the circle in degrees. Default is 360 for a full circle.
+            tolerance (float): The largest distance allowed between the line segments and the circle.
+                Default is None, which uses one line segment per 10 units of circumference.
         Raises:
-            TypeError: If the radius is not a number.
+            TypeError: If the radius, the extent or the tolerance is not a number.
+            ValueError: If the tolerance is not positive, or the circle leaves the screen limits and the boundary policy is 'raise'.
         Note:
             The formula used steps = int(2 * math.pi * radius / 10) is an approach to approximate circles using line segments.
             Reducing the value, e.g., from 10 to 5, increases smoothness as more lines are added to the circle. But it requires more rendering/processing time.
             Increasing the value, e.g., from 10 to 20, decreases smoothness as less lines are added to the circle. But it requires less rendering/processing time.
+            Passing a tolerance picks the number of steps from the accuracy needed instead.
             For more information read: https://www.mathopenref.com/coordcirclealgorithm.html
+            All the vertices are computed at once, with the same result as moving forward and turning right once per step,
+            and the circle is checked against the screen limits before anything is drawn. A circle leaving them is handled
+            by the boundary policy of the turtle.
+            When record_arcs is True, the exact arc that these steps approximate is recorded instead, and it is only turned
+            into lines when rendered, as finely as the output resolution requires. The arc goes through every vertex of
+            the step path, so the turtle ends at the same position and heading either way.
         """
         if not isinstance(radius, (int, float)):
             raise TypeError(f"Invalid type for radius: {type(radius).__name__}. Expected a number.")
-       
+        if not isinstance(extent, (int, float)):
+            raise TypeError(f"Invalid type for extent: {type(extent).__name__}. Expected a number.")
+        if tolerance is not None:
+            if not isinstance(tolerance, (int, float)):
+                raise TypeError(f"Invalid type for tolerance: {type(tolerance).__name__}. Expected a number.")
+            if tolerance <= 0:
+                raise ValueError("Tolerance must be positive.")
+        if radius <= 0:
+            return
+
         # Number of steps depends on the circle's size for smoothness
-        steps = int(2 * math.pi * radius / 10)
+        steps = circle_steps(radius, extent, tolerance)
         step_length = 2 * math.pi * radius / steps
         step_angle = extent / steps
-        for _ in range(steps):
-            self.forward(step_length)
-            self.right(step_angle)
+        half_turn = math.sin(math.radians(step_angle) / 2)
+        if self.record_arcs and abs(half_turn) > 1e-9:
+            # The vertices of the step path lie on a circle whose chords are step_length long: the arc follows it
+            self._arc(step_length / (2 * abs(half_turn)), extent, steps)
+            return
+
+        coords = polygon_walk(self.x, self.y, self.angle, step_length, step_angle, steps)
+
+        xs, ys = coords[0::2], coords[1::2]
+        xmin, ymin, xmax, ymax = min(xs), min(ys), max(xs), max(ys)
+        end_angle = (self.angle - step_angle * steps) % 360
+        if -SCREEN_LIMIT_X <= xmin and xmax <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= ymin and ymax <= SCREEN_LIMIT_Y:
+            self.x, self.y, self.angle = float(coords[-2]), float(coords[-1]), end_angle
+            if self.is_pen_down:
+                self._emit_polyline(coords)
+        else:
+            self.x, self.y = self._leave_screen(coords, xmin, ymin, xmax, ymax, end_angle)
+
+
+    def _arc(self, radius: float, extent: float, steps: int) -> None:
+        """Move along the exact arc through the vertices of a step path, turning right, and record it if the pen is down.
+        The first step of the path leaves along the heading of the turtle, a chord of the arc, so the arc starts half a
+        step's turn to the left of it.
+        Args:
+            radius (float): The radius of the circle through the vertices of the step path.
+            extent (float): The angle in degrees to turn to the right along the arc.
+            steps (int): The number of line segments the arc reads as in the drawing data.
+        Raises:
+            ValueError: If the arc leaves the screen limits and the boundary policy is 'raise'.
+        """
+        # Turning right, the centre is on the turtle's right (left when the extent is negative)
+        side = 1 if extent > 0 else -1
+        heading = self.angle + extent / steps / 2
+        to_centre = math.radians(heading - 90 * side)
+        cx, cy = self.x + radius * math.cos(to_centre), self.y + radius * math.sin(to_centre)
+        start_angle = heading + 90 * side
+
+        xmin, ymin, xmax, ymax = arc_bounds(cx, cy, radius, start_angle, -extent)
+        if not (-SCREEN_LIMIT_X <= xmin and xmax <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= ymin and ymax <= SCREEN_LIMIT_Y):
+            if self.boundary != 'unbounded':
+                # Clipped or wrapped arcs are recorded as their line segments
+                self.x, self.y = self._leave_screen(arc_points(cx, cy, radius, start_angle, -extent, steps), xmin, ymin, xmax, ymax,
+                                                    (self.angle - extent) % 360)
+                return
+            self._extend_bounds(xmin, ymin, xmax, ymax)
+
+        end_angle = math.radians(start_angle - extent)
+        self.x, self.y = cx + radius * math.cos(end_angle), cy + radius * math.sin(end_angle)
+        self.angle = (self.angle - extent) % 360
+        if self.is_pen_down:
+            for output in self._outputs:
+                add_arc = getattr(output, 'add_arc', None)
+                if add_arc is not None:
+                    add_arc(cx, cy, radius, start_angle, -extent, steps, self.line_color, self.line_thickness)
+                else:
+                    output.add_polyline(arc_points(cx, cy, radius, start_angle, -extent, steps), self.line_color, self.line_thickness)
+
+
+    def walk(self, turns, distances, pens=None):
+        """Turn left then move forward once per command, computing the whole path at once.
+        Equivalent to calling left(turns[i]) then forward(distances[i]) for every i, but the headings and positions
+        are cumulative sums computed in a handful of NumPy operations, and the screen limits are checked once over
+        the whole path before anything is drawn.
+        Args:
+            turns: Sequence or array of angles in degrees turned to the left before each move (negative to turn right).
+            distances: Sequence or array of distances moved forward, one per command.
+            pens: Optional sequence or array of booleans, one per command, telling whether that move draws a line.
+                Default is None, which draws every move if the pen is down. The pen state itself is not changed.
+        Returns:
+            tuple: The x and y coordinates of the len(distances) + 1 positions visited, starting with the current one,
+                as NumPy arrays (lists when NumPy is not installed).
+        Raises:
+            TypeError: If the turns, distances or pens are not numbers.
+            ValueError: If they do not have the same length, or the path leaves the screen limits and the boundary
+                policy is 'raise'.
+        Note:
+            The positions match those reached by separate calls within floating point error. With the 'wrap' policy
+            they are not wrapped, but the lines drawn and the final position of the turtle are.
+        """
+        np = get_numpy()
+        try:
+            if np is not None:
+                turns, distances = np.asarray(turns, dtype=float), np.asarray(distances, dtype=float)
+                if pens is not None:
+                    pens = np.asarray(pens, dtype=bool)
+            elif not all(isinstance(value, (int, float)) for value in (*turns, *distances)):
+                raise TypeError
+        except (TypeError, ValueError):
+            raise TypeError("Turns and distances must be sequences of numbers.") from None
+        if len(turns) != len(distances) or (pens is not None and len(pens) != len(distances)):
+            raise ValueError("Turns, distances and pens must have the same length.")
+
+        xs, ys, angle = walk_path(self.x, self.y, self.angle, turns, distances)
+        if np is not None:
+            xmin, xmax, ymin, ymax = xs.min(), xs.max(), ys.min(), ys.max()
+        else:
+            xmin, xmax, ymin, ymax = min(xs), max(xs), min(ys), max(ys)
+        emit = self._emit_polyline
+        if not (-SCREEN_LIMIT_X <= xmin and xmax <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= ymin and ymax <= SCREEN_LIMIT_Y):
+            if self.boundary == 'raise':
+                self._leave_screen(None, xmin, ymin, xmax, ymax)
+            elif self.boundary == 'unbounded':
+                self._extend_bounds(xmin, ymin, xmax, ymax)
+            else:
+                emit = self._emit_on_screen
+
+        # Every stretch of consecutive moves drawn with the pen down is one polyline
+        if pens is None:
+            stretches = [(0, len(distances))] if self.is_pen_down and len(distances) else []
+        elif np is not None:
+            edges = np.flatnonzero(np.diff(np.concatenate(([False], pens, [False])).astype(np.int8)))
+            stretches = zip(edges[0::2].tolist(), edges[1::2].tolist())
+        else:
+            stretches, start = [], None
+            for i, drawn in enumerate((*pens, False)):
+                if drawn and start is None:
+                    start = i
+                elif not drawn and start is not None:
+                    stretches.append((start, i))
+                    start = None
+
+        self.x, self.y, self.angle = float(xs[-1]), float(ys[-1]), angle
+        if self.boundary == 'wrap':
+            self.x, self.y = wrap_point(self.x, self.y, -SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)
+
+        for start, end in stretches:
+            if np is not None:
+                coords = np.column_stack((xs[start:end + 1], ys[start:end + 1])).ravel()
+            else:
+                coords = [value for point in zip(xs[start:end + 1], ys[start:end + 1]) for value in point]
+            emit(coords)
+        return xs, ys
+
+
+    def _emit_polyline(self, coords) -> None:
+        """Send a polyline to the store and/or the sinks with the current line style.
+        Args:
+            coords: Flat sequence of floats holding x, y for every vertex.
+        """
+        for output in self._outputs:
+            output.add_polyline(coords, self.line_color, self.line_thickness)
+
+
+    def _emit_on_screen(self, coords) -> None:
+        """Send the parts of a polyline on the screen to the store and/or the sinks, clipped or wrapped around
+        by the boundary policy of the turtle.
+        Args:
+            coords: Flat sequence of floats holding x, y for every vertex.
+        """
+        split = clip_polyline if self.boundary == 'clip' else wrap_polyline
+        for part in split(coords, -SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y):
+            self._emit_polyline(part)
+
+
+    def _extend_bounds(self, xmin: float, ymin: float, xmax: float, ymax: float) -> None:
+        """Grow the bounds of the turtle to hold a box it has moved through."""
+        bounds = self.bounds
+        self.bounds = (float(min(bounds[0], xmin)), float(min(bounds[1], ymin)), float(max(bounds[2], xmax)), float(max(bounds[3], ymax)))
+
+
+    def _leave_screen(self, coords, xmin: float, ymin: float, xmax: float, ymax: float, angle: float = None) -> tuple[float, float]:
+        """Apply the boundary policy to a move that leaves the screen limits, drawing it if the pen is down.
+        The turtle is moved before the move is drawn, as for moves within the screen limits.
+        Args:
+            coords: Flat sequence of floats holding x, y for every vertex of the move, starting at the current position.
+            xmin, ymin, xmax, ymax (float): The bounding box of the move.
+            angle (float): The heading the turtle ends with, or None when the move does not turn it.
+        Returns:
+            tuple[float, float]: The position the turtle ends at.
+        Raises:
+            ValueError: If the boundary policy is 'raise'. Nothing is drawn then.
+        """
+        if self.boundary == 'raise':
+            raise ValueError(f"Turtle {self.name} would move outside the screen limits ({-SCREEN_LIMIT_X}, {-SCREEN_LIMIT_Y}, {SCREEN_LIMIT_X}, {SCREEN_LIMIT_Y}).")
+        self.x, self.y = float(coords[-2]), float(coords[-1])
+        if self.boundary == 'wrap':
+            self.x, self.y = wrap_point(self.x, self.y, -SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)
+        if angle is not None:
+            self.angle = angle
+
+        if self.boundary == 'unbounded':
+            self._extend_bounds(xmin, ymin, xmax, ymax)
+            if self.is_pen_down:
+                self._emit_polyline(coords)
+        elif self.is_pen_down:
+            self._emit_on_screen(coords)
+        return self.x, self.y
 
 
     #Turtle controls
     def pen_up(self) -> None:
         """Lift the pen up. No line will be drawn when the turtle moves."""
-        self.is_pen_down = False    #Stops appending lines to self.lines_to_draw list
+        self.is_pen_down = False    #Stops appending lines to self.lines_to_draw
 
 
     def pen_down(self) -> None:
         """Put the pen down. The turtle will draw lines when it moves."""
-        self.is_pen_down = True     #Enables appending lines to self.lines_to_draw list
+        self.is_pen_down = True     #Enables appending lines to self.lines_to_draw
+
+
+    def attach_sink(self, sink, record: bool = True) -> None:
+        """Send every line drawn from now on to a sink, e.g. a streaming file exporter.
+        Args:
+            sink: An object with add_segment(x0, y0, x1, y1, color, thickness) and add_polyline(coords, color, thickness)
+                methods, coords being a flat sequence of x, y floats. Sinks that also have an add_arc method with the
+                signature of SegmentStore.add_arc receive exact arcs as such, others receive them as polylines.
+            record (bool): Whether lines are still recorded in lines_to_draw. Turning this off keeps memory
+                usage constant however many lines are drawn.
+        Raises:
+            TypeError: If the sink has no add_segment or add_polyline method.
+        """
+        if not (callable(getattr(sink, 'add_segment', None)) and callable(getattr(sink, 'add_polyline', None))):
+            raise TypeError(f"Invalid sink: {type(sink).__name__}. Expected an object with add_segment and add_polyline methods.")
+
+        self._sinks.append(sink)
+        self.is_recording = record
+        self._update_outputs()
+
+
+    def detach_sink(self, sink) -> None:
+        """Stop sending lines to a sink. Lines are recorded in lines_to_draw again once no sinks are left.
+        Args:
+            sink: A sink previously attached with attach_sink.
+        """
+        self._sinks.remove(sink)
+        if not self._sinks:
+            self.is_recording = True
+        self._update_outputs()
+
+
+    def _update_outputs(self) -> None:
+        """Rebuild the tuple of objects every new line is sent to."""
+        self._outputs = ((self.lines_to_draw,) if self.is_recording else ()) + tuple(self._sinks)
 
 
     def set_initial_angle(self, angle: float) -> None:
@@ -179,21 +483,27 @@ class Turtle:
             y (float): The y-coordinate to move to.
         Raises:
             TypeError: If the coordinates are not numbers.
-            ValueError: If the coordinates are outside the screen limits.
+            ValueError: If the coordinates are outside the screen limits and the boundary policy is 'raise'.
         """
         if x is None or y is None:
             x, y = 0, 0  # Default position (0, 0)
         if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
             raise TypeError(f"Invalid coordinate types: x is {type(x).__name__}, y is {type(y).__name__}. Expected numbers.")        
-        if not (-SCREEN_LIMIT_X <= x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= y <= SCREEN_LIMIT_Y):
-            raise ValueError(f"Coordinates ({x}, {y}) are outside the screen limits ({-SCREEN_LIMIT_X}, {-SCREEN_LIMIT_Y}, {SCREEN_LIMIT_X}, {SCREEN_LIMIT_Y}).")
+        # Under 'raise' only the destination is checked, as for forward
+        if not (-SCREEN_LIMIT_X <= x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= y <= SCREEN_LIMIT_Y
+                and (self.boundary == 'raise' or -SCREEN_LIMIT_X <= self.x <= SCREEN_LIMIT_X and -SCREEN_LIMIT_Y <= self.y <= SCREEN_LIMIT_Y)):
+            if self.boundary == 'raise':
+                raise ValueError(f"Coordinates ({x}, {y}) are outside the screen limits ({-SCREEN_LIMIT_X}, {-SCREEN_LIMIT_Y}, {SCREEN_LIMIT_X}, {SCREEN_LIMIT_Y}).")
+            self.x, self.y = self._leave_screen((self.x, self.y, x, y), min(self.x, x), min(self.y, y), max(self.x, x), max(self.y, y))
+            return
         
+        # Update the turtle's position before drawing, as for forward
+        x0, y0 = self.x, self.y
+        self.x, self.y = x, y
         if self.is_pen_down:
             # Draw a line to the new position if the pen is down
-            self.lines_to_draw.append(((self.x, self.y), (x, y), self.line_color, self.line_thickness))
-        
-        # Update the turtle's position
-        self.x, self.y = x, y
+            for output in self._outputs:
+                output.add_segment(x0, y0, x, y, self.line_color, self.line_thickness)
 
 
     def reset(self) -> None:
@@ -206,7 +516,63 @@ class Turtle:
         self.turtle_color = 'green'
         self.line_thickness = 1
         self.lines_to_draw.clear()
-    
+        self._checkpoints.clear()
+        self.bounds = (-SCREEN_LIMIT_X, -SCREEN_LIMIT_Y, SCREEN_LIMIT_X, SCREEN_LIMIT_Y)
+
+
+    # Checkpoints
+    def checkpoint(self) -> Checkpoint:
+        """Save the state of the turtle and the current end of its lines, to go back to them later.
+        Checkpoints are kept on a stack, so they can be nested, e.g. to try variations of a pattern and backtrack.
+        Taking one copies no line, so it costs the same however much the turtle has drawn.
+        Returns:
+            Checkpoint: The checkpoint, which can be passed to restore.
+        """
+        checkpoint = Checkpoint(self.x, self.y, self.angle, self.is_pen_down, self.line_color, self.turtle_color,
+                                self.line_thickness, self.lines_to_draw.mark())
+        self._checkpoints.append(checkpoint)
+        return checkpoint
+
+
+    def restore(self, checkpoint: Checkpoint = None, lines: bool = True) -> None:
+        """Go back to a checkpoint, which stays on the stack so it can be restored again. Newer checkpoints are dropped.
+        Args:
+            checkpoint (Checkpoint): The checkpoint to go back to. Defaults to the newest one.
+            lines (bool): Whether to remove the lines drawn since the checkpoint. The lines are cut off the end of the
+                segment store, so this only costs the lines removed. With False, only the state of the turtle is
+                restored, as with the ] symbol of L-systems.
+        Raises:
+            ValueError: If the checkpoint is not on the stack, e.g. after reset, or there is no checkpoint.
+        Note:
+            Lines sent to sinks cannot be taken back, only the lines recorded by the turtle.
+        """
+        if not self._checkpoints:
+            raise ValueError(f"Turtle {self.name} has no checkpoint to restore.")
+        if checkpoint is None:
+            checkpoint = self._checkpoints[-1]
+        index = next((i for i in range(len(self._checkpoints) - 1, -1, -1) if self._checkpoints[i] is checkpoint), None)
+        if index is None:
+            raise ValueError(f"Invalid checkpoint: it is not one of the checkpoints of turtle {self.name}.")
+        del self._checkpoints[index + 1:]
+
+        (self.x, self.y, self.angle, self.is_pen_down, self.line_color, self.turtle_color, self.line_thickness,
+         mark) = checkpoint
+        if lines:
+            self.lines_to_draw.truncate(mark)
+
+
+    def undo(self, lines: bool = True) -> Checkpoint:
+        """Go back to the newest checkpoint and remove it from the stack, e.g. to pop the state pushed by checkpoint.
+        Args:
+            lines (bool): Whether to remove the lines drawn since the checkpoint.
+        Returns:
+            Checkpoint: The checkpoint removed.
+        Raises:
+            ValueError: If there is no checkpoint.
+        """
+        self.restore(lines=lines)
+        return self._checkpoints.pop()
+
 
     def get_position(self) -> tuple[float, float]:
         """Get the current position of the turtle.
@@ -216,14 +582,53 @@ class Turtle:
         return self.x, self.y
     
 
-    def get_drawing_data(self) -> list[tuple[tuple[float, float], tuple[float, float], str, float]]:
+    def get_drawing_data(self) -> SegmentStore:
         """Get the data for lines drawn by the turtle.
         Returns:
-            list[tuple[tuple[float, float], tuple[float, float], str, float]]: 
-                A list of tuples representing the lines drawn. Each tuple contains start and end coordinates, line color, and line thickness.
+            SegmentStore: 
+                A sequence of tuples representing the lines drawn. Each tuple contains start and end coordinates, line color, and line thickness.
+                The tuples are built lazily from the underlying arrays when accessed.
         """
         return self.lines_to_draw
-    
+
+
+    def get_drawing_arrays(self) -> DrawingArrays:
+        """Get the raw arrays for lines drawn by the turtle, for bulk consumers such as renderers.
+        Returns:
+            DrawingArrays: The lines as polylines ("runs" of connected lines of the same style): a flat array of x, y
+                coordinates per vertex, the index of the first vertex of every run, the style index of every run,
+                and the (color, thickness) style table the indices refer to. The arrays are not copied.
+        """
+        return self.lines_to_draw.arrays()
+
+
+    def save_drawing_data(self, target) -> int:
+        """Save the lines drawn by the turtle, and its state, to a binary drawing file.
+        Args:
+            target: A file path, or a binary file opened for writing that supports seek.
+        Returns:
+            int: The size of the file in bytes.
+        """
+        from .storage import save_drawing
+        return save_drawing(target, self)
+
+
+    def load_drawing_data(self, source, index: int = 0, mmap: bool = False) -> None:
+        """Replace the lines drawn by the turtle with the lines saved in a binary drawing file.
+        The position, angle and pen of the turtle are left as they are.
+        Args:
+            source: The path of the file.
+            index (int): The position of the drawing in the file, for files saved with several turtles.
+            mmap (bool): Whether to map the file into memory and use its lines in place, without copying them
+                until the turtle draws more lines or removes some.
+        Raises:
+            ValueError: If the file is not a drawing file, or was written by a newer version.
+        """
+        from .storage import load_stores
+        self.lines_to_draw = load_stores(source, mmap)[index]
+        self._checkpoints.clear()       #Their markers refer to the previous store
+        self._update_outputs()
+
 
     # Turtle properties   
     def set_pen_color(self, color: str) -> None:
@@ -262,4 +667,21 @@ class Turtle:
         if not isinstance(thickness, (int, float)):
             raise TypeError("Line thickness must be a number.")
         
-        self.line_thickness = thickness
\ No newline at end of file
+        self.line_thickness = thickness
+
+
+    def set_boundary(self, policy: str) -> None:
+        """Set what the turtle does when it would move outside the screen limits.
+        Args:
+            policy (str): 'raise' to raise a ValueError before moving, 'clip' to draw only the parts of lines on the screen,
+                'wrap' to carry on from the opposite side of the screen, or 'unbounded' to draw everywhere and widen the plot.
+        Raises:
+            TypeError: If the policy is not a string.
+            ValueError: If the policy is not one of BOUNDARY_POLICIES.
+        """
+        if not isinstance(policy, str):
+            raise TypeError(f"Invalid boundary policy type: {type(policy).__name__}. Expected a string.")
+        if policy not in BOUNDARY_POLICIES:
+            raise ValueError(f"Invalid boundary policy: {policy}. Expected one of {', '.join(BOUNDARY_POLICIES)}.")
+
+        self.boundary = policy
\ No newline at end of file